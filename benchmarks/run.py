@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+# Benchmarks of the engine hot paths
+
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import timeit
+
+from simplehs import *
+from simplehs.agents import NaiveAgent
+from simplehs.utils import Random
+
+BENCHMARKS = []
+
+def benchmark(number):
+    """A decorator which indicates a benchmark, done number times a run.
+
+    The benchmark function takes the number and sets up the state of a
+    run, then returns the function to time, which does the whole run.
+    """
+    def decorator(func):
+        func.number = number
+        BENCHMARKS.append(func)
+        return func
+    return decorator
+
+
+def make_agents(num_cards=30):
+    return (
+        NaiveAgent('Alice', hero='Mage', deck=['BloodfenRaptor', 'Fireball', 'ArcaneMissiles'] * (num_cards // 3)),
+        NaiveAgent('Bob', hero='Innkeeper', deck=['RiverCrocolisk', 'ManaTideTotem'] * (num_cards // 2)),
+    )
+
+def make_debug_game(num_cards=0):
+    agents = (Dict(name='Alice', hero='Mage', deck=['Wisp'] * num_cards),
+              Dict(name='Bob', hero='Innkeeper', deck=['Wisp'] * num_cards))
+    return Game(agents, debug=True, log=False)
+
+def summon(player, card_class):
+    player.acquire(card_class)
+    player.hand[-1].play()
+    return player.battlefield[-1]
+
+
+@benchmark(200)
+def game_init(number):
+    """Game.__init__ with 30-card decks"""
+    agents_list = [make_agents() for num in range(number)]
+    def run():
+        for num, agents in enumerate(agents_list):
+            Game(agents, rng=Random(num), log=False)
+    return run
+
+
+@benchmark(10000)
+def draw(number):
+    """Player.draw"""
+    game = make_debug_game(number)
+    player = game.players[0]
+    def run():
+        for num in range(number):
+            player.draw()
+            player.hand.pop()
+    return run
+
+
+@benchmark(5000)
+def minion_play(number):
+    """MinionCard.play"""
+    from simplehs.cards import BloodfenRaptor
+    game = make_debug_game()
+    player = game.players[0]
+    cards = [player._create(BloodfenRaptor) for num in range(number)]
+    def run():
+        for card in cards:
+            player.hand.append(card)
+            card.play()
+            player.battlefield.pop()
+    return run
+
+
+@benchmark(5000)
+def spell_play_split(number):
+    """SpellCard.play with deal_damage(split=True)"""
+    from simplehs.cards import ArcaneMissiles
+    game = make_debug_game()
+    game.rng = Random(0)
+    player = game.players[0]
+    hero = player.opponent.hero
+    cards = [player._create(ArcaneMissiles) for num in range(number)]
+    def run():
+        for card in cards:
+            player.hand.append(card)
+            card.play()
+            hero.health = 30
+    return run
+
+
+@benchmark(10000)
+def attack_taunt(number):
+    """Character.attack_ against taunt"""
+    from simplehs.cards import BloodfenRaptor
+    from simplehs.cards import GoldshireFootman
+    game = make_debug_game()
+    alice, bob = game.players
+    for card_class in (BloodfenRaptor, GoldshireFootman, BloodfenRaptor):
+        summon(bob, card_class)
+    defender = bob.battlefield[1]
+    attacker = summon(alice, BloodfenRaptor)
+    attacker.reset()
+    def run():
+        for num in range(number):
+            attacker.attack_(defender)
+            attacker.attack_count = 0
+            attacker.health = defender.health = 100
+    return run
+
+
+@benchmark(2000)
+def trigger_turn(number):
+    """Game.trigger at turn end and start, with 7 triggers on each side"""
+    from simplehs.cards import ManaTideTotem
+    game = make_debug_game(number * 7)
+    for player in game.players:
+        for num in range(7):
+            summon(player, ManaTideTotem)
+    hand = game.who.hand
+    def run():
+        for num in range(number):
+            game.trigger('at turn_end')
+            game.trigger('at turn_start')
+            hand.clear()
+    return run
+
+
+@benchmark(50)
+def game_run(number):
+    """Game.run with NaiveAgent"""
+    games = [Game(make_agents(), rng=Random(num), log=False) for num in range(number)]
+    def run():
+        for game in games:
+            game.run()
+    return run
+
+
+@benchmark(5)
+def import_cards(number):
+    """import simplehs.cards and load all card classes (in a new process)"""
+    code = 'import simplehs.cards as cards; [getattr(cards, name) for name in cards.__all__]'
+    def run():
+        for num in range(number):
+            subprocess.check_call([sys.executable, '-c', code])
+    return run
+
+
+def run_benchmarks(benchmarks, repeat=5):
+    """Run benchmarks; return the best and mean times of a call, by name."""
+    results = {}
+    for func in benchmarks:
+        times = []
+        for run_num in range(repeat):
+            times.append(timeit.Timer(func(func.number)).timeit(1) / func.number)
+        results[func.__name__] = {
+            'description': func.__doc__,
+            'number': func.number,
+            'repeat': repeat,
+            'best': min(times),
+            'mean': sum(times) / repeat,
+        }
+    return results
+
+
+def _commit():
+    try:
+        return subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD'],
+                                       stderr=subprocess.DEVNULL).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main(args=sys.argv[1:]):
+    parser = argparse.ArgumentParser(
+        prog='python3 -m benchmarks.run',
+        description='Benchmark the engine hot paths.',
+    )
+    parser.add_argument('names', nargs='*', metavar='NAME',
+                        help='benchmarks to run (default: all)')
+    parser.add_argument('-r', '--repeat', type=int, default=5,
+                        help='runs of each benchmark (default: 5)')
+    parser.add_argument('-o', '--output', metavar='PATH',
+                        help='write the results as JSON')
+    parser.add_argument('-c', '--compare', metavar='PATH',
+                        help='compare with the JSON results of another commit')
+    options = parser.parse_args(args)
+    names = [func.__name__ for func in BENCHMARKS]
+    for name in options.names:
+        if name not in names:
+            parser.error('unknown benchmark: {name} (choose from {names})'.format(
+                name=name, names=', '.join(names)))
+    benchmarks = [func for func in BENCHMARKS
+                  if not options.names or func.__name__ in options.names]
+    report = {
+        'commit': _commit(),
+        'python': platform.python_version(),
+        'benchmarks': run_benchmarks(benchmarks, options.repeat),
+    }
+    base = {}
+    if options.compare:
+        with open(options.compare) as base_file:
+            base = json.load(base_file)['benchmarks']
+    for name, result in report['benchmarks'].items():
+        line = '{name:<18} {best:>12.2f} us'.format(name=name, best=result['best'] * 1e6)
+        if name in base:
+            line += ' {ratio:>8.2f}x'.format(ratio=base[name]['best'] / result['best'])
+        print(line)
+    if options.output:
+        with open(options.output, 'w') as output_file:
+            json.dump(report, output_file, indent=2)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
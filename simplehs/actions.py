@@ -34,6 +34,8 @@ def signature(**kwargs):
         if not action.signature:
             action.signature = Dict()
         action.signature.update(kwargs)
+        # Compiled resolvers of the signature, by context (see base._expand)
+        action.resolvers = {}
         return action
     return wrapper
 
@@ -56,6 +58,8 @@ def deal_damage(amount, target=None, split=False):
                 character.take_damage(damage)
         else:
             for missile_num in range(damage):
+                if not target:
+                    break
                 character = game.rng.choice(target)
                 character.take_damage(1)
                 if character.health <= 0:
@@ -75,6 +79,7 @@ def draw_card(num_cards, who='self'):
 def gain_mana(amount, permanent=False, empty=False, who='self'):
     @signature(player=who)
     def do_gain_mana(player):
+        player.game._save(player, 'mana', 'full_mana')
         if not permanent:
             player.mana += amount
         else:
@@ -95,6 +100,7 @@ def trigger(timing, filter, action):
         if not filter(game, character):
             return
         return action(**kwargs)
+    do_trigger.timing = timing
     return do_trigger
 
 
@@ -1,8 +1,17 @@
 #!/usr/bin/env python3
 # Hearthstone Agent
 
+import copy
+import math
+import multiprocessing
+import time
+
 from ..base import Agent
+from ..base import Game
+from ..base import GameOver
+from ..base import SpellCard
 from ..utils import Dict
+from ..utils import Random
 
 
 class DummyAgent(Agent):
@@ -21,19 +30,260 @@ class NaiveAgent(Agent):
             return action
         for card in self.player.hand:
             if card.can_play():
-                action = Dict(name='play', card=card, position=0)
-                if 'battlecry' in card.abilities:
-                    battlecry = card.abilities.battlecry
-                    if getattr(battlecry, 'need_target', False):
-                        action.target = self.player.opponent.hero
+                if isinstance(card, SpellCard):
+                    action = Dict(name='play', card=card)
+                    effect = card.effect
+                else:
+                    action = Dict(name='play', card=card, position=0)
+                    effect = card.abilities.get('battlecry')
+                if effect is not None and effect.needs_target:
+                    action.target = self.player.opponent.hero
                 return action
         for minion in self.player.battlefield:
             if minion.can_attack():
-                if len(self.player.opponent.battlefield) > 0:
-                    target = self.player.opponent.battlefield[0]
+                enemies = self.player.opponent.battlefield
+                taunts = [enemy for enemy in enemies if enemy.taunt]
+                visibles = [enemy for enemy in enemies if not enemy.stealth]
+                if taunts:
+                    target = taunts[0]
+                elif visibles:
+                    target = visibles[0]
                 else:
                     target = self.player.opponent.hero
-                action = Dict(name='attack', subject=minion, object=target)
+                action = Dict(name='attack', source=minion, target=target)
                 return action
         action = Dict(name='end')
         return action
+
+
+class BatchedPolicyAgent(Agent):
+    """A policy agent whose decisions are batched across games.
+
+    It plays the action leading to the best board, as scored by a
+    coordinator (see policy.Coordinator) shared by the agents of many games
+    on one event loop, so it must be played by Game.run_async.  Agents
+    without a coordinator share a default one.  NumPy is required.
+    """
+
+    _coordinator = None
+
+    def __init__(self, name, hero=None, deck=None, player=None, coordinator=None):
+        super().__init__(name, hero, deck, player)
+        from ..policy import Coordinator
+        if coordinator is None:
+            if BatchedPolicyAgent._coordinator is None:
+                BatchedPolicyAgent._coordinator = Coordinator()
+            coordinator = BatchedPolicyAgent._coordinator
+        self.coordinator = coordinator
+
+    async def decide(self):
+        from ..policy import afterstate
+        actions = self.player.legal_actions()
+        if len(actions) == 1:
+            return actions[0]
+        if not actions:
+            return Dict(name='end')
+        game = self.player.game
+        # Ending the turn is scored on the board as it is
+        games = [game if action.name == 'end' else afterstate(game, action)
+                 for action in actions]
+        num = await self.coordinator.choose(games, game.players.index(self.player))
+        return actions[num]
+
+
+class MCTSAgent(Agent):
+    """A Monte Carlo tree search agent.
+
+    Each iteration determinizes the hidden information (the opponent's hand
+    and deck, and the order of our own deck) on a fork of the game, walks
+    down the tree by UCT, expands one action and plays the game out with
+    rollout agents.  The search stops after the given number of iterations
+    or when the time limit (in seconds) is reached, whichever comes first;
+    if no iteration is done in time, it ends the turn.  With several
+    processes, each one searches its own tree (root parallelization) and
+    their root statistics are merged; the game is sent to them serialized
+    (see serialize), so any start method of multiprocessing works.  If the
+    game cannot be serialized or the processes cannot be started, the
+    search runs in this process.
+    """
+
+    def __init__(self, name, hero=None, deck=None, player=None,
+                 iterations=1000, time_limit=None, exploration=1.4,
+                 rollouts=1, rollout_agent=NaiveAgent, processes=1, seed=None):
+        super().__init__(name, hero, deck, player)
+        if iterations is None and time_limit is None:
+            raise ValueError('a search needs a number of iterations or a time limit')
+        self.iterations = iterations
+        self.time_limit = time_limit
+        self.exploration = exploration
+        self.rollouts = rollouts
+        self.rollout_agent = rollout_agent
+        self.processes = processes
+        self.rng = Random(seed)
+
+    def decide(self):
+        actions = self.player.legal_actions()
+        if len(actions) == 1:
+            return actions[0]
+        if not actions:
+            return Dict(name='end')
+        deadline = None
+        if self.time_limit is not None:
+            deadline = time.monotonic() + self.time_limit
+        if self.processes > 1:
+            stats = self._search_parallel(deadline)
+        else:
+            stats = self._search(self.iterations, deadline, self.rng)
+        if not stats:
+            return next((action for action in actions if action.name == 'end'), actions[0])
+        best = max(stats, key=lambda key: stats[key][0])
+        for action in actions:
+            if _action_key(action) == best:
+                return action
+
+    def _search(self, iterations, deadline, rng):
+        root = _Node(None)
+        iteration = 0
+        while iterations is None or iteration < iterations:
+            if deadline is not None and time.monotonic() >= deadline:
+                break
+            self._iterate(root, self._determinize(rng), rng)
+            iteration += 1
+        return {key: (child.visits, child.reward) for key, child in root.children.items()}
+
+    def _search_parallel(self, deadline):
+        from ..serialize import dumps
+        game = self.player.game
+        try:
+            data = dumps(game)
+        except ValueError:
+            return self._search(self.iterations, deadline, self.rng)
+        # A copy of this agent, without its player, searches in each worker
+        agent = copy.copy(self)
+        agent.player = None
+        iterations = self.iterations
+        if iterations is not None:
+            iterations = -(-iterations // self.processes)
+        tasks = [(iterations, deadline, self.rng.split())
+                 for process in range(self.processes)]
+        try:
+            pool = multiprocessing.Pool(self.processes, _init_worker,
+                                        (agent, data, game.players.index(self.player)))
+        except (OSError, ImportError, NotImplementedError):
+            return self._search(self.iterations, deadline, self.rng)
+        with pool:
+            results = pool.map(_search_worker, tasks)
+        stats = {}
+        for result in results:
+            for key, (visits, reward) in result.items():
+                total_visits, total_reward = stats.get(key, (0, 0.0))
+                stats[key] = (total_visits + visits, total_reward + reward)
+        return stats
+
+    def _determinize(self, rng):
+        agents = (self.rollout_agent('Rollout0'), self.rollout_agent('Rollout1'))
+        game = self.player.game.fork(agents)
+        game.log = False
+        game.rng = rng.split()
+        player = game.players[self.player.game.players.index(self.player)]
+        opponent = player.opponent
+        hidden = list(opponent.hand) + list(opponent.deck)
+        rng.shuffle(hidden)
+        hand_size = opponent.hand.size
+        opponent.hand[:] = hidden[:hand_size]
+        opponent.deck.clear()
+        opponent.deck.extend(hidden[hand_size:])
+        cards = list(player.deck)
+        rng.shuffle(cards)
+        player.deck.clear()
+        player.deck.extend(cards)
+        return game
+
+    def _iterate(self, root, game, rng):
+        node = root
+        path = [root]
+        while game.state != Game.FINISHED:
+            who = game.players.index(game.who)
+            actions = game.who.legal_actions()
+            keys = [_action_key(action) for action in actions]
+            untried = [num for num, key in enumerate(keys) if key not in node.children]
+            if untried:
+                num = rng.choice(untried)
+                node.children[keys[num]] = _Node(who)
+            else:
+                num = max(range(len(keys)),
+                          key=lambda num: node.children[keys[num]].score(node.visits, self.exploration))
+            node = node.children[keys[num]]
+            path.append(node)
+            _apply(game, actions[num])
+            if untried:
+                break
+        for rollout in range(self.rollouts):
+            playout = game.clone() if rollout < self.rollouts - 1 else game
+            winner = _play_out(playout)
+            for node in path:
+                node.visits += 1
+                if winner is None:
+                    node.reward += 0.5
+                elif winner == node.who:
+                    node.reward += 1.0
+
+
+class _Node:
+    """A node of the search tree, reached by an action of player #who."""
+
+    def __init__(self, who):
+        self.who = who
+        self.visits = 0
+        self.reward = 0.0
+        self.children = {}
+
+    def score(self, parent_visits, exploration):
+        exploitation = self.reward / self.visits
+        return exploitation + exploration * math.sqrt(math.log(parent_visits) / self.visits)
+
+
+# The agent searching in a worker process, and the game it was sent
+_searching_agent = None
+_searched_game = None
+
+def _init_worker(agent, data, player_num):
+    global _searching_agent, _searched_game
+    _searching_agent = agent
+    _searched_game = (data, player_num)
+
+def _search_worker(args):
+    # The game is loaded by the first task, as the pool would start
+    # workers over and over if their initializer failed.
+    global _searched_game
+    if _searched_game is not None:
+        from ..serialize import loads
+        data, player_num = _searched_game
+        agents = [Agent('Player0'), Agent('Player1')]
+        agents[player_num] = _searching_agent
+        loads(data, agents)
+        _searched_game = None
+    iterations, deadline, rng = args
+    return _searching_agent._search(iterations, deadline, rng)
+
+
+def _action_key(action):
+    """Return a key of an action which is the same across forks of a game."""
+    return tuple((name, getattr(value, 'dob', value))
+                 for name, value in sorted(action.items()))
+
+
+def _apply(game, action):
+    try:
+        game.who._do_action(action)
+    except GameOver:
+        pass
+
+
+def _play_out(game):
+    """Play a game out and return the index of the winner (None for a tie)."""
+    if game.state != Game.FINISHED:
+        game.run()
+    if game.winner is None:
+        return None
+    return game.players.index(game.winner)
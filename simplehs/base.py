@@ -1,11 +1,18 @@
 #!/usr/bin/env python3
 # Base classes
 
+import asyncio
+import copy
+import functools
+import inspect
 import logging
+import time
 
+from .utils import Deque
 from .utils import Dict
+from .utils import DummyRandom
 from .utils import List
-from .utils import Random
+from .utils import TracingRandom
 from .utils import get_class
 
 
@@ -34,6 +41,45 @@ class AttackException(GameException):
     pass
 
 
+def _phase(name, of_game=False):
+    """A decorator which times a method as a phase of a game with stats.
+
+    The method is of a game object, or of the game itself if of_game is set.
+    """
+    def decorator(method):
+        if of_game:
+            def wrapper(self, *args, **kwargs):
+                stats = self.stats
+                if stats is None:
+                    return method(self, *args, **kwargs)
+                return stats.time(name, method, self, *args, **kwargs)
+        else:
+            def wrapper(self, *args, **kwargs):
+                stats = self.game.stats
+                if stats is None:
+                    return method(self, *args, **kwargs)
+                return stats.time(name, method, self, *args, **kwargs)
+        return functools.wraps(method)(wrapper)
+    return decorator
+
+def _timed(game, name, func, /, *args, **kwargs):
+    """Call a function as a phase of a game, timed if the game has stats."""
+    stats = game.stats
+    if stats is None:
+        return func(*args, **kwargs)
+    return stats.time(name, func, *args, **kwargs)
+
+def _copy_random(rng):
+    """Return an independent copy of a random generator.
+
+    Generators of this package have a cheap copy method; others, like a
+    random.Random of the standard library, are copied by the copy module.
+    """
+    if hasattr(rng, 'copy'):
+        return rng.copy()
+    return copy.copy(rng)
+
+
 class Game:
     """An instance of Hearthstone game."""
 
@@ -41,11 +87,23 @@ class Game:
     PLAYING = '<playing>'
     FINISHED = '<finished>'
 
-    def __init__(self, agents, rng=None, debug=False):
+    MAX_TURNS = 98
+
+    def __init__(self, agents, rng=None, debug=False, log=True, stats=None):
         self.debug = debug
+        # Log game events (formatted only if the logging level allows)
+        self.log = log
         self._date = 0
-        # Set up random number generator
-        self.rng = rng if rng is not None else Random()
+        # Characters with a trigger, by timing
+        self._listeners = {}
+        # Recorder of the actions (see replay.Recorder)
+        self.recorder = None
+        # Counts and times of the phases (see stats.Stats)
+        self.stats = stats
+        # Log of the changes, to unmake actions (see make)
+        self.undo_log = None
+        # Set up random number generator (see utils.Random for real games)
+        self.rng = rng if rng is not None else DummyRandom()
         # Set up the two players
         agent0, agent1 = agents
         player0 = Player(self, agent0)
@@ -83,6 +141,7 @@ class Game:
     def characters(self):
         return self.players[0].characters + self.players[1].characters
 
+    @_phase('next_turn', of_game=True)
     def next_turn(self):
         if self.turn_num is not None:
             # XXX: To implement as a triggered event
@@ -99,6 +158,7 @@ class Game:
             if not self.debug:
                 from .cards.special import TheCoin
                 self.who.opponent.acquire(TheCoin)
+        self._save(self.who, 'full_mana', 'mana')
         if self.who.full_mana < 10:
             self.who.full_mana += 1
         self.who.mana = self.who.full_mana
@@ -127,67 +187,235 @@ class Game:
     def concede(self, who):
         self.finish(who.opponent)
 
+    def clone(self):
+        """Return an independent copy of the game.
+
+        The copy shares card actions and agents' settings with the original
+        but no mutable state, so it can be played on without affecting it.
+        """
+        return self._clone({})
+
+    def fork(self, agents):
+        """Return a copy of the game played by the given agents."""
+        game = self.clone()
+        for player, agent in zip(game.players, agents):
+            agent.player = player
+            player.agent = agent
+            player.name = agent.name
+        return game
+
+    def make(self, action, player=None):
+        """Do an action of a player (the current one by default) in place.
+
+        Return a mark, with which unmake restores the game as it was before
+        the action.  Only the changes are logged, so a search can go down
+        and back up without cloning.  From the first make on, every change
+        to the game is logged until undo_log is set to None.  An invalid
+        action is unmade before its exception is raised.
+        """
+        if self.undo_log is None:
+            self.undo_log = UndoLog()
+        undo_log = self.undo_log
+        mark = len(undo_log)
+        undo_log.save(self, 'turn_num', 'who', 'state', 'winner', '_date')
+        undo_log.add(setattr, self, 'rng', _copy_random(self.rng))
+        if player is None:
+            player = self.who
+        action = action.copy()
+        method = getattr(player, action.pop('name'))
+        try:
+            method(**action)
+        except GameOver:
+            pass
+        except Exception:
+            undo_log.undo(mark)
+            raise
+        finally:
+            # Actions made in place are not recorded, nor their draws
+            if self.recorder is not None:
+                self.recorder.discard()
+        return mark
+
+    def unmake(self, mark=0):
+        """Undo the actions made since a mark (see make)."""
+        self.undo_log.undo(mark)
+
+    def encode(self, player):
+        """Return the board as a feature vector from the view of a player.
+
+        See encoding.encode for the layout; NumPy is required.
+        """
+        from .encoding import encode
+        return encode(self, player)
+
     def run(self):
-        # Replace the starting hands
-        action = self.who.agent.decide()
-        if action.name == 'replace':
-            self.who.do_action(action)
-        action = self.who.opponent.agent.decide()
-        if action.name == 'replace':
-            self.who.opponent.do_action(action)
-        # Game begins
+        """Play the game with the agents until it is over.
+
+        Return the winner, or None if the game is tied.
+        """
         try:
-            for self.turn_num in range(98):
-                if self.who.full_mana < 10:
-                    self.who.full_mana += 1
-                self.who.mana = self.who.full_mana
-                self.who._info('Turn #{turn_num} started', turn_num=self.turn_num)
-                self.trigger('turn_start', self.who)
-                self.who.draw()
-                self.check()
-                while True:
-                    # print(self)
-                    action = self.who.agent.decide()
+            # Replace the starting hands
+            if self.state == Game.REPLACING:
+                for player in (self.who, self.who.opponent):
+                    action = _timed(self, 'decide', player.agent.decide)
                     if action.name != 'replace':
-                        end_turn = self.who.do_action(action)
-                        if end_turn:
-                            break
-                # XXX: To implement as a triggered event
-                self.who.hero.reset()
-                for minion in self.who.battlefield:
-                    minion.reset()
-                self.trigger('turn_end', self.who)
-                self.who._info('Turn #{turn_num} ended', turn_num=self.turn_num)
-                self.who = self.who.opponent
-            else:
-                raise GameOver()
+                        action = Dict(name='replace')
+                    player._do_action(action)
+            # Game begins
+            while True:
+                if self.turn_num >= Game.MAX_TURNS:
+                    self.finish(None)
+                action = _timed(self, 'decide', self.who.agent.decide)
+                if action.name != 'replace':
+                    self.who._do_action(action)
         except GameOver as result:
-            print(self)
-            if result.winner is not None:
-                logging.info('{name} won.'.format(name=result.winner.name))
-            else:
-                logging.info('Game tied.')
+            self._over(result)
+        return self.winner
+
+    async def run_async(self):
+        """Play the game like run, awaiting the decisions of the agents.
+
+        The decide method of an agent may be a coroutine function, e.g. to
+        query a policy shared by many games on one event loop.
+        """
+        try:
+            if self.state == Game.REPLACING:
+                for player in (self.who, self.who.opponent):
+                    action = await self._decide_async(player.agent)
+                    if action.name != 'replace':
+                        action = Dict(name='replace')
+                    player._do_action(action)
+            while True:
+                if self.turn_num >= Game.MAX_TURNS:
+                    self.finish(None)
+                action = await self._decide_async(self.who.agent)
+                if action.name != 'replace':
+                    self.who._do_action(action)
+        except GameOver as result:
+            self._over(result)
+        return self.winner
+
+    async def _decide_async(self, agent, in_executor=False):
+        started = time.perf_counter()
+        if in_executor and not inspect.iscoroutinefunction(agent.decide):
+            # A blocking decision must not hold up the other games of the loop
+            action = await asyncio.get_running_loop().run_in_executor(None, agent.decide)
+        else:
+            action = agent.decide()
+        if inspect.isawaitable(action):
+            action = await action
+        if self.stats is not None:
+            # Waiting for the decision counts, but no other phase is nested.
+            self.stats.record('decide', time.perf_counter() - started)
+        return action
+
+    def _over(self, result):
+        if self.stats is not None:
+            self.stats.games += 1
+            self.stats.turns += self.turn_num + 1
+        if not self.log:
+            pass
+        elif result.winner is not None:
+            logging.info('%s won.', result.winner.name)
+        else:
+            logging.info('Game tied.')
 
     def _fetch_and_add_date(self):
         date = self._date
         self._date += 1
         return date
 
+    def find(self, dob):
+        """Return the card or character of a dob in the game.
+
+        Raise KeyError if there is none.
+        """
+        for player in self.players:
+            for zone in ((player.hero,), player.battlefield, player.hand, player.deck):
+                for object in zone:
+                    if object.dob == dob:
+                        return object
+        raise KeyError(dob)
+
     def create(self, class_, *args, **kwargs):
         object = class_(*args, **kwargs)
         object.game = self
         object.dob = self._fetch_and_add_date()
         return object
 
+    def _clone(self, memo):
+        game = Game.__new__(Game)
+        memo[id(self)] = game
+        game.__dict__.update(self.__dict__)
+        rng = self.rng
+        # Clones are not recorded, so their draws are not traced
+        if isinstance(rng, TracingRandom):
+            rng = rng.rng
+        game.rng = _copy_random(rng)
+        game.recorder = None
+        game.stats = None
+        game.undo_log = None
+        player0, player1 = (player._clone(memo) for player in self.players)
+        player0.opponent = player1
+        player1.opponent = player0
+        game.players = (player0, player1)
+        game.who = memo[id(self.who)]
+        game._listeners = {timing: [memo[id(character)] for character in listeners]
+                           for timing, listeners in self._listeners.items()}
+        if self.winner is not None:
+            game.winner = memo[id(self.winner)]
+        return game
+
+    @_phase('trigger', of_game=True)
     def trigger(self, timing):
-        for character in self.characters:
-            if character.trigger:
-                args = character._expand(character.trigger.signature)
-                character.trigger(timing,
-                                  filter_game=self,
-                                  filter_character=character,
-                                  **args)
-
+        listeners = self._listeners.get(timing)
+        if not listeners:
+            return
+        for character in tuple(listeners):
+            args = character._expand(character.trigger)
+            character.trigger(timing,
+                              filter_game=self,
+                              filter_character=character,
+                              **args)
+
+    def _subscribe(self, character):
+        trigger = character.trigger
+        if trigger:
+            listeners = self._listeners.get(trigger.timing)
+            if listeners is None:
+                listeners = self._listeners[trigger.timing] = []
+                self._log_undo(self._listeners.pop, trigger.timing)
+            # Listeners are kept in the order of characters, in which their
+            # triggers resolve; a character keeps its place among them.
+            index = len(listeners)
+            if listeners:
+                order = {id(other): num for num, other in enumerate(self.characters)}
+                rank = order[id(character)]
+                index = sum(1 for other in listeners if order[id(other)] < rank)
+            listeners.insert(index, character)
+            self._log_undo(listeners.pop, index)
+
+    def _unsubscribe(self, character):
+        trigger = character.trigger
+        if trigger:
+            listeners = self._listeners[trigger.timing]
+            index = listeners.index(character)
+            del listeners[index]
+            self._log_undo(listeners.insert, index, character)
+
+    def _save(self, object, *names):
+        """Log attributes of an object before they change, if logging."""
+        undo_log = self.undo_log
+        if undo_log is not None:
+            undo_log.save(object, *names)
+
+    def _log_undo(self, func, *args):
+        """Log a call which undoes a change, if logging."""
+        undo_log = self.undo_log
+        if undo_log is not None:
+            undo_log.add(func, *args)
+
+    @_phase('check', of_game=True)
     def check(self):
         for character in self.characters:
             if character.health <= 0:
@@ -201,6 +429,45 @@ class Game:
             raise GameOver(player0)
 
 
+class UndoLog:
+    """A log of the changes to a game, which can be undone (see Game.make).
+
+    An entry is a function with its arguments, which undoes a change when
+    called.  Entries are undone in reverse order, so each one finds the
+    game as it was right after its change.
+    """
+
+    def __init__(self):
+        self.entries = []
+
+    def __len__(self):
+        return len(self.entries)
+
+    def save(self, object, *names):
+        """Log attributes of an object before they change."""
+        values = tuple(getattr(object, name) for name in names)
+        self.entries.append((_restore, (object, names, values)))
+
+    def add(self, func, *args):
+        """Log a call which undoes a change."""
+        self.entries.append((func, args))
+
+    def undo(self, mark=0):
+        """Undo the changes logged since a mark (a length of the log)."""
+        entries = self.entries
+        while len(entries) > mark:
+            func, args = entries.pop()
+            func(*args)
+
+def _restore(object, names, values):
+    for name, value in zip(names, values):
+        setattr(object, name, value)
+
+def _restore_zone(zone, objects):
+    zone.clear()
+    zone.extend(objects)
+
+
 class Agent:
     """An instance of an agent."""
 
@@ -216,39 +483,67 @@ class Agent:
         return action
 
 
-class Deck(List):
+class Zone:
+    """A mixin for a list of game objects owned by a player."""
+
+    def _clone(self, memo):
+        zone = type(self)()
+        zone.__dict__.update(self.__dict__)
+        zone.owner = memo[id(self.owner)]
+        zone.extend(object._clone(memo) for object in self)
+        return zone
+
+
+class Deck(Zone, Deque):
+    """A deck of cards, drawn from the left."""
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.fatigue = 0
 
     def draw(self):
+        undo_log = self.owner.game.undo_log
         if len(self) > 0:
-            return self.pop(0)
+            card = self.popleft()
+            if undo_log is not None:
+                undo_log.add(self.appendleft, card)
+            return card
         else:
+            if undo_log is not None:
+                undo_log.save(self, 'fatigue')
             self.fatigue += 1
             return self.fatigue
 
 
-class Hand(List):
+class Hand(Zone, List):
 
     def acquire(self, card):
         if len(self) < 10:
             self.append(card)
+            undo_log = self.owner.game.undo_log
+            if undo_log is not None:
+                undo_log.add(self.pop)
         else:
-            logging.info('{name}: Hand is full, {card} destroyed.'.format(
-                name=self.owner.name,
-                card=card,
-            ))
+            self.owner._info('Hand is full, {card} destroyed.', card=card)
 
 
-class Battlefield(List):
+class Battlefield(Zone, List):
     pass
 
 
 class Player:
     """An instance of game player."""
 
+    # Resolvers of signature symbols (see _expand)
+    _SYMBOLS = {
+        'game': lambda player, kwargs: player.game,
+        'self': lambda player, kwargs: player,
+        'enemy': lambda player, kwargs: player.opponent,
+        'enemy characters': lambda player, kwargs: player.opponent.characters,
+        'spell_damage': lambda player, kwargs: player.spell_damage,
+        'is_spell': lambda player, kwargs: kwargs.get('is_spell', False),
+    }
+
     def __init__(self, game, agent):
         self.game = game
         self.agent = agent
@@ -264,10 +559,14 @@ class Player:
         # TODO: secrets
         self.mana = 0
         self.full_mana = 0
-        hero_class = get_class(agent.hero)
+        # Aggregates of the characters in play (see _enter and _leave)
+        self._spell_damage = 0
+        self._taunts = 0
+        hero_class = get_class(agent.hero, '.heroes')
         self.hero = self._create(hero_class)
+        self._enter(self.hero)
         for card in agent.deck:
-            card_class = get_class(card)
+            card_class = get_class(card, '.cards')
             card = self._create(card_class)
             self.deck.append(card)
         self.game.rng.shuffle(self.deck)
@@ -294,7 +593,45 @@ class Player:
 
     @property
     def spell_damage(self):
-        return sum(character.spell_damage for character in self.characters)
+        return self._spell_damage
+
+    @property
+    def has_taunt(self):
+        return self._taunts > 0
+
+    def legal_actions(self):
+        """Return the legal actions of the player, as agents decide them.
+
+        Plays come in hand order with every position and target, then
+        attacks, then ending the turn.
+        """
+        if self.game.state == Game.REPLACING:
+            return [] if self.replaced else [Dict(name='replace')]
+        if self.game.state != Game.PLAYING or self.game.who is not self:
+            return []
+        actions = []
+        enemies = self.opponent.characters
+        targets = [enemy for enemy in enemies if not enemy.stealth] + self.characters
+        positions = range(self.battlefield.size + 1)
+        for card in self.hand:
+            if not card.can_play():
+                continue
+            if isinstance(card, MinionCard):
+                effect = card.abilities.get('battlecry')
+                for position in positions:
+                    actions.extend(self._play_actions(card, effect, targets, position=position))
+            else:
+                actions.extend(self._play_actions(card, card.effect, targets))
+        defenders = [enemy for enemy in enemies if not enemy.stealth]
+        taunts = [defender for defender in defenders if defender.taunt]
+        if taunts:
+            defenders = taunts
+        for character in self.characters:
+            if character.can_attack():
+                for defender in defenders:
+                    actions.append(Dict(name='attack', source=character, target=defender))
+        actions.append(Dict(name='end'))
+        return actions
 
     def replace(self, cards=None):
         if self.game.state != Game.REPLACING:
@@ -303,6 +640,10 @@ class Player:
             raise StateException('already replaced cards')
         if cards is None:
             cards = []
+        game = self.game
+        game._save(self, 'replaced')
+        game._log_undo(_restore_zone, self.hand, list(self.hand))
+        game._log_undo(_restore_zone, self.deck, list(self.deck))
         blanks = []
         for card in cards:
             index = self.hand.index(card)
@@ -311,13 +652,14 @@ class Player:
             self.deck.insert(new_index, card)
         blanks.sort()
         for index in blanks:
-            card = self.deck.pop(0)
+            card = self.deck.popleft()
             self.hand[index] = card
         self.replaced = True
         if self.opponent.replaced:
             self.game.state = Game.PLAYING
             self.game.next_turn()
 
+    @_phase('play')
     def play(self, card, *args, **kwargs):
         self._check_state()
         if card not in self.hand:
@@ -325,6 +667,7 @@ class Player:
         card.play(*args, **kwargs)
         self.game.check_finish()
 
+    @_phase('attack')
     def attack(self, source, target):
         self._check_state()
         if source is not self.hero and source not in self.battlefield:
@@ -357,6 +700,7 @@ class Player:
     def acquire(self, card_class):
         card = self._create(card_class)
         self.hand.append(card)
+        self.game._log_undo(self.hand.pop)
 
     def _check_state(self, active=True):
         if self.game.state != Game.PLAYING:
@@ -369,39 +713,67 @@ class Player:
         object.owner = self
         return object
 
+    def _clone(self, memo):
+        player = Player.__new__(Player)
+        memo[id(self)] = player
+        player.__dict__.update(self.__dict__)
+        player.game = memo[id(self.game)]
+        player.agent = copy.copy(self.agent)
+        player.agent.player = player
+        player.hero = self.hero._clone(memo)
+        player.deck = self.deck._clone(memo)
+        player.hand = self.hand._clone(memo)
+        player.battlefield = self.battlefield._clone(memo)
+        return player
+
+    def _enter(self, character):
+        """Account for a character coming into play."""
+        self.game._save(self, '_spell_damage', '_taunts')
+        self._spell_damage += character.spell_damage
+        self._taunts += character.taunt
+        self.game._subscribe(character)
+
+    def _leave(self, character):
+        """Account for a character leaving play."""
+        self.game._save(self, '_spell_damage', '_taunts')
+        self._spell_damage -= character.spell_damage
+        self._taunts -= character.taunt
+        self.game._unsubscribe(character)
+
+    def _play_actions(self, card, effect, targets, **kwargs):
+        if effect is not None and effect.needs_target:
+            return [Dict(name='play', card=card, target=target, **kwargs)
+                    for target in targets]
+        return [Dict(name='play', card=card, **kwargs)]
+
     def _do_action(self, action):
-        method = getattr(self, action.name)
+        name = action.name
+        method = getattr(self, name)
         del action.name
-        return method(**action)
-
-    def _expand(self, signature, **kwargs):
-        args = Dict()
-        for name, symbol in signature.items():
-            value = self._expand_symbol(symbol, **kwargs)
-            args[name] = value
-        return args
+        recorder = self.game.recorder
+        if recorder is None:
+            return method(**action)
+        # Only the actions which the engine accepts are recorded; the draws
+        # of the others are undone, as their replay will not make them.
+        rng = _copy_random(self.game.rng)
+        try:
+            result = method(**action)
+        except GameOver:
+            recorder.record(self, Dict(action, name=name))
+            raise
+        except Exception:
+            self.game.rng = rng
+            recorder.discard()
+            raise
+        recorder.record(self, Dict(action, name=name))
+        return result
 
-    def _expand_symbol(self, symbol, **kwargs):
-        if symbol == 'game':
-            return self.game
-        elif symbol == 'self':
-            return self
-        elif symbol == 'enemy':
-            return self.opponent
-        elif symbol == 'enemy characters':
-            return self.opponent.characters
-        elif symbol == 'spell_damage':
-            return self.spell_damage
-        elif symbol == 'is_spell':
-            return kwargs.get('is_spell', False)
-        elif symbol in kwargs:
-            return kwargs[symbol]
-        else:
-            raise ValueError('unknown symbol: {symbol}'.format(symbol=symbol))
+    def _expand(self, action, **kwargs):
+        return _expand(self, action, Player._SYMBOLS, kwargs)
 
     def _log(self, level, message, *args, **kwargs):
-        message = self.name + ': ' + message.format(*args, **kwargs)
-        logging.log(level, message)
+        if self.game.log and logging.root.isEnabledFor(level):
+            logging.log(level, _LogMessage(self.name, message, args, kwargs))
 
     def _debug(self, message, *args, **kwargs):
         self._log(logging.DEBUG, message, *args, **kwargs)
@@ -417,44 +789,123 @@ class Player:
 
 
 
-class Ability:
-    """A descriptor to hold ability with default value."""
+# Signature resolvers, by symbol table and signature
+_resolvers = {}
+
+def _expand(context, action, symbols, kwargs):
+    """Resolve the arguments of an action in a context (player or character).
+
+    The signature of the action is compiled into a resolver once per symbol
+    table, so resolving does no symbol matching.
+    """
+    resolver = action.resolvers.get(id(symbols))
+    if resolver is None:
+        key = (id(symbols), tuple(action.signature.items()))
+        resolver = _resolvers.get(key)
+        if resolver is None:
+            resolver = _resolvers[key] = _compile_signature(action.signature, symbols)
+        action.resolvers[id(symbols)] = resolver
+    return resolver(context, kwargs)
+
+def _compile_signature(signature, symbols):
+    getters = tuple((name, symbols.get(symbol) or _keyword_getter(symbol))
+                    for name, symbol in signature.items())
+    def resolve(context, kwargs):
+        args = Dict()
+        for name, getter in getters:
+            args[name] = getter(context, kwargs)
+        return args
+    return resolve
+
+def _keyword_getter(symbol):
+    def get(context, kwargs):
+        if symbol not in kwargs:
+            raise ValueError('unknown symbol: {symbol}'.format(symbol=symbol))
+        return kwargs[symbol]
+    return get
+
+
+class _LogMessage:
+    """A log message of a player, formatted only when it is emitted."""
+
+    __slots__ = ('name', 'message', 'args', 'kwargs')
+
+    def __init__(self, name, message, args, kwargs):
+        self.name = name
+        self.message = message
+        self.args = args
+        self.kwargs = kwargs
+
+    def __str__(self):
+        return self.name + ': ' + self.message.format(*self.args, **self.kwargs)
+
+
+class Flag:
+    """A descriptor to hold a boolean ability as a bit of _flags."""
 
-    def __init__(self, name, default=None):
-        self._name = '_' + name + '_'
-        self._default = default
+    def __init__(self, bit):
+        self._bit = bit
 
     def __get__(self, instance, owner):
-        if hasattr(instance, self._name):
-            value = getattr(instance, self._name)
-        else:
-            if type(self._default) is type:
-                value = self._default()
-            else:
-                value = self._default
-            setattr(instance, self._name, value)
-        return value
+        if instance is None:
+            return self
+        return bool(instance._flags & self._bit)
 
     def __set__(self, instance, value):
-        setattr(instance, self._name, value)
+        if value:
+            instance._flags |= self._bit
+        else:
+            instance._flags &= ~self._bit
+
+
+# Names of the slots of each class, for cloning
+_slot_names = {}
 
-    def __delete__(self, instance):
-        delattr(instance, self._name)
+def _get_slot_names(class_):
+    names = _slot_names.get(class_)
+    if names is None:
+        names = []
+        for base in class_.__mro__:
+            slots = base.__dict__.get('__slots__', ())
+            names.extend([slots] if isinstance(slots, str) else slots)
+        names = _slot_names[class_] = tuple(names)
+    return names
 
 
 class Object:
     """An instance of game object."""
 
+    __slots__ = ('name', 'game', 'owner', 'dob')
+
     def __init__(self, name):
         self.name = name
 
     def __str__(self):
         return self.name
 
+    def _clone(self, memo):
+        object = memo.get(id(self))
+        if object is None:
+            class_ = type(self)
+            object = class_.__new__(class_)
+            memo[id(self)] = object
+            for name in _get_slot_names(class_):
+                try:
+                    setattr(object, name, getattr(self, name))
+                except AttributeError:
+                    pass
+            if hasattr(self, '__dict__'):
+                object.__dict__.update(self.__dict__)
+            object.game = memo[id(self.game)]
+            object.owner = memo[id(self.owner)]
+        return object
+
 
 class Card(Object):
     """An instance of a card."""
 
+    __slots__ = ('_cost',)
+
     def __init__(self, name, cost):
         super().__init__(name)
         self._cost = cost
@@ -476,8 +927,13 @@ class Card(Object):
 
     def play(self):
         self._check_can_play()
-        self.owner.mana -= self.cost
-        self.owner.hand.remove(self)
+        owner = self.owner
+        game = self.game
+        game._save(owner, 'mana')
+        owner.mana -= self.cost
+        index = owner.hand.index(self)
+        del owner.hand[index]
+        game._log_undo(owner.hand.insert, index, self)
 
     def _check_can_play(self):
         if self.cost > self.owner.mana:
@@ -487,6 +943,8 @@ class Card(Object):
 class MinionCard(Card):
     """An instance of a minion card."""
 
+    __slots__ = ('attack', 'health', 'abilities')
+
     def __init__(self, name, cost, attack, health, **kwargs):
         super().__init__(name, cost)
         self.attack = attack
@@ -510,11 +968,13 @@ class MinionCard(Card):
         if position is None:
             position = self.owner.battlefield.size
         self.owner.battlefield.insert(position, minion)
+        self.game._log_undo(self.owner.battlefield.remove, minion)
+        self.owner._enter(minion)
         self.owner._info('Summoned {minion} at {position}',
                           minion=minion, position=position)
         if battlecry:
-            args = minion._expand(battlecry.signature, **kwargs)
-            battlecry(**args)
+            args = minion._expand(battlecry, **kwargs)
+            _timed(self.game, 'battlecry', battlecry, **args)
 
     def _check_can_play(self):
         super()._check_can_play()
@@ -525,6 +985,8 @@ class MinionCard(Card):
 class SpellCard(Card):
     """An instance of a spell card."""
 
+    __slots__ = ('effect', 'abilities')
+
     def __init__(self, name, cost, effect, **kwargs):
         super().__init__(name, cost)
         self.effect = effect
@@ -536,9 +998,9 @@ class SpellCard(Card):
 
     def play(self, **kwargs):
         kwargs['is_spell'] = True
-        args = self.owner._expand(self.effect.signature, **kwargs)
+        args = self.owner._expand(self.effect, **kwargs)
         super().play()
-        self.effect(**args)
+        _timed(self.game, 'effect', self.effect, **args)
 
     def _check_can_play(self):
         super()._check_can_play()
@@ -557,6 +1019,8 @@ class WeaponCard(Card):
 class Entity(Object):
     """An instance of game entity (on the board)."""
 
+    __slots__ = ()
+
     def __init__(self, name):
         super().__init__(name)
 
@@ -564,16 +1028,29 @@ class Entity(Object):
 class Character(Entity):
     """An instance of character."""
 
-    _sleeping = Ability('sleeping', False)
-    _cant_attack = Ability('cant_attack', False)
-    _charge = Ability('charge', False)
-    _divine_shield = Ability('divine_shield', False)
-    _stealth = Ability('stealth', False)
-    _taunt = Ability('taunt', False)
-    _windfury = Ability('windfury', False)
-    _spell_damage = Ability('spell_damage', 0)
-    _deathrattle = Ability('deathrattle', None)
-    _trigger = Ability('trigger', None)
+    __slots__ = ('attack', 'health', 'full_health', 'attack_count', '_flags',
+                 '_spell_damage', '_deathrattle', '_trigger')
+
+    _sleeping = Flag(1 << 0)
+    _cant_attack = Flag(1 << 1)
+    _charge = Flag(1 << 2)
+    _divine_shield = Flag(1 << 3)
+    _stealth = Flag(1 << 4)
+    _taunt = Flag(1 << 5)
+    _windfury = Flag(1 << 6)
+
+    # Resolvers of signature symbols (see _expand)
+    _SYMBOLS = {
+        'game': lambda character, kwargs: character.game,
+        'himself': lambda character, kwargs: character,
+        'self': lambda character, kwargs: character.owner,
+        'enemy': lambda character, kwargs: character.owner.opponent,
+        'all characters': lambda character, kwargs: character.game.characters,
+        'the enemy hero': lambda character, kwargs: character.owner.opponent.hero,
+        'enemy characters': lambda character, kwargs: character.owner.opponent.characters,
+        'spell_damage': lambda character, kwargs: character.owner.spell_damage,
+        'is_spell': lambda character, kwargs: kwargs.get('is_spell', False),
+    }
 
     def __init__(self, name, attack, health):
         super().__init__(name)
@@ -581,6 +1058,10 @@ class Character(Entity):
         self.health = health
         self.full_health = health
         self.attack_count = 0
+        self._flags = 0
+        self._spell_damage = 0
+        self._deathrattle = None
+        self._trigger = None
 
     def __str__(self):
         return '({name}{separator}{status}, {attack}, {health}/{full_health})'.format(
@@ -667,6 +1148,7 @@ class Character(Entity):
             return 1
 
     def reset(self):
+        self.game._save(self, '_flags', 'attack_count')
         self._sleeping = False
         self.attack_count = 0
 
@@ -676,8 +1158,12 @@ class Character(Entity):
     def attack_(self, target):
         self._check_can_attack(target)
         self.owner._info('{subject} was attacking {object}.', subject=self, object=target)
+        self.game._save(self, 'attack_count', '_flags')
         self.attack_count += 1
-        self._stealth = False
+        if self._stealth:
+            self.game._save(self.owner, '_taunts')
+            self._stealth = False
+            self.owner._taunts += self.taunt
         target.deal_damage(self)
         self.deal_damage(target)
 
@@ -687,6 +1173,7 @@ class Character(Entity):
 
     def take_damage(self, damage):
         self.owner._info('{subject} took {damage} damage.', subject=self, damage=damage)
+        self.game._save(self, 'health', '_flags')
         if self.divine_shield:
             self._divine_shield = False
         else:
@@ -698,8 +1185,9 @@ class Character(Entity):
         self.owner._info('{subject} destroyed.', subject=self)
         deathrattle = self.deathrattle
         if deathrattle:
-            args = self.owner._expand(deathrattle.signature)
-            deathrattle(**args)
+            # Resolved like a battlecry, in the context of the character
+            args = self._expand(deathrattle)
+            _timed(self.game, 'deathrattle', deathrattle, **args)
 
     def _check_can_attack(self, target):
         if self.attack <= 0:
@@ -708,40 +1196,18 @@ class Character(Entity):
             raise AttackException('{character} is exhausted'.format(character=self))
         if target.stealth:
             raise AttackException('{target} is stealth'.format(target=target))
-        if any(character.taunt for character in target.owner.characters) and not target.taunt:
+        if target.owner.has_taunt and not target.taunt:
             raise AttackException('{target} is not taunt, but taunt exists'.format(target=target))
 
-    def _expand(self, signature, **kwargs):
-        args = Dict()
-        for name, symbol in signature.items():
-            value = self._expand_symbol(symbol, **kwargs)
-            args[name] = value
-        return args
-
-    def _expand_symbol(self, symbol, **kwargs):
-        if symbol == 'game':
-            return self.game
-        elif symbol == 'himself':
-            return self
-        elif symbol == 'self':
-            return self.owner
-        elif symbol == 'the enemy hero':
-            return self.owner.opponent.hero
-        elif symbol == 'enemy characters':
-            return self.owner.opponent.characters
-        elif symbol == 'spell_damage':
-            return self.owner.spell_damage
-        elif symbol == 'is_spell':
-            return kwargs.get('is_spell', False)
-        elif symbol in kwargs:
-            return kwargs[symbol]
-        else:
-            raise ValueError('unknown symbol: {symbol}'.format(symbol=symbol))
+    def _expand(self, action, **kwargs):
+        return _expand(self, action, Character._SYMBOLS, kwargs)
 
 
 class Hero(Character):
     """An instance of hero."""
 
+    __slots__ = ('armor',)
+
     def __init__(self, name, health):
         super().__init__(name, 0, health)
         self.armor = 0
@@ -760,8 +1226,11 @@ class Hero(Character):
 class Minion(Character):
     """An instance of minion."""
 
+    __slots__ = ('card',)
+
     def __init__(self, name, attack, health, **kwargs):
         super().__init__(name, attack, health)
+        self.card = None
         self._sleeping = True
         for name, value in kwargs.items():
             setattr(self, '_' + name, value)
@@ -770,6 +1239,12 @@ class Minion(Character):
         super().reset()
         self._sleeping = False
 
+    def _clone(self, memo):
+        minion = super()._clone(memo)
+        if self.card is not None:
+            minion.card = self.card._clone(memo)
+        return minion
+
     def can_attack(self):
         return super().can_attack() and not self.sleeping
 
@@ -779,7 +1254,11 @@ class Minion(Character):
             raise AttackException('{minion} is sleeping'.format(minion=self))
 
     def destroy(self):
-        self.owner.battlefield.remove(self)
+        battlefield = self.owner.battlefield
+        index = battlefield.index(self)
+        del battlefield[index]
+        self.game._log_undo(battlefield.insert, index, self)
+        self.owner._leave(self)
         super().destroy()
 
 
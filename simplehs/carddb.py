@@ -0,0 +1,314 @@
+#!/usr/bin/env python3
+# Binary precompiled card database
+
+import argparse
+import ast
+import bisect
+import hashlib
+import json
+import mmap
+import os
+import struct
+import sys
+
+from . import actions
+from .utils import Dict
+from .utils import pascalize
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+JSON_PATH = os.path.join(BASE_DIR, 'data', 'cards.json')
+DATABASE_PATH = os.path.join(BASE_DIR, 'data', 'cards.db')
+
+# The file starts with a header, followed by the card records sorted by
+# class name, the offsets of the interned strings and the strings.
+MAGIC = b'SHCD'
+VERSION = 2
+# magic, version, SHA-256 of the JSON source, number of cards, number of strings
+HEADER = struct.Struct('<4sH32sII')
+# class name, name, type, class, rarity, cost, attack, health (or durability),
+# flags, spell damage, effect, battlecry, deathrattle, trigger, id in the
+# JSON source
+RECORD = struct.Struct('<IIBBBBBBBBIIIII')
+OFFSET = struct.Struct('<I')
+NO_STRING = 0xffffffff
+
+FLAGS = ('taunt', 'charge', 'windfury', 'divine_shield', 'stealth', 'cant_attack')
+IMPLEMENTED = 1 << 7
+ACTIONS = ('effect', 'battlecry', 'deathrattle', 'trigger')
+
+
+def checksum(json_path=JSON_PATH):
+    """Return the SHA-256 digest of a JSON card source."""
+    with open(json_path, 'rb') as json_file:
+        return hashlib.sha256(json_file.read()).digest()
+
+
+def build(json_path=JSON_PATH, path=DATABASE_PATH):
+    """Build the card database from a JSON card source.
+
+    Every card is parsed once; the code of its actions is interned, so
+    cards with the same effects share their strings.
+    """
+
+    from . import generate_cards
+    with open(json_path, 'rb') as json_file:
+        source = json_file.read()
+    strings = []
+    string_index = {}
+
+    def intern(text):
+        if text not in string_index:
+            string_index[text] = len(strings)
+            strings.append(text)
+        return string_index[text]
+
+    records = {}
+    for card_info in json.loads(source.decode('utf-8')):
+        card = generate_cards.convert(card_info)
+        class_name = pascalize(card.name)
+        if class_name in records:
+            continue
+        flags = 0
+        spell_damage = 0
+        codes = dict.fromkeys(ACTIONS, NO_STRING)
+        try:
+            attributes, abilities = generate_cards.parse(card)
+        except NotImplementedError:
+            pass
+        else:
+            flags |= IMPLEMENTED
+            for num, name in enumerate(FLAGS):
+                if abilities.get(name):
+                    flags |= 1 << num
+            spell_damage = abilities.get('spell_damage', 0)
+            if card.type == 'spell':
+                abilities['effect'] = attributes[0]
+            for name in ACTIONS:
+                if name in abilities:
+                    codes[name] = intern(generate_cards.to_code(abilities[name]))
+        records[class_name] = (
+            intern(class_name),
+            intern(card.name),
+            card_info['type'],
+            card_info.get('classs', 0),
+            card_info['quality'],
+            card.cost,
+            card.get('attack', 0),
+            card.get('health', card.get('durability', 0)),
+            flags,
+            spell_damage,
+        ) + tuple(codes[name] for name in ACTIONS) + (card_info['id'],)
+    encoded = [string.encode('utf-8') for string in strings]
+    # Processes loading cards may build it at once, each into its own file
+    temp_path = '{path}.{pid}.tmp'.format(path=path, pid=os.getpid())
+    with open(temp_path, 'wb') as db_file:
+        db_file.write(HEADER.pack(MAGIC, VERSION, hashlib.sha256(source).digest(),
+                                  len(records), len(strings)))
+        for class_name in sorted(records):
+            db_file.write(RECORD.pack(*records[class_name]))
+        offset = 0
+        for string in encoded:
+            db_file.write(OFFSET.pack(offset))
+            offset += len(string)
+        db_file.write(OFFSET.pack(offset))
+        for string in encoded:
+            db_file.write(string)
+    os.replace(temp_path, path)
+
+
+def open_database(path=DATABASE_PATH, json_path=None):
+    """Open the card database.
+
+    The database is used as is: it is built with the card code (see main).
+    If a JSON card source is given, the database is (re)built from it when
+    it is missing or stale, i.e. its checksum differs from the source.
+    """
+
+    try:
+        database = CardDatabase(path)
+    except (OSError, ValueError):
+        if json_path is None:
+            raise
+        database = None
+    if json_path is not None:
+        if database is None or database.checksum != checksum(json_path):
+            if database is not None:
+                database.close()
+            build(json_path, path)
+            database = CardDatabase(path)
+    return database
+
+
+class CardDatabase:
+    """A card database file, mapped into memory.
+
+    Records are decoded on access, so the cost of loading cards depends on
+    the cards used, not on the size of the database.
+    """
+
+    def __init__(self, path=DATABASE_PATH):
+        with open(path, 'rb') as db_file:
+            self._data = mmap.mmap(db_file.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            magic, version, self.checksum, self._size, num_strings = HEADER.unpack_from(self._data)
+        except struct.error:
+            magic = version = None
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError('not a card database: {path}'.format(path=path))
+        self._records = HEADER.size
+        self._offsets = self._records + self._size * RECORD.size
+        self._strings = self._offsets + (num_strings + 1) * OFFSET.size
+        self._actions = {}
+        self._classes = {}
+
+    def __len__(self):
+        return self._size
+
+    def __contains__(self, class_name):
+        return self._find(class_name) is not None
+
+    def close(self):
+        self._data.close()
+
+    def names(self):
+        """Return the class names of all cards."""
+        return [self._string(self._record(num)[0]) for num in range(self._size)]
+
+    def get(self, class_name):
+        """Return the record of a card by its class name."""
+        record = self._find(class_name)
+        if record is None:
+            raise KeyError(class_name)
+        card = Dict()
+        (card.class_name, card.name, card.type, card.class_, card.rarity,
+         card.cost, card.attack, card.health, flags, card.spell_damage) = record[:10]
+        card.class_name = self._string(card.class_name)
+        card.name = self._string(card.name)
+        card.implemented = bool(flags & IMPLEMENTED)
+        for num, name in enumerate(FLAGS):
+            card[name] = bool(flags & 1 << num)
+        for name, index in zip(ACTIONS, record[10:14]):
+            card[name] = self._string(index)
+        card.id = record[14]
+        return card
+
+    def card_class(self, class_name):
+        """Return the class of a card by its class name."""
+        class_ = self._classes.get(class_name)
+        if class_ is None:
+            class_ = self._classes[class_name] = self._make_class(class_name)
+        return class_
+
+    def _make_class(self, class_name):
+        from .cards.utils import make_minion_card
+        from .cards.utils import make_spell_card
+        record = self._find(class_name)
+        if record is None:
+            raise KeyError(class_name)
+        (name, type_, class_, rarity, cost, attack, health,
+         flags, spell_damage) = record[1:10]
+        if not flags & IMPLEMENTED or type_ not in (4, 5):
+            raise NotImplementedError('card is not implemented: {class_name}'.format(class_name=class_name))
+        name = self._string(name)
+        abilities = {}
+        for num, ability in enumerate(FLAGS):
+            if flags & 1 << num:
+                abilities[ability] = True
+        if spell_damage:
+            abilities['spell_damage'] = spell_damage
+        for ability, index in zip(ACTIONS, record[10:14]):
+            if index != NO_STRING:
+                abilities[ability] = self._action(index)
+        if type_ == 4:
+            return make_minion_card(name, cost, attack, health, **abilities)
+        effect = abilities.pop('effect')
+        return make_spell_card(name, cost, effect, **abilities)
+
+    def _action(self, index):
+        action = self._actions.get(index)
+        if action is None:
+            action = self._actions[index] = evaluate(self._string(index))
+        return action
+
+    def _find(self, class_name):
+        low = bisect.bisect_left(_Names(self), class_name)
+        if low < self._size:
+            record = self._record(low)
+            if self._string(record[0]) == class_name:
+                return record
+        return None
+
+    def _record(self, num):
+        return RECORD.unpack_from(self._data, self._records + num * RECORD.size)
+
+    def _string(self, index):
+        if index == NO_STRING:
+            return None
+        start, end = struct.unpack_from('<II', self._data, self._offsets + index * OFFSET.size)
+        return self._data[self._strings + start:self._strings + end].decode('utf-8')
+
+
+class _Names:
+    """A lazy sequence of the class names of a database, for bisect."""
+
+    def __init__(self, database):
+        self._database = database
+
+    def __len__(self):
+        return len(self._database)
+
+    def __getitem__(self, num):
+        return self._database._string(self._database._record(num)[0])
+
+
+def evaluate(code):
+    """Evaluate the code of a generated action.
+
+    Only literals, lists and calls of the public names of simplehs.actions
+    are allowed.
+
+    >>> evaluate('deal_damage(2, target="the enemy hero")').signature.target
+    'the enemy hero'
+    """
+
+    return _evaluate(ast.parse(code, mode='eval').body)
+
+def _evaluate(node):
+    if isinstance(node, ast.Constant):
+        return node.value
+    elif isinstance(node, ast.Name) and not node.id.startswith('_') and hasattr(actions, node.id):
+        return getattr(actions, node.id)
+    elif isinstance(node, ast.List):
+        return [_evaluate(element) for element in node.elts]
+    elif isinstance(node, ast.Call):
+        function = _evaluate(node.func)
+        args = [_evaluate(arg) for arg in node.args]
+        kwargs = {keyword.arg: _evaluate(keyword.value) for keyword in node.keywords}
+        return function(*args, **kwargs)
+    raise ValueError('unsupported action code: {code}'.format(code=ast.dump(node)))
+
+
+def main(args=sys.argv[1:]):
+    parser = argparse.ArgumentParser(
+        prog='python3 -m simplehs.carddb',
+        description='Build the binary card database.',
+    )
+    parser.add_argument('--json', default=JSON_PATH,
+                        help='JSON card source (default: data/cards.json)')
+    parser.add_argument('--output', default=DATABASE_PATH,
+                        help='database file (default: data/cards.db)')
+    options = parser.parse_args(args)
+    build(options.json, options.output)
+    database = CardDatabase(options.output)
+    implemented = sum(1 for name in database.names() if database.get(name).implemented)
+    print('{path}: {size} cards, {implemented} implemented'.format(
+        path=options.output,
+        size=len(database),
+        implemented=implemented,
+    ))
+    database.close()
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+# Card classes, each loaded from the card database or its module on first access
+
+import importlib
+
+from . import special
+from .special import *
+
+# Modules of the card classes, by class name
+_MODULES = {
+    'Wisp': 'neutral',
+    'ArgentSquire': 'neutral',
+    'ElvenArcher': 'neutral',
+    'GoldshireFootman': 'neutral',
+    'LeperGnome': 'neutral',
+    'MurlocRaider': 'neutral',
+    'Shieldbearer': 'neutral',
+    'StonetuskBoar': 'neutral',
+    'WorgenInfiltrator': 'neutral',
+    'YoungDragonhawk': 'neutral',
+    'AncientWatcher': 'neutral',
+    'BloodfenRaptor': 'neutral',
+    'BloodmageThalnos': 'neutral',
+    'BluegillWarrior': 'neutral',
+    'FrostwolfGrunt': 'neutral',
+    'KoboldGeomancer': 'neutral',
+    'LootHoarder': 'neutral',
+    'MadBomber': 'neutral',
+    'NoviceEngineer': 'neutral',
+    'RiverCrocolisk': 'neutral',
+    'DalaranMage': 'neutral',
+    'Demolisher': 'neutral',
+    'InjuredBlademaster': 'neutral',
+    'IronforgeRifleman': 'neutral',
+    'IronfurGrizzly': 'neutral',
+    'JunglePanther': 'neutral',
+    'MagmaRager': 'neutral',
+    'ScarletCrusader': 'neutral',
+    'SilverbackPatriarch': 'neutral',
+    'ThrallmarFarseer': 'neutral',
+    'Wolfrider': 'neutral',
+    'ChillwindYeti': 'neutral',
+    'GnomishInventor': 'neutral',
+    'MogushanWarden': 'neutral',
+    'OasisSnapjaw': 'neutral',
+    'OgreMagi': 'neutral',
+    'SenjinShieldmasta': 'neutral',
+    'SilvermoonGuardian': 'neutral',
+    'StormwindKnight': 'neutral',
+    'Abomination': 'neutral',
+    'AzureDrake': 'neutral',
+    'BootyBayBodyguard': 'neutral',
+    'FenCreeper': 'neutral',
+    'Nightblade': 'neutral',
+    'StormpikeCommando': 'neutral',
+    'StranglethornTiger': 'neutral',
+    'Archmage': 'neutral',
+    'ArgentCommander': 'neutral',
+    'BoulderfistOgre': 'neutral',
+    'LordOfTheArena': 'neutral',
+    'RecklessRocketeer': 'neutral',
+    'Sunwalker': 'neutral',
+    'WindfuryHarpy': 'neutral',
+    'BaronGeddon': 'neutral',
+    'CoreHound': 'neutral',
+    'RavenholdtAssassin': 'neutral',
+    'WarGolem': 'neutral',
+    'RagnarosTheFirelord': 'neutral',
+    'Malygos': 'neutral',
+    'ShieldSlam': 'warrior',
+    'Whirlwind': 'warrior',
+    'Cleave': 'warrior',
+    'FieryWarAxe': 'warrior',
+    'KorkronElite': 'warrior',
+    'ArcaniteReaper': 'warrior',
+    'LightsJustice': 'paladin',
+    'Consecration': 'paladin',
+    'HammerOfWrath': 'paladin',
+    'AvengingWrath': 'paladin',
+    'ArcaneShot': 'hunter',
+    'MultiShot': 'hunter',
+    'ExplosiveShot': 'hunter',
+    'KingKrush': 'hunter',
+    'Backstab': 'rogue',
+    'SinisterStrike': 'rogue',
+    'Shiv': 'rogue',
+    'FanOfKnives': 'rogue',
+    'AssassinsBlade': 'rogue',
+    'Sprint': 'rogue',
+    'HolySmite': 'priest',
+    'MindBlast': 'priest',
+    'ManaTideTotem': 'shaman',
+    'FireElemental': 'shaman',
+    'AlAkirTheWindlord': 'shaman',
+    'ArcaneMissiles': 'mage',
+    'ArcaneExplosion': 'mage',
+    'ArcaneIntellect': 'mage',
+    'Fireball': 'mage',
+    'Flamestrike': 'mage',
+    'Pyroblast': 'mage',
+    'FlameImp': 'warlock',
+    'Voidwalker': 'warlock',
+    'ShadowBolt': 'warlock',
+    'Hellfire': 'warlock',
+    'PitLord': 'warlock',
+    'DreadInfernal': 'warlock',
+    'Moonfire': 'druid',
+    'Swipe': 'druid',
+    'Starfire': 'druid',
+    'IronbarkProtector': 'druid',
+}
+
+__all__ = list(_MODULES) + special.__all__
+
+
+# The card database (see carddb), False if it cannot be opened
+_database = None
+
+
+def __getattr__(name):
+    module_name = _MODULES.get(name)
+    if module_name is None:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+    database = _open_database()
+    if database:
+        try:
+            class_ = database.card_class(name)
+        except (KeyError, NotImplementedError):
+            pass
+        else:
+            globals()[name] = class_
+            return class_
+    # Only this class, as the others of its module may be in the database
+    module = importlib.import_module('.' + module_name, __name__)
+    class_ = globals()[name] = getattr(module, name)
+    return class_
+
+
+def _open_database():
+    global _database
+    if _database is None:
+        from ..carddb import open_database
+        try:
+            _database = open_database()
+        except (OSError, ValueError):
+            _database = False
+    return _database
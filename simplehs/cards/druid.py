@@ -0,0 +1,30 @@
+#!/usr/bin/env python3
+
+from ..actions import *
+from .utils import *
+
+# Spell card Innervate (Innervate: Gain 2 Mana Crystals this turn only.) unimplemented: ("['gain 2 mana crystals this turn only']",)
+Moonfire = make_spell_card("Moonfire", 0, deal_damage(1))
+# Spell card Claw (Claw: Give your hero +2 Attack this turn and 2 Armor.) unimplemented: ("['give your hero +2 attack this turn and 2 armor']",)
+# Spell card Naturalize (Naturalize: Destroy a minion.  Your opponent draws 2 cards.) unimplemented: ("['destroy a minion', 'your opponent draws 2 cards']",)
+# Spell card Savagery (Savagery: Deal damage equal to your hero's Attack to a minion.) unimplemented: ('["deal damage equal to your hero\'s attack to a minion"]',)
+# Spell card MarkOfTheWild (Mark of the Wild: Give a minion Taunt and +2/+2. (+2 Attack/+2 Health)) unimplemented: ("['give a minion taunt and +2/+2. (+2 attack/+2 health)']",)
+# Spell card PowerOfTheWild (Power of the Wild: Choose One - Give your minions +1/+1; or Summon a 3/2 Panther.) unimplemented: ("['choose one - give your minions +1/+1; or summon a 3/2 panther']",)
+# Spell card WildGrowth (Wild Growth: Gain an empty Mana Crystal.) unimplemented: ("['gain an empty mana crystal']",)
+# Spell card Wrath (Wrath: Choose One - Deal 3 damage to a minion; or 1 damage and draw a card.) unimplemented: ("['choose one - deal 3 damage to a minion; or 1 damage and draw a card']",)
+# Spell card HealingTouch (Healing Touch: Restore 8 Health.) unimplemented: ("['restore 8 health']",)
+# Spell card MarkOfNature (Mark of Nature: Choose One - Give a minion +4 Attack; or +4 Health and Taunt.) unimplemented: ("['choose one - give a minion +4 attack; or +4 health and taunt']",)
+# Spell card SavageRoar (Savage Roar: Give your characters +2 Attack this turn.) unimplemented: ("['give your characters +2 attack this turn']",)
+# Spell card Bite (Bite: Give your hero +4 Attack this turn and 4 Armor.) unimplemented: ("['give your hero +4 attack this turn and 4 armor']",)
+# Minion card KeeperOfTheGrove (Keeper of the Grove: Choose One - Deal 2 damage; or Silence a minion.) unimplemented: ("['choose one - deal 2 damage; or silence a minion']",)
+# Spell card SoulOfTheForest (Soul of the Forest: Give your minions "Deathrattle: Summon a 2/2 Treant.") unimplemented: ('[\'give your minions "deathrattle: summon a 2/2 treant."\']',)
+Swipe = make_spell_card("Swipe", 4, [deal_damage(4, target="an enemy"), deal_damage(1, target="all other enemies")])
+# Minion card DruidOfTheClaw (Druid of the Claw: Choose One - Charge; or +2 Health and Taunt.) unimplemented: ("['choose one - charge; or +2 health and taunt']",)
+# Spell card Nourish (Nourish: Choose One - Gain 2 Mana Crystals; or Draw 3 cards.) unimplemented: ("['choose one - gain 2 mana crystals; or draw 3 cards']",)
+# Spell card Starfall (Starfall: Choose One - Deal 5 damage to a minion; or 2 damage to all enemy minions.) unimplemented: ("['choose one - deal 5 damage to a minion; or 2 damage to all enemy minions']",)
+# Spell card ForceOfNature (Force of Nature: Summon three 2/2 Treants with Charge that die at the end of the turn.) unimplemented: ("['summon three 2/2 treants with charge that die at the end of the turn']",)
+Starfire = make_spell_card("Starfire", 6, [deal_damage(5), draw_card(1)])
+# Minion card AncientOfLore (Ancient of Lore: Choose One - Draw 2 cards; or Restore 5 Health.) unimplemented: ("['choose one - draw 2 cards; or restore 5 health']",)
+# Minion card AncientOfWar (Ancient of War: Choose One - +5 Attack; or +5 Health and Taunt.) unimplemented: ("['choose one - +5 attack; or +5 health and taunt']",)
+IronbarkProtector = make_minion_card("Ironbark Protector", 8, 8, 8, taunt=True)
+# Minion card Cenarius (Cenarius: Choose One - Give your other minions +2/+2; or Summon two 2/2 Treants with Taunt.) unimplemented: ("['choose one - give your other minions +2/+2; or summon two 2/2 treants with taunt']",)
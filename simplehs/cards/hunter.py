@@ -0,0 +1,30 @@
+#!/usr/bin/env python3
+
+from ..actions import *
+from .utils import *
+
+# Spell card HuntersMark (Hunter's Mark: Change a minion's Health to 1.) unimplemented: ('["change a minion\'s health to 1"]',)
+ArcaneShot = make_spell_card("Arcane Shot", 1, deal_damage(2))
+# Spell card BestialWrath (Bestial Wrath: Give a Beast +2 Attack and Immune this turn.) unimplemented: ("['give a beast +2 attack and immune this turn']",)
+# Spell card Flare (Flare: All minions lose Stealth.  Destroy all enemy Secrets.  Draw a card.) unimplemented: ("['all minions lose stealth', 'destroy all enemy secrets']",)
+# Minion card TimberWolf (Timber Wolf: Your other Beasts have +1 Attack.) unimplemented: ("['your other beasts have +1 attack']",)
+# Spell card Tracking (Tracking: Look at the top three cards of your deck.  Draw one and discard the others.) unimplemented: ("['look at the top three cards of your deck', 'draw one and discard the others']",)
+# Spell card ExplosiveTrap (Explosive Trap: Secret: When your hero is attacked, deal 2 damage to all enemies.) unimplemented: ("['secret: when your hero is attacked, deal 2 damage to all enemies']",)
+# Spell card FreezingTrap (Freezing Trap: Secret: When an enemy minion attacks, return it to its owner's hand and it costs (2) more.) unimplemented: ('["secret: when an enemy minion attacks, return it to its owner\'s hand and it costs (2) more"]',)
+# Spell card Misdirection (Misdirection: Secret: When a character attacks your hero, instead he attacks another random character.) unimplemented: ("['secret: when a character attacks your hero, instead he attacks another random character']",)
+# Minion card ScavengingHyena (Scavenging Hyena: Whenever a friendly Beast dies, gain +2/+1.) unimplemented: ("['whenever a friendly beast dies, gain +2/+1']",)
+# Spell card SnakeTrap (Snake Trap: Secret: When one of your minions is attacked, summon three 1/1 Snakes.) unimplemented: ("['secret: when one of your minions is attacked, summon three 1/1 snakes']",)
+# Spell card Snipe (Snipe: Secret: When your opponent plays a minion, deal 4 damage to it.) unimplemented: ("['secret: when your opponent plays a minion, deal 4 damage to it']",)
+# Minion card StarvingBuzzard (Starving Buzzard: Whenever you summon a Beast, draw a card.) unimplemented: ("['whenever you summon a beast, draw a card']",)
+# Spell card UnleashTheHounds (Unleash the Hounds: For each enemy minion, summon a 1/1 Hound with Charge.) unimplemented: ("['for each enemy minion, summon a 1/1 hound with charge']",)
+# Spell card AnimalCompanion (Animal Companion: Summon a random Beast Companion.) unimplemented: ("['summon a random beast companion']",)
+# Spell card DeadlyShot (Deadly Shot: Destroy a random enemy minion.) unimplemented: ("['destroy a random enemy minion']",)
+# Weapon card EaglehornBow (Eaglehorn Bow: Whenever a Secret is revealed, gain +1 Durability.) unimplemented: ("['whenever a secret is revealed, gain +1 durability']",)
+# Spell card KillCommand (Kill Command: Deal 3 damage.  If you have a Beast, deal 5 damage instead.) unimplemented: ("['if you have a beast, deal 5 damage instead']",)
+# Minion card Houndmaster (Houndmaster: Battlecry: Give a friendly Beast +2/+2 and Taunt.) unimplemented: ("['battlecry: give a friendly beast +2/+2 and taunt']",)
+MultiShot = make_spell_card("Multi-Shot", 4, deal_damage(3, target="two random enemy minions"))
+ExplosiveShot = make_spell_card("Explosive Shot", 5, [deal_damage(5, target="a minion"), deal_damage(2, target="adjacent ones")])
+# Minion card TundraRhino (Tundra Rhino: Your Beasts have Charge.) unimplemented: ("['your beasts have charge']",)
+# Minion card SavannahHighmane (Savannah Highmane: Deathrattle: Summon two 2/2 Hyenas.) unimplemented: ("['deathrattle: summon two 2/2 hyenas']",)
+# Weapon card GladiatorsLongbow (Gladiator's Longbow: Your hero is Immune while attacking.) unimplemented: ("['your hero is immune while attacking']",)
+KingKrush = make_minion_card("King Krush", 9, 8, 8, charge=True)
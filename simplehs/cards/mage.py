@@ -0,0 +1,30 @@
+#!/usr/bin/env python3
+
+from ..actions import *
+from .utils import *
+
+ArcaneMissiles = make_spell_card("Arcane Missiles", 1, deal_damage(3, split=True, target="enemy characters"))
+# Spell card IceLance (Ice Lance: Freeze a character.  If it was already Frozen, deal 4 damage instead.) unimplemented: ("['freeze a character', 'if it was already frozen, deal 4 damage instead']",)
+# Minion card ManaWyrm (Mana Wyrm: Whenever you cast a spell, gain +1 Attack.) unimplemented: ("['whenever you cast a spell, gain +1 attack']",)
+# Spell card MirrorImage (Mirror Image: Summon two 0/2 minions with Taunt.) unimplemented: ("['summon two 0/2 minions with taunt']",)
+ArcaneExplosion = make_spell_card("Arcane Explosion", 2, deal_damage(1, target="all enemy minions"))
+# Spell card Frostbolt (Frostbolt: Deal 3 damage to a character and Freeze it.) unimplemented: ("['deal 3 damage to a character and freeze it']",)
+# Minion card SorcerersApprentice (Sorcerer's Apprentice: Your spells cost (1) less.) unimplemented: ("['your spells cost (1) less']",)
+ArcaneIntellect = make_spell_card("Arcane Intellect", 3, draw_card(2))
+# Spell card Counterspell (Counterspell: Secret: When your opponent casts a spell, Counter it.) unimplemented: ("['secret: when your opponent casts a spell, counter it']",)
+# Spell card FrostNova (Frost Nova: Freeze all enemy minions.) unimplemented: ("['freeze all enemy minions']",)
+# Spell card IceBarrier (Ice Barrier: Secret: As soon as your hero is attacked, gain 8 Armor.) unimplemented: ("['secret: as soon as your hero is attacked, gain 8 armor']",)
+# Spell card IceBlock (Ice Block: Secret: When your hero takes fatal damage, prevent it and become Immune this turn.) unimplemented: ("['secret: when your hero takes fatal damage, prevent it and become immune this turn']",)
+# Minion card KirinTorMage (Kirin Tor Mage: Battlecry: The next Secret you play this turn costs (0).) unimplemented: ("['battlecry: the next secret you play this turn costs (0)']",)
+# Spell card MirrorEntity (Mirror Entity: Secret: When your opponent plays a minion, summon a copy of it.) unimplemented: ("['secret: when your opponent plays a minion, summon a copy of it']",)
+# Spell card Spellbender (Spellbender: Secret: When an enemy casts a spell on a minion, summon a 1/3 as the new target.) unimplemented: ("['secret: when an enemy casts a spell on a minion, summon a 1/3 as the new target']",)
+# Spell card Vaporize (Vaporize: Secret: When a minion attacks your hero, destroy it.) unimplemented: ("['secret: when a minion attacks your hero, destroy it']",)
+# Spell card ConeOfCold (Cone of Cold: Freeze a minion and the minions next to it, and deal 1 damage to them.) unimplemented: ("['freeze a minion and the minions next to it, and deal 1 damage to them']",)
+# Minion card EtherealArcanist (Ethereal Arcanist: If you control a Secret at the end of your turn, gain +2/+2.) unimplemented: ("['if you control a secret at the end of your turn, gain +2/+2']",)
+Fireball = make_spell_card("Fireball", 4, deal_damage(6))
+# Spell card Polymorph (Polymorph: Transform a minion into a 1/1 Sheep.) unimplemented: ("['transform a minion into a 1/1 sheep']",)
+# Minion card WaterElemental (Water Elemental: Freeze any character damaged by this minion.) unimplemented: ("['freeze any character damaged by this minion']",)
+# Spell card Blizzard (Blizzard: Deal 2 damage to all enemy minions and Freeze them.) unimplemented: ("['deal 2 damage to all enemy minions and freeze them']",)
+# Minion card ArchmageAntonidas (Archmage Antonidas: Whenever you cast a spell, put a 'Fireball' spell into your hand.) unimplemented: ('["whenever you cast a spell, put a \'fireball\' spell into your hand"]',)
+Flamestrike = make_spell_card("Flamestrike", 7, deal_damage(4, target="all enemy minions"))
+Pyroblast = make_spell_card("Pyroblast", 10, deal_damage(10))
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+
+from ..actions import *
+from .utils import *
+
+Wisp = make_minion_card("Wisp", 0, 1, 1)
+# Minion card AbusiveSergeant (Abusive Sergeant: Battlecry: Give a minion +2 Attack this turn.) unimplemented: ("['battlecry: give a minion +2 attack this turn']",)
+# Minion card AngryChicken (Angry Chicken: Enrage: +5 Attack.) unimplemented: ("['enrage: +5 attack']",)
+ArgentSquire = make_minion_card("Argent Squire", 1, 1, 1, divine_shield=True)
+# Minion card BloodsailCorsair (Bloodsail Corsair: Battlecry: Remove 1 Durability from your opponent's weapon.) unimplemented: ('["battlecry: remove 1 durability from your opponent\'s weapon"]',)
+ElvenArcher = make_minion_card("Elven Archer", 1, 1, 1, battlecry=deal_damage(1))
+GoldshireFootman = make_minion_card("Goldshire Footman", 1, 1, 2, taunt=True)
+# Minion card GrimscaleOracle (Grimscale Oracle: ALL other Murlocs have +1 Attack.) unimplemented: ("['all other murlocs have +1 attack']",)
+# Minion card HungryCrab (Hungry Crab: Battlecry: Destroy a Murloc and gain +2/+2.) unimplemented: ("['battlecry: destroy a murloc and gain +2/+2']",)
+LeperGnome = make_minion_card("Leper Gnome", 1, 2, 1, deathrattle=deal_damage(2, target="the enemy hero"))
+# Minion card Lightwarden (Lightwarden: Whenever a character is healed, gain +2 Attack.) unimplemented: ("['whenever a character is healed, gain +2 attack']",)
+MurlocRaider = make_minion_card("Murloc Raider", 1, 2, 1)
+# Minion card MurlocTidecaller (Murloc Tidecaller: Whenever a Murloc is summoned, gain +1 Attack.) unimplemented: ("['whenever a murloc is summoned, gain +1 attack']",)
+# Minion card Secretkeeper (Secretkeeper: Whenever a Secret is played, gain +1/+1.) unimplemented: ("['whenever a secret is played, gain +1/+1']",)
+Shieldbearer = make_minion_card("Shieldbearer", 1, 0, 4, taunt=True)
+# Minion card SouthseaDeckhand (Southsea Deckhand: Has Charge while you have a weapon equipped.) unimplemented: ("['has charge while you have a weapon equipped']",)
+StonetuskBoar = make_minion_card("Stonetusk Boar", 1, 1, 1, charge=True)
+# Minion card VoodooDoctor (Voodoo Doctor: Battlecry: Restore 2 Health.) unimplemented: ("['battlecry: restore 2 health']",)
+WorgenInfiltrator = make_minion_card("Worgen Infiltrator", 1, 2, 1, stealth=True)
+YoungDragonhawk = make_minion_card("Young Dragonhawk", 1, 1, 1, windfury=True)
+# Minion card YoungPriestess (Young Priestess: At the end of your turn, give another random friendly minion +1 Health.) unimplemented: ("['at the end of your turn, give another random friendly minion +1 health']",)
+# Minion card AcidicSwampOoze (Acidic Swamp Ooze: Battlecry: Destroy your opponent's weapon.) unimplemented: ('["battlecry: destroy your opponent\'s weapon"]',)
+# Minion card AmaniBerserker (Amani Berserker: Enrage: +3 Attack) unimplemented: ("['enrage: +3 attack']",)
+AncientWatcher = make_minion_card("Ancient Watcher", 2, 4, 5, cant_attack=True)
+BloodfenRaptor = make_minion_card("Bloodfen Raptor", 2, 3, 2)
+BloodmageThalnos = make_minion_card("Bloodmage Thalnos", 2, 1, 1, spell_damage=1, deathrattle=draw_card(1))
+# Minion card BloodsailRaider (Bloodsail Raider: Battlecry: Gain Attack equal to the Attack of your weapon.) unimplemented: ("['battlecry: gain attack equal to the attack of your weapon']",)
+BluegillWarrior = make_minion_card("Bluegill Warrior", 2, 2, 1, charge=True)
+# Minion card CaptainsParrot (Captain's Parrot: Battlecry: Put a random Pirate from your deck into your hand.) unimplemented: ("['battlecry: put a random pirate from your deck into your hand']",)
+# Minion card CrazedAlchemist (Crazed Alchemist: Battlecry: Swap the Attack and Health of a minion.) unimplemented: ("['battlecry: swap the attack and health of a minion']",)
+# Minion card DireWolfAlpha (Dire Wolf Alpha: Adjacent minions have +1 Attack.) unimplemented: ("['adjacent minions have +1 attack']",)
+# Minion card Doomsayer (Doomsayer: At the start of your turn, destroy ALL minions.) unimplemented: ("['at the start of your turn, destroy all minions']",)
+# Minion card FaerieDragon (Faerie Dragon: Can't be targeted by Spells or Hero Powers.) unimplemented: ('["can\'t be targeted by spells or hero powers"]',)
+FrostwolfGrunt = make_minion_card("Frostwolf Grunt", 2, 2, 2, taunt=True)
+# Minion card IronbeakOwl (Ironbeak Owl: Battlecry: Silence a minion.) unimplemented: ("['battlecry: silence a minion']",)
+# Minion card KnifeJuggler (Knife Juggler: After you summon a minion, deal 1 damage to a random enemy.) unimplemented: ("['after you summon a minion, deal 1 damage to a random enemy']",)
+KoboldGeomancer = make_minion_card("Kobold Geomancer", 2, 2, 2, spell_damage=1)
+LootHoarder = make_minion_card("Loot Hoarder", 2, 2, 1, deathrattle=draw_card(1))
+# Minion card LorewalkerCho (Lorewalker Cho: Whenever a player casts a spell, put a copy into the other player's hand.) unimplemented: ('["whenever a player casts a spell, put a copy into the other player\'s hand"]',)
+MadBomber = make_minion_card("Mad Bomber", 2, 3, 2, battlecry=deal_damage(3, split=True, target="all other characters"))
+# Minion card ManaAddict (Mana Addict: Whenever you cast a spell, gain +2 Attack this turn.) unimplemented: ("['whenever you cast a spell, gain +2 attack this turn']",)
+# Minion card ManaWraith (Mana Wraith: ALL minions cost (1) more.) unimplemented: ("['all minions cost (1) more']",)
+# Minion card MasterSwordsmith (Master Swordsmith: At the end of your turn, give another random friendly minion +1 Attack.) unimplemented: ("['at the end of your turn, give another random friendly minion +1 attack']",)
+# Minion card MillhouseManastorm (Millhouse Manastorm: Battlecry: Enemy spells cost (0) next turn.) unimplemented: ("['battlecry: enemy spells cost (0) next turn']",)
+# Minion card MurlocTidehunter (Murloc Tidehunter: Battlecry: Summon a 1/1 Murloc Scout.) unimplemented: ("['battlecry: summon a 1/1 murloc scout']",)
+# Minion card NatPagle (Nat Pagle: At the start of your turn, you have a 50% chance to draw an extra card.) unimplemented: ("['at the start of your turn, you have a 50% chance to draw an extra card']",)
+NoviceEngineer = make_minion_card("Novice Engineer", 2, 1, 1, battlecry=draw_card(1))
+# Minion card PintSizedSummoner (Pint-Sized Summoner: The first minion you play each turn costs (1) less.) unimplemented: ("['the first minion you play each turn costs (1) less']",)
+RiverCrocolisk = make_minion_card("River Crocolisk", 2, 2, 3)
+# Minion card SunfuryProtector (Sunfury Protector: Battlecry: Give adjacent minions Taunt.) unimplemented: ("['battlecry: give adjacent minions taunt']",)
+# Minion card WildPyromancer (Wild Pyromancer: After you cast a spell, deal 1 damage to ALL minions.) unimplemented: ("['after you cast a spell, deal 1 damage to all minions']",)
+# Minion card YouthfulBrewmaster (Youthful Brewmaster: Battlecry: Return a friendly minion from the battlefield to your hand.) unimplemented: ("['battlecry: return a friendly minion from the battlefield to your hand']",)
+# Minion card AcolyteOfPain (Acolyte of Pain: Whenever this minion takes damage, draw a card.) unimplemented: ("['whenever this minion takes damage, draw a card']",)
+# Minion card AlarmOBot (Alarm-o-Bot: At the start of your turn, swap this minion with a random one in your hand.) unimplemented: ("['at the start of your turn, swap this minion with a random one in your hand']",)
+# Minion card ArcaneGolem (Arcane Golem: Charge.  Battlecry: Give your opponent a Mana Crystal.) unimplemented: ("['battlecry: give your opponent a mana crystal']",)
+# Minion card BigGameHunter (Big Game Hunter: Battlecry: Destroy a minion with an Attack of 7 or more.) unimplemented: ("['battlecry: destroy a minion with an attack of 7 or more']",)
+# Minion card BloodKnight (Blood Knight: Battlecry: All minions lose Divine Shield.  Gain +3/+3 for each Shield lost.) unimplemented: ("['battlecry: all minions lose divine shield', 'gain +3/+3 for each shield lost']",)
+# Minion card ColdlightOracle (Coldlight Oracle: Battlecry: Each player draws 2 cards.) unimplemented: ("['battlecry: each player draws 2 cards']",)
+# Minion card ColdlightSeer (Coldlight Seer: Battlecry: Give ALL other Murlocs +2 Health.) unimplemented: ("['battlecry: give all other murlocs +2 health']",)
+DalaranMage = make_minion_card("Dalaran Mage", 3, 1, 4, spell_damage=1)
+Demolisher = make_minion_card("Demolisher", 3, 1, 4, trigger=trigger("at turn_start", is_owner, deal_damage(2, target="a random enemy")))
+# Minion card EarthenRingFarseer (Earthen Ring Farseer: Battlecry: Restore 3 Health.) unimplemented: ("['battlecry: restore 3 health']",)
+# Minion card EmperorCobra (Emperor Cobra: Destroy any minion damaged by this minion.) unimplemented: ("['destroy any minion damaged by this minion']",)
+# Minion card FlesheatingGhoul (Flesheating Ghoul: Whenever a minion dies, gain +1 Attack.) unimplemented: ("['whenever a minion dies, gain +1 attack']",)
+# Minion card HarvestGolem (Harvest Golem: Deathrattle: Summon a 2/1 Damaged Golem.) unimplemented: ("['deathrattle: summon a 2/1 damaged golem']",)
+# Minion card ImpMaster (Imp Master: At the end of your turn, deal 1 damage to this minion and summon a 1/1 Imp.) unimplemented: ("['at the end of your turn, deal 1 damage to this minion and summon a 1/1 imp']",)
+InjuredBlademaster = make_minion_card("Injured Blademaster", 3, 4, 7, battlecry=deal_damage(4, target="himself"))
+IronforgeRifleman = make_minion_card("Ironforge Rifleman", 3, 2, 2, battlecry=deal_damage(1))
+IronfurGrizzly = make_minion_card("Ironfur Grizzly", 3, 3, 3, taunt=True)
+JunglePanther = make_minion_card("Jungle Panther", 3, 4, 2, stealth=True)
+# Minion card KingMukla (King Mukla: Battlecry: Give your opponent 2 Bananas.) unimplemented: ("['battlecry: give your opponent 2 bananas']",)
+MagmaRager = make_minion_card("Magma Rager", 3, 5, 1)
+# Minion card MindControlTech (Mind Control Tech: Battlecry: If your opponent has 4 or more minions, take control of one at random.) unimplemented: ("['battlecry: if your opponent has 4 or more minions, take control of one at random']",)
+# Minion card MurlocWarleader (Murloc Warleader: ALL other Murlocs have +2/+1.) unimplemented: ("['all other murlocs have +2/+1']",)
+# Minion card QuestingAdventurer (Questing Adventurer: Whenever you play a card, gain +1/+1.) unimplemented: ("['whenever you play a card, gain +1/+1']",)
+# Minion card RagingWorgen (Raging Worgen: Enrage: Windfury and +1 Attack) unimplemented: ("['enrage: windfury and +1 attack']",)
+# Minion card RaidLeader (Raid Leader: Your other minions have +1 Attack.) unimplemented: ("['your other minions have +1 attack']",)
+# Minion card RazorfenHunter (Razorfen Hunter: Battlecry: Summon a 1/1 Boar.) unimplemented: ("['battlecry: summon a 1/1 boar']",)
+ScarletCrusader = make_minion_card("Scarlet Crusader", 3, 3, 1, divine_shield=True)
+# Minion card ShatteredSunCleric (Shattered Sun Cleric: Battlecry: Give a friendly minion +1/+1.) unimplemented: ("['battlecry: give a friendly minion +1/+1']",)
+SilverbackPatriarch = make_minion_card("Silverback Patriarch", 3, 1, 4, taunt=True)
+# Minion card SouthseaCaptain (Southsea Captain: Your other Pirates have +1/+1.) unimplemented: ("['your other pirates have +1/+1']",)
+# Minion card TaurenWarrior (Tauren Warrior: Taunt.  Enrage: +3 Attack) unimplemented: ("['enrage: +3 attack']",)
+ThrallmarFarseer = make_minion_card("Thrallmar Farseer", 3, 2, 3, windfury=True)
+# Minion card TinkmasterOverspark (Tinkmaster Overspark: Battlecry: Transform another random minion into a 5/5 Devilsaur or a 1/1 Squirrel.) unimplemented: ("['battlecry: transform another random minion into a 5/5 devilsaur or a 1/1 squirrel']",)
+Wolfrider = make_minion_card("Wolfrider", 3, 3, 1, charge=True)
+# Minion card AncientBrewmaster (Ancient Brewmaster: Battlecry: Return a friendly minion from the battlefield to your hand.) unimplemented: ("['battlecry: return a friendly minion from the battlefield to your hand']",)
+# Minion card AncientMage (Ancient Mage: Battlecry: Give adjacent minions Spell Damage +1.) unimplemented: ("['battlecry: give adjacent minions spell damage +1']",)
+ChillwindYeti = make_minion_card("Chillwind Yeti", 4, 4, 5)
+# Minion card CultMaster (Cult Master: Whenever one of your other minions dies, draw a card.) unimplemented: ("['whenever one of your other minions dies, draw a card']",)
+# Minion card DarkIronDwarf (Dark Iron Dwarf: Battlecry: Give a minion +2 Attack this turn.) unimplemented: ("['battlecry: give a minion +2 attack this turn']",)
+# Minion card DefenderOfArgus (Defender of Argus: Battlecry: Give adjacent minions +1/+1 and Taunt.) unimplemented: ("['battlecry: give adjacent minions +1/+1 and taunt']",)
+# Minion card DragonlingMechanic (Dragonling Mechanic: Battlecry: Summon a 2/1 Mechanical Dragonling.) unimplemented: ("['battlecry: summon a 2/1 mechanical dragonling']",)
+# Minion card DreadCorsair (Dread Corsair: Taunt.  Costs (1) less per Attack of your weapon.) unimplemented: ("['costs (1) less per attack of your weapon']",)
+GnomishInventor = make_minion_card("Gnomish Inventor", 4, 2, 4, battlecry=draw_card(1))
+# Minion card LeeroyJenkins (Leeroy Jenkins: Charge.  Battlecry: Summon two 1/1 Whelps for your opponent.) unimplemented: ("['battlecry: summon two 1/1 whelps for your opponent']",)
+MogushanWarden = make_minion_card("Mogu'shan Warden", 4, 1, 7, taunt=True)
+OasisSnapjaw = make_minion_card("Oasis Snapjaw", 4, 2, 7)
+OgreMagi = make_minion_card("Ogre Magi", 4, 4, 4, spell_damage=1)
+# Minion card OldMurkEye (Old Murk-Eye: Charge.  Has +1 Attack for each other Murloc on the battlefield.) unimplemented: ("['has +1 attack for each other murloc on the battlefield']",)
+SenjinShieldmasta = make_minion_card("Sen'jin Shieldmasta", 4, 3, 5, taunt=True)
+SilvermoonGuardian = make_minion_card("Silvermoon Guardian", 4, 3, 3, divine_shield=True)
+# Minion card Spellbreaker (Spellbreaker: Battlecry: Silence a minion.) unimplemented: ("['battlecry: silence a minion']",)
+StormwindKnight = make_minion_card("Stormwind Knight", 4, 2, 5, charge=True)
+# Minion card TwilightDrake (Twilight Drake: Battlecry: Gain +1 Health for each card in your hand.) unimplemented: ("['battlecry: gain +1 health for each card in your hand']",)
+# Minion card VioletTeacher (Violet Teacher: Whenever you cast a spell, summon a 1/1 Violet Apprentice.) unimplemented: ("['whenever you cast a spell, summon a 1/1 violet apprentice']",)
+Abomination = make_minion_card("Abomination", 5, 4, 4, taunt=True, deathrattle=deal_damage(2, target="all characters"))
+AzureDrake = make_minion_card("Azure Drake", 5, 4, 4, spell_damage=1, battlecry=draw_card(1))
+BootyBayBodyguard = make_minion_card("Booty Bay Bodyguard", 5, 5, 4, taunt=True)
+# Minion card CaptainGreenskin (Captain Greenskin: Battlecry: Give your weapon +1/+1.) unimplemented: ("['battlecry: give your weapon +1/+1']",)
+# Minion card DarkscaleHealer (Darkscale Healer: Battlecry: Restore 2 Health to all friendly characters.) unimplemented: ("['battlecry: restore 2 health to all friendly characters']",)
+# Minion card EliteTaurenChieftain (Elite Tauren Chieftain: Battlecry: Give both players the power to ROCK! (with a Power Chord card)) unimplemented: ("['battlecry: give both players the power to rock! (with a power chord card)']",)
+# Minion card FacelessManipulator (Faceless Manipulator: Battlecry: Choose a minion and become a copy of it.) unimplemented: ("['battlecry: choose a minion and become a copy of it']",)
+FenCreeper = make_minion_card("Fen Creeper", 5, 3, 6, taunt=True)
+# Minion card FrostwolfWarlord (Frostwolf Warlord: Battlecry: Gain +1/+1 for each other friendly minion on the battlefield.) unimplemented: ("['battlecry: gain +1/+1 for each other friendly minion on the battlefield']",)
+# Minion card GadgetzanAuctioneer (Gadgetzan Auctioneer: Whenever you cast a spell, draw a card.) unimplemented: ("['whenever you cast a spell, draw a card']",)
+# Minion card GurubashiBerserker (Gurubashi Berserker: Whenever this minion takes damage, gain +3 Attack.) unimplemented: ("['whenever this minion takes damage, gain +3 attack']",)
+# Minion card HarrisonJones (Harrison Jones: Battlecry: Destroy your opponent's weapon and draw cards equal to its Durability.) unimplemented: ('["battlecry: destroy your opponent\'s weapon and draw cards equal to its durability"]',)
+Nightblade = make_minion_card("Nightblade", 5, 4, 4, battlecry=deal_damage(3, target="the enemy hero"))
+# Minion card SilverHandKnight (Silver Hand Knight: Battlecry: Summon a 2/2 Squire.) unimplemented: ("['battlecry: summon a 2/2 squire']",)
+# Minion card SpitefulSmith (Spiteful Smith: Enrage: Your weapon has +2 Attack.) unimplemented: ("['enrage: your weapon has +2 attack']",)
+# Minion card StampedingKodo (Stampeding Kodo: Battlecry: Destroy a random enemy minion with 2 or less Attack.) unimplemented: ("['battlecry: destroy a random enemy minion with 2 or less attack']",)
+StormpikeCommando = make_minion_card("Stormpike Commando", 5, 4, 2, battlecry=deal_damage(2))
+StranglethornTiger = make_minion_card("Stranglethorn Tiger", 5, 5, 5, stealth=True)
+# Minion card VentureCoMercenary (Venture Co. Mercenary: Your minions cost (3) more.) unimplemented: ("['your minions cost (3) more']",)
+Archmage = make_minion_card("Archmage", 6, 4, 7, spell_damage=1)
+ArgentCommander = make_minion_card("Argent Commander", 6, 4, 2, charge=True, divine_shield=True)
+BoulderfistOgre = make_minion_card("Boulderfist Ogre", 6, 6, 7)
+# Minion card CairneBloodhoof (Cairne Bloodhoof: Deathrattle: Summon a 4/5 Baine Bloodhoof.) unimplemented: ("['deathrattle: summon a 4/5 baine bloodhoof']",)
+# Minion card FrostElemental (Frost Elemental: Battlecry: Freeze a character.) unimplemented: ("['battlecry: freeze a character']",)
+# Minion card GelbinMekkatorque (Gelbin Mekkatorque: Battlecry: Summon an AWESOME invention.) unimplemented: ("['battlecry: summon an awesome invention']",)
+# Minion card Hogger (Hogger: At the end of your turn, summon a 2/2 Gnoll with Taunt.) unimplemented: ("['at the end of your turn, summon a 2/2 gnoll with taunt']",)
+# Minion card IllidanStormrage (Illidan Stormrage: Whenever you play a card, summon a 2/1 Flame of Azzinoth.) unimplemented: ("['whenever you play a card, summon a 2/1 flame of azzinoth']",)
+LordOfTheArena = make_minion_card("Lord of the Arena", 6, 6, 5, taunt=True)
+# Minion card PriestessOfElune (Priestess of Elune: Battlecry: Restore 4 Health to your hero.) unimplemented: ("['battlecry: restore 4 health to your hero']",)
+RecklessRocketeer = make_minion_card("Reckless Rocketeer", 6, 5, 2, charge=True)
+Sunwalker = make_minion_card("Sunwalker", 6, 4, 5, taunt=True, divine_shield=True)
+# Minion card SylvanasWindrunner (Sylvanas Windrunner: Deathrattle: Take control of a random enemy minion.) unimplemented: ("['deathrattle: take control of a random enemy minion']",)
+# Minion card TheBeast (The Beast: Deathrattle: Summon a 3/3 Finkle Einhorn for your opponent.) unimplemented: ("['deathrattle: summon a 3/3 finkle einhorn for your opponent']",)
+# Minion card TheBlackKnight (The Black Knight: Battlecry: Destroy an enemy minion with Taunt.) unimplemented: ("['battlecry: destroy an enemy minion with taunt']",)
+WindfuryHarpy = make_minion_card("Windfury Harpy", 6, 4, 5, windfury=True)
+BaronGeddon = make_minion_card("Baron Geddon", 7, 7, 5, trigger=trigger("at turn_end", is_owner, deal_damage(2, target="all other characters")))
+CoreHound = make_minion_card("Core Hound", 7, 9, 5)
+RavenholdtAssassin = make_minion_card("Ravenholdt Assassin", 7, 7, 5, stealth=True)
+# Minion card StormwindChampion (Stormwind Champion: Your other minions have +1/+1.) unimplemented: ("['your other minions have +1/+1']",)
+WarGolem = make_minion_card("War Golem", 7, 7, 7)
+# Minion card Gruul (Gruul: At the end of each turn, gain +1/+1.) unimplemented: ("['at the end of each turn, gain +1/+1']",)
+RagnarosTheFirelord = make_minion_card("Ragnaros the Firelord", 8, 8, 8, cant_attack=True, trigger=trigger("at turn_end", is_owner, deal_damage(8, target="a random enemy")))
+# Minion card Alexstrasza (Alexstrasza: Battlecry: Set a hero's remaining Health to 15.) unimplemented: ('["battlecry: set a hero\'s remaining health to 15"]',)
+Malygos = make_minion_card("Malygos", 9, 4, 12, spell_damage=5)
+# Minion card Nozdormu (Nozdormu: Players only have 15 seconds to take their turns.) unimplemented: ("['players only have 15 seconds to take their turns']",)
+# Minion card Onyxia (Onyxia: Battlecry: Summon 1/1 Whelps until your side of the battlefield is full.) unimplemented: ("['battlecry: summon 1/1 whelps until your side of the battlefield is full']",)
+# Minion card Ysera (Ysera: At the end of your turn, draw a Dream Card.) unimplemented: ("['at the end of your turn, draw a dream card']",)
+# Minion card Deathwing (Deathwing: Battlecry: Destroy all other minions and discard your hand.) unimplemented: ("['battlecry: destroy all other minions and discard your hand']",)
+# Minion card SeaGiant (Sea Giant: Costs (1) less for each other minion on the battlefield.) unimplemented: ("['costs (1) less for each other minion on the battlefield']",)
+# Minion card MountainGiant (Mountain Giant: Costs (1) less for each other card in your hand.) unimplemented: ("['costs (1) less for each other card in your hand']",)
+# Minion card MoltenGiant (Molten Giant: Costs (1) less for each damage your hero has taken.) unimplemented: ("['costs (1) less for each damage your hero has taken']",)
@@ -0,0 +1,30 @@
+#!/usr/bin/env python3
+
+from ..actions import *
+from .utils import *
+
+# Spell card BlessingOfMight (Blessing of Might: Give a minion +3 Attack.) unimplemented: ("['give a minion +3 attack']",)
+# Spell card BlessingOfWisdom (Blessing of Wisdom: Choose a minion.  Whenever it attacks, draw a card.) unimplemented: ("['choose a minion', 'whenever it attacks, draw a card']",)
+# Spell card EyeForAnEye (Eye for an Eye: Secret: When your hero takes damage, deal that much damage to the enemy hero.) unimplemented: ("['secret: when your hero takes damage, deal that much damage to the enemy hero']",)
+# Spell card HandOfProtection (Hand of Protection: Give a minion Divine Shield.) unimplemented: ("['give a minion divine shield']",)
+# Spell card Humility (Humility: Change a minion's Attack to 1.) unimplemented: ('["change a minion\'s attack to 1"]',)
+LightsJustice = make_weapon_card("Light's Justice", 1, 1, 4)
+# Spell card NobleSacrifice (Noble Sacrifice: Secret: When an enemy attacks, summon a 2/1 Defender as the new target.) unimplemented: ("['secret: when an enemy attacks, summon a 2/1 defender as the new target']",)
+# Spell card Redemption (Redemption: Secret: When one of your minions dies, return it to life with 1 Health.) unimplemented: ("['secret: when one of your minions dies, return it to life with 1 health']",)
+# Spell card Repentance (Repentance: Secret: When your opponent plays a minion, reduce its Health to 1.) unimplemented: ("['secret: when your opponent plays a minion, reduce its health to 1']",)
+# Minion card ArgentProtector (Argent Protector: Battlecry: Give a friendly minion Divine Shield.) unimplemented: ("['battlecry: give a friendly minion divine shield']",)
+# Spell card Equality (Equality: Change the Health of ALL minions to 1.) unimplemented: ("['change the health of all minions to 1']",)
+# Spell card HolyLight (Holy Light: Restore 6 Health.) unimplemented: ("['restore 6 health']",)
+# Minion card AldorPeacekeeper (Aldor Peacekeeper: Battlecry: Change an enemy minion's Attack to 1.) unimplemented: ('["battlecry: change an enemy minion\'s attack to 1"]',)
+# Spell card DivineFavor (Divine Favor: Draw cards until you have as many in hand as your opponent.) unimplemented: ("['draw cards until you have as many in hand as your opponent']",)
+# Weapon card SwordOfJustice (Sword of Justice: Whenever you summon a minion, give it +1/+1 and this loses 1 Durability.) unimplemented: ("['whenever you summon a minion, give it +1/+1 and this loses 1 durability']",)
+# Spell card BlessingOfKings (Blessing of Kings: Give a minion +4/+4. (+4 Attack/+4 Health)) unimplemented: ("['give a minion +4/+4. (+4 attack/+4 health)']",)
+Consecration = make_spell_card("Consecration", 4, deal_damage(2, target="all enemies"))
+HammerOfWrath = make_spell_card("Hammer of Wrath", 4, [deal_damage(3), draw_card(1)])
+# Weapon card TruesilverChampion (Truesilver Champion: Whenever your hero attacks, restore 2 Health to it.) unimplemented: ("['whenever your hero attacks, restore 2 health to it']",)
+# Spell card BlessedChampion (Blessed Champion: Double a minion's Attack.) unimplemented: ('["double a minion\'s attack"]',)
+# Spell card HolyWrath (Holy Wrath: Draw a card and deal damage equal to its cost.) unimplemented: ("['draw a card and deal damage equal to its cost']",)
+AvengingWrath = make_spell_card("Avenging Wrath", 6, deal_damage(8, split=True, target="enemy characters"))
+# Minion card GuardianOfKings (Guardian of Kings: Battlecry: Restore 6 Health to your hero.) unimplemented: ("['battlecry: restore 6 health to your hero']",)
+# Spell card LayOnHands (Lay on Hands: Restore 8 Health.  Draw 3 cards.) unimplemented: ("['restore 8 health']",)
+# Minion card TirionFordring (Tirion Fordring: Divine Shield.  Taunt.  Deathrattle: Equip a 5/3 Ashbringer.) unimplemented: ("['deathrattle: equip a 5/3 ashbringer']",)
@@ -0,0 +1,30 @@
+#!/usr/bin/env python3
+
+from ..actions import *
+from .utils import *
+
+# Spell card CircleOfHealing (Circle of Healing: Restore 4 Health to ALL minions.) unimplemented: ("['restore 4 health to all minions']",)
+# Spell card Silence (Silence: Silence a minion.) unimplemented: ("['silence a minion']",)
+HolySmite = make_spell_card("Holy Smite", 1, deal_damage(2))
+# Spell card InnerFire (Inner Fire: Change a minion's Attack to be equal to its Health.) unimplemented: ('["change a minion\'s attack to be equal to its health"]',)
+# Spell card MindVision (Mind Vision: Put a copy of a random card in your opponent's hand into your hand.) unimplemented: ('["put a copy of a random card in your opponent\'s hand into your hand"]',)
+# Minion card NorthshireCleric (Northshire Cleric: Whenever a minion is healed, draw a card.) unimplemented: ("['whenever a minion is healed, draw a card']",)
+# Spell card PowerWordShield (Power Word: Shield: Give a minion +2 Health.  Draw a card.) unimplemented: ("['give a minion +2 health']",)
+# Spell card DivineSpirit (Divine Spirit: Double a minion's Health.) unimplemented: ('["double a minion\'s health"]',)
+# Minion card Lightwell (Lightwell: At the start of your turn, restore 3 Health to a damaged friendly character.) unimplemented: ("['at the start of your turn, restore 3 health to a damaged friendly character']",)
+MindBlast = make_spell_card("Mind Blast", 2, deal_damage(5, target="the enemy hero"))
+# Spell card ShadowWordPain (Shadow Word: Pain: Destroy a minion with 3 or less Attack.) unimplemented: ("['destroy a minion with 3 or less attack']",)
+# Spell card ShadowWordDeath (Shadow Word: Death: Destroy a minion with an Attack of 5 or more.) unimplemented: ("['destroy a minion with an attack of 5 or more']",)
+# Spell card Shadowform (Shadowform: Your Hero Power becomes 'Deal 2 damage'.  If already in Shadowform: 3 damage.) unimplemented: ('["your hero power becomes \'deal 2 damage\'", \'if already in shadowform: 3 damage\']',)
+# Spell card Thoughtsteal (Thoughtsteal: Copy 2 cards from your opponent's deck and put them into your hand.) unimplemented: ('["copy 2 cards from your opponent\'s deck and put them into your hand"]',)
+# Minion card AuchenaiSoulpriest (Auchenai Soulpriest: Your cards and powers that restore Health now deal damage instead.) unimplemented: ("['your cards and powers that restore health now deal damage instead']",)
+# Minion card Lightspawn (Lightspawn: This minion's Attack is always equal to its Health.) unimplemented: ('["this minion\'s attack is always equal to its health"]',)
+# Spell card MassDispel (Mass Dispel: Silence all enemy minions.  Draw a card.) unimplemented: ("['silence all enemy minions']",)
+# Spell card Mindgames (Mindgames: Put a copy of a random minion from your opponent's deck into the battlefield.) unimplemented: ('["put a copy of a random minion from your opponent\'s deck into the battlefield"]',)
+# Spell card ShadowMadness (Shadow Madness: Gain control of an enemy minion with 3 or less Attack until end of turn.) unimplemented: ("['gain control of an enemy minion with 3 or less attack until end of turn']",)
+# Spell card HolyNova (Holy Nova: Deal 2 damage to all enemies.  Restore 2 Health to all friendly characters.) unimplemented: ("['restore 2 health to all friendly characters']",)
+# Minion card CabalShadowPriest (Cabal Shadow Priest: Battlecry: Take control of an enemy minion that has 2 or less Attack.) unimplemented: ("['battlecry: take control of an enemy minion that has 2 or less attack']",)
+# Spell card HolyFire (Holy Fire: Deal 5 damage.  Restore 5 Health to your hero.) unimplemented: ("['restore 5 health to your hero']",)
+# Minion card TempleEnforcer (Temple Enforcer: Battlecry: Give a friendly minion +3 Health.) unimplemented: ("['battlecry: give a friendly minion +3 health']",)
+# Minion card ProphetVelen (Prophet Velen: Double the damage and healing of your spells and Hero Power.) unimplemented: ("['double the damage and healing of your spells and hero power']",)
+# Spell card MindControl (Mind Control: Take control of an enemy minion.) unimplemented: ("['take control of an enemy minion']",)
@@ -0,0 +1,30 @@
+#!/usr/bin/env python3
+
+from ..actions import *
+from .utils import *
+
+Backstab = make_spell_card("Backstab", 0, deal_damage(2, target="an undamaged minion"))
+# Spell card Preparation (Preparation: The next spell you cast this turn costs (3) less.) unimplemented: ("['the next spell you cast this turn costs (3) less']",)
+# Spell card Shadowstep (Shadowstep: Return a friendly minion to your hand.  It costs (2) less.) unimplemented: ("['return a friendly minion to your hand', 'it costs (2) less']",)
+# Spell card ColdBlood (Cold Blood: Give a minion +2 Attack.  Combo: +4 Attack instead.) unimplemented: ("['give a minion +2 attack', 'combo: +4 attack instead']",)
+# Spell card Conceal (Conceal: Give your minions Stealth until your next turn.) unimplemented: ("['give your minions stealth until your next turn']",)
+# Spell card DeadlyPoison (Deadly Poison: Give your weapon +2 Attack.) unimplemented: ("['give your weapon +2 attack']",)
+SinisterStrike = make_spell_card("Sinister Strike", 1, deal_damage(3, target="the enemy hero"))
+# Spell card Betrayal (Betrayal: Force an enemy minion to deal its damage to the minions next to it.) unimplemented: ("['force an enemy minion to deal its damage to the minions next to it']",)
+# Spell card BladeFlurry (Blade Flurry: Destroy your weapon and deal its damage to all enemies.) unimplemented: ("['destroy your weapon and deal its damage to all enemies']",)
+# Minion card DefiasRingleader (Defias Ringleader: Combo: Summon a 2/1 Defias Bandit.) unimplemented: ("['combo: summon a 2/1 defias bandit']",)
+# Spell card Eviscerate (Eviscerate: Deal 2 damage.  Combo: Deal 4 damage instead.) unimplemented: ("['combo: deal 4 damage instead']",)
+# Minion card PatientAssassin (Patient Assassin: Stealth.  Destroy any minion damaged by this minion.) unimplemented: ("['destroy any minion damaged by this minion']",)
+# Spell card Sap (Sap: Return an enemy minion to your opponent's hand.) unimplemented: ('["return an enemy minion to your opponent\'s hand"]',)
+Shiv = make_spell_card("Shiv", 2, [deal_damage(1), draw_card(1)])
+# Minion card EdwinVanCleef (Edwin VanCleef: Combo: Gain +2/+2 for each card played earlier this turn.) unimplemented: ("['combo: gain +2/+2 for each card played earlier this turn']",)
+FanOfKnives = make_spell_card("Fan of Knives", 3, [deal_damage(1, target="all enemy minions"), draw_card(1)])
+# Spell card Headcrack (Headcrack: Deal 2 damage to the enemy hero.  Combo: Return this to your hand next turn.) unimplemented: ("['combo: return this to your hand next turn']",)
+# Weapon card PerditionsBlade (Perdition's Blade: Battlecry: Deal 1 damage. Combo: Deal 2 instead.) unimplemented: ("['battlecry: deal 1 damage. combo: deal 2 instead']",)
+# Minion card SIAgent (SI:7 Agent: Combo: Deal 2 damage.) unimplemented: ("['combo: deal 2 damage']",)
+# Minion card MasterOfDisguise (Master of Disguise: Battlecry: Give a friendly minion Stealth.) unimplemented: ("['battlecry: give a friendly minion stealth']",)
+AssassinsBlade = make_weapon_card("Assassin's Blade", 5, 3, 4)
+# Spell card Assassinate (Assassinate: Destroy an enemy minion.) unimplemented: ("['destroy an enemy minion']",)
+# Minion card Kidnapper (Kidnapper: Combo: Return a minion to its owner's hand.) unimplemented: ('["combo: return a minion to its owner\'s hand"]',)
+# Spell card Vanish (Vanish: Return all minions to their owner's hand.) unimplemented: ('["return all minions to their owner\'s hand"]',)
+Sprint = make_spell_card("Sprint", 7, draw_card(4))
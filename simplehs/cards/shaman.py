@@ -0,0 +1,30 @@
+#!/usr/bin/env python3
+
+from ..actions import *
+from .utils import *
+
+# Spell card AncestralHealing (Ancestral Healing: Restore a minion to full Health and give it Taunt.) unimplemented: ("['restore a minion to full health and give it taunt']",)
+# Spell card TotemicMight (Totemic Might: Give your Totems +2 Health.) unimplemented: ("['give your totems +2 health']",)
+# Minion card DustDevil (Dust Devil: Windfury.  Overload: (2)) unimplemented: ("['overload: (2)']",)
+# Spell card EarthShock (Earth Shock: Silence a minion, then deal 1 damage to it.) unimplemented: ("['silence a minion, then deal 1 damage to it']",)
+# Spell card ForkedLightning (Forked Lightning: Deal 2 damage to 2 random enemy minions.  Overload: (2)) unimplemented: ("['overload: (2)']",)
+# Spell card FrostShock (Frost Shock: Deal 1 damage to an enemy character and Freeze it.) unimplemented: ("['deal 1 damage to an enemy character and freeze it']",)
+# Spell card LightningBolt (Lightning Bolt: Deal 3 damage.  Overload: (1)) unimplemented: ("['overload: (1)']",)
+# Spell card RockbiterWeapon (Rockbiter Weapon: Give a friendly character +3 Attack this turn.) unimplemented: ("['give a friendly character +3 attack this turn']",)
+# Spell card AncestralSpirit (Ancestral Spirit: Choose a minion.  When that minion is destroyed, return it to the battlefield.) unimplemented: ("['choose a minion', 'when that minion is destroyed, return it to the battlefield']",)
+# Minion card FlametongueTotem (Flametongue Totem: Adjacent minions have +2 Attack.) unimplemented: ("['adjacent minions have +2 attack']",)
+# Weapon card StormforgedAxe (Stormforged Axe: Overload: (1)) unimplemented: ("['overload: (1)']",)
+# Spell card Windfury (Windfury: Give a minion Windfury.) unimplemented: ("['give a minion windfury']",)
+# Spell card FarSight (Far Sight: Draw a card.  That card costs (3) less.) unimplemented: ("['that card costs (3) less']",)
+# Spell card FeralSpirit (Feral Spirit: Summon two 2/3 Spirit Wolves with Taunt.  Overload: (2)) unimplemented: ("['summon two 2/3 spirit wolves with taunt', 'overload: (2)']",)
+# Spell card Hex (Hex: Transform a minion into a 0/1 Frog with Taunt.) unimplemented: ("['transform a minion into a 0/1 frog with taunt']",)
+# Spell card LavaBurst (Lava Burst: Deal 5 damage.  Overload: (2)) unimplemented: ("['overload: (2)']",)
+# Spell card LightningStorm (Lightning Storm: Deal 2-3 damage to all enemy minions.  Overload: (2)) unimplemented: ("['deal 2-3 damage to all enemy minions', 'overload: (2)']",)
+ManaTideTotem = make_minion_card("Mana Tide Totem", 3, 0, 3, trigger=trigger("at turn_end", is_owner, draw_card(1)))
+# Minion card UnboundElemental (Unbound Elemental: Whenever you play a card with Overload, gain +1/+1.) unimplemented: ("['whenever you play a card with overload, gain +1/+1']",)
+# Minion card Windspeaker (Windspeaker: Battlecry: Give a friendly minion Windfury.) unimplemented: ("['battlecry: give a friendly minion windfury']",)
+# Spell card Bloodlust (Bloodlust: Give your minions +3 Attack this turn.) unimplemented: ("['give your minions +3 attack this turn']",)
+# Weapon card Doomhammer (Doomhammer: Windfury, Overload: (2)) unimplemented: ("['overload: (2)']",)
+# Minion card EarthElemental (Earth Elemental: Taunt.  Overload: (3)) unimplemented: ("['overload: (3)']",)
+FireElemental = make_minion_card("Fire Elemental", 6, 6, 5, battlecry=deal_damage(3))
+AlAkirTheWindlord = make_minion_card("Al'Akir the Windlord", 8, 3, 5, windfury=True, charge=True, divine_shield=True, taunt=True)
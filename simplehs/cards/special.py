@@ -1,5 +1,8 @@
 #!/usr/bin/env python3
 
-from .utils import make_spell_card
+from ..actions import *
+from .utils import *
 
-TheCoin = make_spell_card("The Coin", 0, 'gain_mana(1)')
+__all__ = ['TheCoin']
+
+TheCoin = make_spell_card("The Coin", 0, gain_mana(1))
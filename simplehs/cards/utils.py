@@ -1,12 +1,8 @@
 #!/usr/bin/env python3
 
-from ..utils import get_class
-from ..utils import join_args
 from ..utils import pascalize
 from ..base import MinionCard
 from ..base import SpellCard
-from ..base import WeaponCard
-from ..actions import *
 
 __all__ = [
     'make_minion_card',
@@ -15,39 +11,30 @@ __all__ = [
 ]
 
 
-_MINION_CARD_CLASS_TEMPLATE = """\
-class {class_name}(MinionCard):
-
-    def __init__(self):
-        super().__init__("{name}", {cost}, {attack}, {health}{abilities})
-"""
-
 def make_minion_card(name, cost, attack, health, **kwargs):
-    class_name = pascalize(name)
-    abilities = ', ' + join_args(kwargs)
-    class_definition = _MINION_CARD_CLASS_TEMPLATE.format(**locals())
-    namespace = dict(globals())
-    exec(class_definition, namespace)
-    class_ = namespace[class_name]
-    return class_
-
-
-_SPELL_CARD_CLASS_TEMPLATE = """\
-class {class_name}(SpellCard):
-
     def __init__(self):
-        super().__init__("{name}", {cost}, {effect}{abilities})
-"""
+        MinionCard.__init__(self, name, cost, attack, health, **kwargs)
+    return _make_card_class(MinionCard, name, __init__)
+
 
 def make_spell_card(name, cost, effect, **kwargs):
-    class_name = pascalize(name)
-    abilities = ', ' + join_args(kwargs)
-    class_definition = _SPELL_CARD_CLASS_TEMPLATE.format(**locals())
-    namespace = dict(globals())
-    exec(class_definition, namespace)
-    class_ = namespace[class_name]
-    return class_
+    def __init__(self):
+        SpellCard.__init__(self, name, cost, effect, **kwargs)
+    return _make_card_class(SpellCard, name, __init__)
 
 
 def make_weapon_card(name, cost, attack, durability, **kwargs):
     pass
+
+
+def _make_card_class(base_class, name, init):
+    class_name = pascalize(name)
+    # Pickled by name, through the card registry (see cards)
+    namespace = {
+        '__module__': __name__.rpartition('.')[0],
+        '__qualname__': class_name,
+        '__doc__': name,
+        '__slots__': (),
+        '__init__': init,
+    }
+    return type(class_name, (base_class,), namespace)
@@ -0,0 +1,30 @@
+#!/usr/bin/env python3
+
+from ..actions import *
+from .utils import *
+
+# Spell card SacrificialPact (Sacrificial Pact: Destroy a Demon.  Restore 5 Health to your hero.) unimplemented: ("['destroy a demon', 'restore 5 health to your hero']",)
+# Spell card Soulfire (Soulfire: Deal 4 damage.  Discard a random card.) unimplemented: ("['discard a random card']",)
+# Minion card BloodImp (Blood Imp: Stealth.  At the end of your turn, give another random friendly minion +1 Health.) unimplemented: ("['at the end of your turn, give another random friendly minion +1 health']",)
+# Spell card Corruption (Corruption: Choose an enemy minion.  At the start of your turn, destroy it.) unimplemented: ("['choose an enemy minion', 'at the start of your turn, destroy it']",)
+FlameImp = make_minion_card("Flame Imp", 1, 3, 2, battlecry=deal_damage(3, target="your hero"))
+# Spell card MortalCoil (Mortal Coil: Deal 1 damage to a minion.  If that kills it, draw a card.) unimplemented: ("['if that kills it, draw a card']",)
+# Spell card PowerOverwhelming (Power Overwhelming: Give a friendly minion +4/+4 until end of turn.  Then, it dies.  Horribly.) unimplemented: ("['give a friendly minion +4/+4 until end of turn', 'then, it dies', 'horribly']",)
+Voidwalker = make_minion_card("Voidwalker", 1, 1, 3, taunt=True)
+# Spell card Demonfire (Demonfire: Deal 2 damage to a minion.  If it's a friendly Demon, give it +2/+2 instead.) unimplemented: ('["if it\'s a friendly demon, give it +2/+2 instead"]',)
+# Minion card Succubus (Succubus: Battlecry: Discard a random card.) unimplemented: ("['battlecry: discard a random card']",)
+# Spell card DrainLife (Drain Life: Deal 2 damage.  Restore 2 Health to your hero.) unimplemented: ("['restore 2 health to your hero']",)
+# Minion card Felguard (Felguard: Taunt.  Battlecry: Destroy one of your Mana Crystals.) unimplemented: ("['battlecry: destroy one of your mana crystals']",)
+# Spell card SenseDemons (Sense Demons: Put 2 random Demons from your deck into your hand.) unimplemented: ("['put 2 random demons from your deck into your hand']",)
+ShadowBolt = make_spell_card("Shadow Bolt", 3, deal_damage(4, target="a minion"))
+# Minion card VoidTerror (Void Terror: Battlecry: Destroy the minions on either side of this minion and gain their Attack and Health.) unimplemented: ("['battlecry: destroy the minions on either side of this minion and gain their attack and health']",)
+Hellfire = make_spell_card("Hellfire", 4, deal_damage(3, target="all characters"))
+PitLord = make_minion_card("Pit Lord", 4, 5, 6, battlecry=deal_damage(5, target="your hero"))
+# Spell card Shadowflame (Shadowflame: Destroy a friendly minion and deal its Attack damage to all enemy minions.) unimplemented: ("['destroy a friendly minion and deal its attack damage to all enemy minions']",)
+# Minion card SummoningPortal (Summoning Portal: Your minions cost (2) less, but not less than (1).) unimplemented: ("['your minions cost (2) less, but not less than (1)']",)
+# Spell card BaneOfDoom (Bane of Doom: Deal 2 damage to a character.  If that kills it, summon a random Demon.) unimplemented: ("['if that kills it, summon a random demon']",)
+# Minion card Doomguard (Doomguard: Charge.  Battlecry: Discard two random cards.) unimplemented: ("['battlecry: discard two random cards']",)
+DreadInfernal = make_minion_card("Dread Infernal", 6, 6, 6, battlecry=deal_damage(1, target="all other characters"))
+# Spell card SiphonSoul (Siphon Soul: Destroy a minion.  Restore 3 Health to your hero.) unimplemented: ("['destroy a minion', 'restore 3 health to your hero']",)
+# Spell card TwistingNether (Twisting Nether: Destroy all minions.) unimplemented: ("['destroy all minions']",)
+# Minion card LordJaraxxus (Lord Jaraxxus: Battlecry: Destroy your hero and replace him with Lord Jaraxxus.) unimplemented: ("['battlecry: destroy your hero and replace him with lord jaraxxus']",)
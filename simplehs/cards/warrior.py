@@ -0,0 +1,30 @@
+#!/usr/bin/env python3
+
+from ..actions import *
+from .utils import *
+
+# Spell card InnerRage (Inner Rage: Deal 1 damage to a minion and give it +2 Attack.) unimplemented: ("['deal 1 damage to a minion and give it +2 attack']",)
+# Spell card Execute (Execute: Destroy a damaged enemy minion.) unimplemented: ("['destroy a damaged enemy minion']",)
+ShieldSlam = make_spell_card("Shield Slam", 1, deal_damage(1, target="a minion for each armor you have"))
+# Spell card Upgrade (Upgrade!: If you have a weapon, give it +1/+1.  Otherwise equip a 1/3 weapon.) unimplemented: ("['if you have a weapon, give it +1/+1', 'otherwise equip a 1/3 weapon']",)
+Whirlwind = make_spell_card("Whirlwind", 1, deal_damage(1, target="all minions"))
+# Minion card Armorsmith (Armorsmith: Whenever a friendly minion takes damage, gain 1 Armor.) unimplemented: ("['whenever a friendly minion takes damage, gain 1 armor']",)
+# Spell card BattleRage (Battle Rage: Draw a card for each damaged friendly character.) unimplemented: ("['draw a card for each damaged friendly character']",)
+Cleave = make_spell_card("Cleave", 2, deal_damage(2, target="two random enemy minions"))
+# Spell card CommandingShout (Commanding Shout: Your minions can't be reduced below 1 Health this turn.  Draw a card.) unimplemented: ('["your minions can\'t be reduced below 1 health this turn"]',)
+# Minion card CruelTaskmaster (Cruel Taskmaster: Battlecry: Deal 1 damage to a minion and give it +2 Attack.) unimplemented: ("['battlecry: deal 1 damage to a minion and give it +2 attack']",)
+FieryWarAxe = make_weapon_card("Fiery War Axe", 2, 3, 2)
+# Spell card HeroicStrike (Heroic Strike: Give your hero +4 Attack this turn.) unimplemented: ("['give your hero +4 attack this turn']",)
+# Spell card Rampage (Rampage: Give a damaged minion +3/+3.) unimplemented: ("['give a damaged minion +3/+3']",)
+# Spell card Slam (Slam: Deal 2 damage to a minion.  If it survives, draw a card.) unimplemented: ("['if it survives, draw a card']",)
+# Spell card Charge (Charge: Give a friendly minion +2 Attack and Charge.) unimplemented: ("['give a friendly minion +2 attack and charge']",)
+# Minion card FrothingBerserker (Frothing Berserker: Whenever a minion takes damage, gain +1 Attack.) unimplemented: ("['whenever a minion takes damage, gain +1 attack']",)
+# Spell card ShieldBlock (Shield Block: Gain 5 Armor.  Draw a card.) unimplemented: ("['gain 5 armor']",)
+# Minion card WarsongCommander (Warsong Commander: Whenever you summon a minion with 3 or less Attack, give it Charge.) unimplemented: ("['whenever you summon a minion with 3 or less attack, give it charge']",)
+# Minion card ArathiWeaponsmith (Arathi Weaponsmith: Battlecry: Equip a 2/2 weapon.) unimplemented: ("['battlecry: equip a 2/2 weapon']",)
+KorkronElite = make_minion_card("Kor'kron Elite", 4, 4, 3, charge=True)
+# Spell card MortalStrike (Mortal Strike: Deal 4 damage.  If you have 12 or less Health, deal 6 instead.) unimplemented: ("['if you have 12 or less health, deal 6 instead']",)
+ArcaniteReaper = make_weapon_card("Arcanite Reaper", 5, 5, 2)
+# Spell card Brawl (Brawl: Destroy all minions except one. (chosen randomly)) unimplemented: ("['destroy all minions except one. (chosen randomly)']",)
+# Weapon card Gorehowl (Gorehowl: Attacking a minion costs 1 Attack instead of 1 Durability.) unimplemented: ("['attacking a minion costs 1 attack instead of 1 durability']",)
+# Minion card GrommashHellscream (Grommash Hellscream: Charge.  Enrage: +6 Attack) unimplemented: ("['enrage: +6 attack']",)
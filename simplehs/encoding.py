@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+# Board state encoding for learning agents (requires NumPy)
+
+import numpy
+
+from .base import Character
+
+MAX_HAND_SIZE = 10
+MAX_MINIONS = 7
+
+# Features of a minion: whether the slot is filled, its stats and abilities
+MINION_FEATURES = 4 + 10
+# Features of a side: hero, mana and deck, hand costs and minions
+SIDE_FEATURES = 3 + 5 + MAX_HAND_SIZE + MAX_MINIONS * MINION_FEATURES
+# Features of a game: turn number, whose turn, then both sides
+FEATURES = 2 + 2 * SIDE_FEATURES
+
+DTYPE = numpy.float32
+
+# Bits of the flag abilities of a character, in the order of the features
+FLAG_BITS = numpy.array([flag._bit for flag in (
+    Character._sleeping, Character._cant_attack, Character._charge,
+    Character._divine_shield, Character._stealth, Character._taunt,
+    Character._windfury)])
+SLEEPING, CHARGE, STEALTH, TAUNT = 0, 2, 4, 5
+
+
+def encode(game, player, out=None):
+    """Encode the board as a feature vector from the view of a player.
+
+    The vector starts with the turn number and whether it is the player's
+    turn, followed by the player's side and the opponent's side.  A side
+    holds the hero (health, armor, attack), mana, full mana, deck size,
+    fatigue and hand size, the costs of the first MAX_HAND_SIZE cards in
+    hand (-1 for empty slots and for the opponent's hidden cards), and for
+    each battlefield slot whether it is filled, attack, health, full health
+    and the abilities (sleeping, can't attack, charge, divine shield,
+    stealth, taunt, windfury, spell damage, deathrattle, trigger).
+
+    If out is given, the features are written into it.
+    """
+
+    if out is None:
+        out = numpy.empty(FEATURES, dtype=DTYPE)
+    out[0] = game.turn_num or 0
+    out[1] = game.who is player
+    _encode_side(player, out[2:2 + SIDE_FEATURES], True)
+    _encode_side(player.opponent, out[2 + SIDE_FEATURES:FEATURES], False)
+    return out
+
+
+def encode_batch(games, players, out=None):
+    """Encode the boards of games from the views of players into a matrix.
+
+    If out is given, each row of it is written in place; it may have more
+    rows than games, to be reused across batches of varying sizes.
+    """
+
+    if out is None:
+        out = numpy.empty((len(games), FEATURES), dtype=DTYPE)
+    for row, (game, player) in enumerate(zip(games, players)):
+        encode(game, player, out[row])
+    return out
+
+
+def _encode_side(player, out, visible):
+    hero = player.hero
+    out[:8] = (hero.health, hero.armor, hero.attack, player.mana, player.full_mana,
+               player.deck.size, player.deck.fatigue, player.hand.size)
+    costs = out[8:8 + MAX_HAND_SIZE]
+    costs.fill(-1)
+    if visible:
+        hand = player.hand[:MAX_HAND_SIZE]
+        costs[:len(hand)] = [card.cost for card in hand]
+    minions = out[8 + MAX_HAND_SIZE:].reshape(MAX_MINIONS, MINION_FEATURES)
+    minions.fill(0)
+    battlefield = player.battlefield
+    if not battlefield:
+        return
+    # One row of raw fields per minion, then the columns are derived at once
+    fields = numpy.array([(minion.attack, minion.health, minion.full_health, minion._flags,
+                           minion._spell_damage, minion.deathrattle is not None,
+                           minion.trigger is not None) for minion in battlefield])
+    rows = minions[:len(fields)]
+    rows[:, 0] = 1
+    rows[:, 1:4] = fields[:, 0:3]
+    flags = (fields[:, 3:4] & FLAG_BITS) != 0
+    flags[:, SLEEPING] &= ~flags[:, CHARGE]
+    flags[:, TAUNT] &= ~flags[:, STEALTH]
+    rows[:, 4:11] = flags
+    rows[:, 11:14] = fields[:, 4:7]
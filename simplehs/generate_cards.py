@@ -1,15 +1,29 @@
 #!/usr/bin/env python3
 
+import argparse
 import collections
+import hashlib
 import io
 import json
+import multiprocessing
+import os
 import re
+import subprocess
 import sys
 
-from utils import Dict
-from utils import pascalize
+try:
+    from .utils import Dict
+    from .utils import pascalize
+except ImportError:  # Run as a script
+    from utils import Dict
+    from utils import pascalize
 
 
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+CARDS_JSON_PATH = os.path.join(BASE_DIR, 'data', 'cards.json')
+CARDS_DIR = os.path.join(BASE_DIR, 'cards')
+CACHE_PATH = os.path.join(CARDS_DIR, '.generate_cards_cache.json')
+
 RARITY_CODE = {
     0: 'free',
     1: 'common',
@@ -78,342 +92,308 @@ def segment(text):
     return pieces
 
 
-MATCHERS = []
-
-def matcher(func):
-    """A decorator which indicates a description matcher."""
-    MATCHERS.append(func)
-    return func
-
-@matcher
-def taunt(text):
-    if text == 'taunt':
-        return ('taunt', True)
-
-@matcher
-def charge(text):
-    if text == 'charge':
-        return ('charge', True)
-
-@matcher
-def windfury(text):
-    if text == 'windfury':
-        return ('windfury', True)
-
-@matcher
-def divine_shield(text):
-    if text == 'divine shield':
-        return ('divine_shield', True)
-
-@matcher
-def stealth(text):
-    if text == 'stealth':
-        return ('stealth', True)
-
-@matcher
-def cant_attack(text):
-    if text == "can't attack":
-        return ('cant_attack', True)
-
-@matcher
-def spell_damage(text):
-    match = re.match(r'^spell damage \+(?P<spell_damage>\d+)$', text)
-    if match:
-        spell_damage = int(match.group('spell_damage'))
-        return ('spell_damage', spell_damage)
-
-#@matcher
-def overload(text):
-    match = re.match(r'^overload: \((?P<overload>\d+)\)$', text)
-    if match:
-        return ('overload', match.group('overload'))
-
-@matcher
-def battlecry(text):
-    if text.startswith('battlecry: '):
-        result = process(text[len('battlecry: '):])
-        if result is not None:
-            return ('battlecry', result[1])
-
-@matcher
-def deathrattle(text):
-    if text.startswith('deathrattle: '):
-        result = process(text[len('deathrattle: '):])
-        if result is not None:
-            return ('deathrattle', result[1])
-
-#@matcher
-def enrage(text):
-    if text.startswith('enrage: '):
-        match = re.match(r'^enrage: \+(?P<amount>\d+) attack$', text)
-        if match:
-            amount = match.group('amount')
-            return ('enrage', 'add_enrage_attck({amount})'.format(**locals()))
-
-#@matcher
-def secret(text):
-    if text.startswith('secret: '):
-        pass  # TODO
-
-#@matcher
-def combo(text):
-    if text.startswith('combo: '):
-        pass  # TODO
-
-#@matcher
-def choose_one(text):
-    if text.startswith('choose one - '):
-        pass  # TODO
-
-@matcher
-def trigger(text):
-    match = re.match(r'^(?P<timing>at|when(ever)?|after) (?P<condition>.*?), (?P<action>.*)$', text)
-    if match:
-        timing = match.group('timing')
-        timing = 'when' if timing == 'whenever' else timing  # XXX: when == before?
-        if timing != 'at':  # XXX: 'at' this time
-            return
-        condition = match.group('condition')
-        if condition == 'the start of your turn':
-            timing += ' turn_start'
-            filter = 'is_owner'
-        elif condition == 'the end of your turn':
-            timing += ' turn_end'
-            filter = 'is_owner'
+# A description piece is parsed by a grammar of rules, each of which is a
+# regular expression and a function building an effect node of its match.
+# The rules are combined into one alternation, so a piece is classified in a
+# single pass; the first rule (in order of definition) which matches wins.
+#
+# Effect nodes are Dicts: an ability (kind='ability', name, value), an action
+# call (kind='action', name, args, kwargs) or a name (kind='name', id).  A
+# list of actions is a sequence of actions.
+
+RULES = []
+
+def rule(pattern):
+    """A decorator which indicates a description rule of a pattern."""
+    def decorator(func):
+        RULES.append((pattern, func))
+        return func
+    return decorator
+
+def ability_node(name, value):
+    return Dict(kind='ability', name=name, value=value)
+
+def action_node(name, *args, **kwargs):
+    return Dict(kind='action', name=name, args=args, kwargs=kwargs)
+
+def name_node(id):
+    return Dict(kind='name', id=id)
+
+def is_action(node):
+    return type(node) is list or (node is not None and node.kind == 'action')
+
+@rule(r"(?P<name>taunt|charge|windfury|divine shield|stealth|can't attack)")
+def keyword(text, name):
+    return ability_node(name.replace("can't", 'cant').replace(' ', '_'), True)
+
+@rule(r'spell damage \+(?P<spell_damage>\d+)')
+def spell_damage(text, spell_damage):
+    return ability_node('spell_damage', int(spell_damage))
+
+#@rule(r'overload: \((?P<overload>\d+)\)')
+def overload(text, overload):
+    return ability_node('overload', int(overload))
+
+@rule(r'battlecry: (?P<action>.*)')
+def battlecry(text, action):
+    node = parse_piece(action)
+    if is_action(node):
+        return ability_node('battlecry', node)
+
+@rule(r'deathrattle: (?P<action>.*)')
+def deathrattle(text, action):
+    node = parse_piece(action)
+    if is_action(node):
+        return ability_node('deathrattle', node)
+
+#@rule(r'enrage: \+(?P<amount>\d+) attack')
+def enrage(text, amount):
+    return ability_node('enrage', action_node('add_enrage_attck', int(amount)))
+
+#@rule(r'secret: (?P<action>.*)')
+def secret(text, action):
+    pass  # TODO
+
+#@rule(r'combo: (?P<action>.*)')
+def combo(text, action):
+    pass  # TODO
+
+#@rule(r'choose one - (?P<choices>.*)')
+def choose_one(text, choices):
+    pass  # TODO
+
+@rule(r'(?P<timing>at|when(?:ever)?|after) (?P<condition>.*?), (?P<action>.*)')
+def trigger(text, timing, condition, action):
+    timing = 'when' if timing == 'whenever' else timing  # XXX: when == before?
+    if timing != 'at':  # XXX: 'at' this time
+        return
+    if condition == 'the start of your turn':
+        timing += ' turn_start'
+        filter = 'is_owner'
+    elif condition == 'the end of your turn':
+        timing += ' turn_end'
+        filter = 'is_owner'
+    else:
+        return
+    node = parse_piece(action)
+    if is_action(node):
+        return ability_node('trigger', action_node('trigger', timing, name_node(filter), node))
+
+#@rule(r'if (?P<condition>.*?), (?P<action>.*)')
+def if_(text, condition, action):
+    pass  # TODO
+
+@rule(r'draw (?:a card|(?P<quantity>\d+) cards)')
+def draw_card(text, quantity):
+    # XXX: Dream card disabled
+    return action_node('draw_card', int(quantity or 1))
+
+#@rule(r'discard (?P<quantity>a|two) random cards?')
+def discard_card(text, quantity):
+    return action_node('discard_card', 1 if quantity == 'a' else 2)
+
+#@rule(r'put (?P<what>.*?)(?: (?:from|in) (?P<source>.*?))? into (?P<target>.*?)')
+def put(text, what, source, target):
+    return action_node('put', what, from_=source, to=target)
+
+DEAL_DAMAGE_TO = re.compile(r'deal (?P<damage>\d+) damage to (?P<target>.*)')
+DAMAGE_TO = re.compile(r'(?P<damage>\d+) damage to (?P<target>.*)')
+
+@rule(r'deal (?P<damage>\d+) damage(?: (?:to|randomly (?P<split>split) (?:between|among)) (?P<target>.*))?')
+def deal_damage(text, damage, split, target):
+    if target is None:
+        return action_node('deal_damage', int(damage))
+    parts = text.split(' and ')
+    if len(parts) == 1:
+        if not split:
+            return action_node('deal_damage', int(damage), target=target)
         else:
-            return
-        action = match.group('action')
-        action = process(action)
-        if action is not None:
-            code = 'trigger("{timing}", {filter}, {action})'.format(
-                timing=timing,
-                filter=filter,
-                action=action[1],
-            )
-            return ('trigger', code)
-
-#@matcher
-def if_(text):
-    match = re.match(r'^if (?P<condition>.*?), (?P<action>.*)$', text)
-    if match:
-        condition = match.group('condition')
-        action = match.group('action')
-        action = process(action)
-        if action is not None:
-            pass  # TODO
-
-@matcher
-def draw_card(text):
-    match = re.match(r'^draw (a(?P<dream> dream)? card|(?P<quantity>\d+) cards)$', text)
+            return action_node('deal_damage', int(damage), split=True, target=target)
+    match = DEAL_DAMAGE_TO.fullmatch(parts[0])
+    if not match:
+        return
+    first = action_node('deal_damage', int(match.group('damage')), target=match.group('target'))
+    match = DAMAGE_TO.fullmatch(parts[1])
     if match:
-        if match.group('dream'):
-            #return ('action', 'draw_dream_card()')
-            return  # XXX: Dream card disabled
-        if match.group(1) == 'a card':
-            num_cards = 1
-        else:
-            num_cards = match.group('quantity')
-        return ('action', 'draw_card({num_cards})'.format(**locals()))
-
-#@matcher
-def discard_card(text):
-    match = re.match(r'discard (?P<quantity>a|two) random cards?', text)
+        return [first, action_node('deal_damage', int(match.group('damage')), target=match.group('target'))]
+    node = parse_piece(parts[1])
+    if is_action(node):
+        return [first] + (node if type(node) is list else [node])
+
+#@rule(r'restore (?P<health>\d+) health(?: to (?P<target>.*))?')
+def restore(text, health, target):
+    if target is None:
+        return action_node('restore', int(health))
+    if ' and ' not in target:
+        return action_node('restore', int(health), target=target)
+
+#@rule(r'give (?P<what>.*)')
+def give(text, what):
+    pass  # TODO
+
+#@rule(r'gain (?P<what>.*)')
+def gain(text, what):
+    pass  # TODO
+
+#@rule(r'(?:change|set) (?P<what>.*?) to (?P<value>.*)')
+def change(text, what, value):
+    pass  # TODO
+
+#@rule(r'summon (?P<quantity>an?|two|three) (?P<what>.*?)(?: with (?P<ability>.*?))?(?: that (?P<trigger>.*?))?(?: for your (?P<opponent>opponent))?')
+def summon(text, quantity, what, ability, trigger, opponent):
+    kwargs = {}
+    if ability: kwargs['ability'] = ability
+    if trigger: kwargs['trigger'] = trigger
+    if opponent: kwargs['opponent'] = True
+    return action_node('summon', parse_number(quantity), what, **kwargs)
+
+#@rule(r'equip a (?P<what>.*)')
+def equip(text, what):
+    return action_node('equip', what)
+
+#@rule(r'destroy (?P<target>.*)')
+def destroy(text, target):
+    pass  # TODO
+
+#@rule(r'return (?P<target>.*?)(?: from .*?)? to .*')
+def return_(text, target):
+    return action_node('return_', target=target)
+
+#@rule(r'freeze (?P<target>.*)')
+def freeze(text, target):
+    return action_node('freeze', target)
+
+#@rule(r'silence (?P<target>.*)')
+def silence(text, target):
+    first, _, then = text.partition(', then ')
+    if not then:
+        return action_node('silence', target)
+    node = parse_piece(then)
+    if is_action(node):
+        return [action_node('silence', first[len('silence '):]), node]
+
+#@rule(r'take control of (?P<target>.*)')
+def take_control(text, target):
+    return action_node('take_control', target)
+
+#@rule(r'transform (?P<source>.*) into (?P<target>.*)')
+def transform(text, source, target):
+    return action_node('transform', source, target)
+
+
+def compile_grammar(rules):
+    """Combine rules into one pattern.
+
+    Each rule is a named alternative; the named groups of a rule are
+    prefixed by the name of the rule to be kept apart from the others.
+    Return the pattern and, for each rule name, its function and groups.
+    """
+
+    alternatives = []
+    builders = {}
+    for pattern, func in rules:
+        prefix = func.__name__ + '__'
+        groups = [(prefix + group, group) for group in re.findall(r'\(\?P<(\w+)>', pattern)]
+        pattern = re.sub(r'\(\?P<(\w+)>', r'(?P<{}\1>'.format(prefix), pattern)
+        alternatives.append('(?P<{}>{})'.format(func.__name__, pattern))
+        builders[func.__name__] = (func, groups)
+    return re.compile('|'.join(alternatives)), builders
+
+GRAMMAR, BUILDERS = compile_grammar(RULES)
+
+def parse_piece(piece):
+    """Parse a piece of description text to an effect node.
+
+    Return None if the piece is not understood.
+    """
+
+    match = GRAMMAR.fullmatch(piece)
     if match:
-        num_cards = 1 if match.group('quantity') == 'a' else 2
-        return ('action', 'discard_card({num_cards})'.format(**locals()))
+        func, groups = BUILDERS[match.lastgroup]
+        return func(piece, **{group: match.group(full) for full, group in groups})
 
-#@matcher
-def put(text):
-    match = re.match(r'^put (?P<what>.*?)( (from|in) (?P<source>.*?))?( into (?P<target>.*?))$', text)
-    if match:
-        what = match.group('what')
-        source = match.group('source')
-        target = match.group('target')
-        return ('action', 'put("{what}", from_="{source}", to="{target}")'.format(**locals()))
-
-@matcher
-def deal_damage(text):
-    match = re.match(r'^deal (?P<damage>\d+) damage( (to|randomly (?P<split>split) (between|among)) (?P<target>.*))?$', text)
-    if match:
-        damage = match.group('damage')
-        target = match.group('target')
-        split = match.group('split')
-        if target is None:
-            return ('action', 'deal_damage({damage})'.format(**locals()))
-        parts = text.split(' and ')
-        if len(parts) == 1:
-            if not split:
-                return ('action', 'deal_damage({damage}, target="{target}")'.format(**locals()))
-            else:
-                return ('action', 'deal_damage({damage}, split=True, target="{target}")'.format(**locals()))
-        match = re.match(r'^deal (?P<damage>\d+) damage to (?P<target>.*)$', parts[0])
-        damage = match.group('damage')
-        target = match.group('target')
-        match2 = re.match(r'^(?P<damage>\d+) damage to (?P<target>.*)$', parts[1])
-        if match2:
-            damage2 = match2.group('damage')
-            target2 = match2.group('target')
-            return ('action', ['deal_damage({damage}, target="{target}")'.format(**locals()),
-                               'deal_damage({damage2}, target="{target2}")'.format(**locals())])
-        action = process(parts[1])
-        if action:
-            return ('action', ['deal_damage({damage}, target="{target}")'.format(**locals()), action[1]])
-
-#@matcher
-def restore(text):
-    match = re.match(r'^restore (?P<health>\d+) health( to (?P<target>.*))?$', text)
-    if match:
-        health = match.group('health')
-        target = match.group('target')
-        if target is None:
-            return ('action', 'restore({health})'.format(**locals()))
-        parts = target.split(' and ')
-        if len(parts) == 1:
-            return ('action', 'restore({health}, target=\'{target}\')'.format(**locals()))
-
-#@matcher
-def give(text):
-    if text.startswith('give '):
-        pass  # TODO
-
-#@matcher
-def gain(text):
-    if text.startswith('gain '):
-        pass  # TODO
-
-#@matcher
-def change(text):
-    match = re.match(r'^(change|set) (?P<what>.*?) to (?P<value>.*)$', text)
-    if match:
-        what = match.group('what')
-        value = match.group('value')
-        pass  # TODO
-
-#@matcher
-def summon(text):
-    match = re.match(r'^summon (?P<quantity>an?|two|three) (?P<what>.*?)( with (?P<ability>.*?))?( that (?P<trigger>.*?))?( for your (?P<opponent>opponent))?$', text)
-    if match:
-        quantity = match.group('quantity')
-        quantity = parse_number(quantity)
-        what = match.group('what')
-        ability = match.group('ability')
-        trigger = match.group('trigger')
-        opponent = bool(match.group('opponent'))
-        template = 'summon({quantity}, "{what}"'
-        if ability: template += ', ability="{ability}"'
-        if trigger: template += ', trigger="{trigger}"'
-        if opponent: template += ', opponent={opponent}'
-        template += ')'
-        return ('action', template.format(**locals()))
-
-#@matcher
-def equip(text):
-    match = re.match(r'^equip a (?P<what>.*)$', text)
-    if match:
-        what = match.group('what')
-        return ('action', 'equip("{what}")'.format(**locals()))
+def process(piece):
+    """Parse a piece of description text to an ability name and value."""
 
-#@matcher
-def destroy(text):
-    if text.startswith('destroy '):
-        pass  # TODO
+    node = parse_piece(piece)
+    if is_action(node):
+        return ('action', node)
+    elif node is not None:
+        return (node.name, node.value)
 
-#@matcher
-def return_(text):
-    match = re.match(r'^return (?P<target>.*?)( from (.*?))? to (.*)$', text)
-    if match:
-        target = match.group('target')
-        return ('action', 'return_(target="{target}")'.format(**locals()))
+def to_code(value):
+    """Convert an attribute or ability value to source code.
 
-#@matcher
-def freeze(text):
-    match = re.match(r'^freeze (?P<target>.*)$', text)
-    if match:
-        target = match.group('target')
-        return ('action', 'freeze("{target}")'.format(**locals()))
+    Effect nodes are converted to actions, other values are literals.
+    """
 
-#@matcher
-def silence(text):
-    match = re.match(r'^silence (?P<target>.*)$', text)
-    if match:
-        parts = text.split(', then ')
-        if len(parts) == 1:
-            target = match.group('target')
-            return ('action', 'silence("{target}")'.format(**locals()))
-        match = re.match(r'^silence (?P<target>.*)$', parts[0])
-        target = match.group('target')
-        action = process(parts[1])
-        return ('action', ['silence("{target}")'.format(**locals()), action[1]])
-
-#@matcher
-def take_control(text):
-    match = re.match(r'^take control of (?P<target>.*)$', text)
-    if match:
-        target = match.group('target')
-        return ('action', 'take_control("{target}")'.format(**locals()))
+    if type(value) is list:
+        return '[' + ', '.join(to_code(item) for item in value) + ']'
+    elif isinstance(value, Dict) and value.kind == 'action':
+        args = [_argument_code(arg) for arg in value.args]
+        args += [key + '=' + _argument_code(arg) for key, arg in value.kwargs.items()]
+        return '{name}({args})'.format(name=value.name, args=', '.join(args))
+    elif isinstance(value, Dict) and value.kind == 'name':
+        return value.id
+    else:
+        return repr(value)
 
-#@matcher
-def transform(text):
-    match = re.match(r'transform (?P<source>.*) into (?P<target>.*)', text)
-    if match:
-        source = match.group('source')
-        target = match.group('target')
-        return ('action', 'transform("{source}", "{target}")'.format(**locals()))
+def _argument_code(value):
+    if type(value) is str:
+        return '"' + value + '"'
+    return to_code(value)
 
 
-def process(piece):
-    """Convert a piece of description text to source code."""
+def parse(card):
+    """Parse the attributes and abilities of a card.
 
-    for matcher in MATCHERS:
-        result = matcher(piece)
-        if result is not None:
-            return result
+    Raise NotImplementedError with the pieces of description which are not
+    understood.
+    """
 
-def to_string(value):
-    if type(value) is list:
-        return '\'[' + ', '.join(item for item in value) + ']\''
+    attributes = ()
+    abilities = {}
+    if card.type == 'minion':
+        attributes = (card.attack, card.health)
+    elif card.type == 'spell':
+        pass
+    elif card.type == 'weapon':
+        attributes = (card.attack, card.durability)
     else:
-        return repr(value)
+        raise NotImplementedError()
+    pieces = segment(card.description)
+    remaining = pieces[:]
+    for piece in pieces:
+        result = process(piece)
+        if result:
+            key, value = result
+            if key not in abilities:
+                abilities[key] = value
+            elif type(abilities[key]) is not list:
+                abilities[key] = [abilities[key], value]
+            else:
+                abilities[key].append(value)
+            remaining.remove(piece)
+    if remaining:
+        card.unimplemented = remaining
+        raise NotImplementedError(repr(remaining))
+    if card.type == 'spell':
+        attributes = (abilities['action'],)
+        del abilities['action']
+    return attributes, abilities
 
 
 def generate_code(card):
     code = io.StringIO()
     card.class_name = pascalize(card.name)
     try:
-        attributes = ()
-        abilities = {}
-        if card.type == 'minion':
-            attributes = (card.attack, card.health)
-        elif card.type == 'spell':
-            pass
-        elif card.type == 'weapon':
-            attributes = (card.attack, card.durability)
-        else:
-            raise NotImplementedError()
-        pieces = segment(card.description)
-        remaining = pieces[:]
-        for piece in pieces:
-            result = process(piece)
-            if result:
-                key, value = result
-                if key not in abilities:
-                    abilities[key] = value
-                elif type(abilities[key]) is not list:
-                    abilities[key] = [abilities[key], value]
-                else:
-                    abilities[key].append(value)
-                remaining.remove(piece)
-        if remaining:
-            raise NotImplementedError(repr(remaining))
-        if card.type == 'spell':
-            attributes = (abilities['action'],)
-            del abilities['action']
+        attributes, abilities = parse(card)
         code.write('{class_name} = make_{type}_card("{name}", {cost}'.format(**card))
         if attributes:
-            card.attributes = ', '.join(to_string(a) for a in attributes)
+            card.attributes = ', '.join(to_code(a) for a in attributes)
             code.write(', {attributes}'.format(**card))
         if abilities:
-            card.abilities = ', '.join(k + '=' + to_string(v) for k, v in abilities.items())
+            card.abilities = ', '.join(k + '=' + to_code(v) for k, v in abilities.items())
             code.write(', {abilities}'.format(**card))
         code.write(')\n')
     except NotImplementedError as e:
@@ -426,43 +406,181 @@ def generate_code(card):
     return (code.getvalue(), success)
 
 
-def main(args=sys.argv[1:]):
-    with open('data/cards.json') as card_file:
-        card_info_list = json.load(card_file)
-    generated = 0
-    class_ = None
-    code_file = None
-    class_total = collections.defaultdict(int)
-    class_generated = collections.defaultdict(int)
-    for card_info in sorted(card_info_list, key=lambda info: (info.get('classs', 0), info['cost'], info['name'])):
-        card = convert(card_info)
-        code, success = generate_code(card)
-        class_total[card.class_] += 1
-        if success:
-            generated += 1
-            class_generated[card.class_] += 1
-        if card.class_ != class_:
-            class_ = card.class_
-            # XXX: Register names of card classes into __all__.
-            code_file = open('cards/{class_}.py'.format(**locals()), 'w')
-            code_file.write("""\
+CARDS_INIT_HEADER = """\
 #!/usr/bin/env python3
+# Card classes, each loaded from the card database or its module on first access
 
-from .utils import *
+import importlib
 
-""")
-        code_file.write(code)
-    percentage = lambda n, d: '{}/{} {:0.2f}%'.format(n, d, 100.0 * n / d)
-    with open('cards/__init__.py', 'w') as code_file:
-        code_file.write("""\
+from . import special
+from .special import *
+
+# Modules of the card classes, by class name
+_MODULES = {
+"""
+
+CARDS_INIT_FOOTER = """\
+}
+
+__all__ = list(_MODULES) + special.__all__
+
+
+# The card database (see carddb), False if it cannot be opened
+_database = None
+
+
+def __getattr__(name):
+    module_name = _MODULES.get(name)
+    if module_name is None:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+    database = _open_database()
+    if database:
+        try:
+            class_ = database.card_class(name)
+        except (KeyError, NotImplementedError):
+            pass
+        else:
+            globals()[name] = class_
+            return class_
+    # Only this class, as the others of its module may be in the database
+    module = importlib.import_module('.' + module_name, __name__)
+    class_ = globals()[name] = getattr(module, name)
+    return class_
+
+
+def _open_database():
+    global _database
+    if _database is None:
+        from ..carddb import open_database
+        try:
+            _database = open_database()
+        except (OSError, ValueError):
+            _database = False
+    return _database
+"""
+
+
+CARD_MODULE_HEADER = """\
 #!/usr/bin/env python3
 
-""")
-        for class_ in CLASS_CODE.values():
-            code_file.write('from .{class_} import *\n'.format(**locals()))
-            print('{}: {}'.format(class_, percentage(class_generated[class_], class_total[class_])))
-        code_file.write('from .special import *\n')
-    print('total: {}'.format(percentage(generated, len(card_info_list))))
+from ..actions import *
+from .utils import *
+
+"""
+
+
+def _generate(card_info):
+    """Generate the code of a card (in a worker process)."""
+    card = convert(card_info)
+    code, success = generate_code(card)
+    return [card.class_, card.class_name, code, success, card.get('unimplemented', [])]
+
+
+def _card_key(card_info, fingerprint):
+    """Return a key which changes with a card or with the generator."""
+    text = json.dumps(card_info, sort_keys=True)
+    return hashlib.sha1((fingerprint + text).encode('utf-8')).hexdigest()
+
+
+def _write_if_changed(path, content):
+    """Write a file unless it has the content already; return if written."""
+    if os.path.exists(path):
+        with open(path) as old_file:
+            if old_file.read() == content:
+                return False
+    with open(path, 'w') as new_file:
+        new_file.write(content)
+    return True
+
+
+def report_coverage(results):
+    """Return the coverage report of generated cards.
+
+    It holds the generated and total numbers of cards, overall and for
+    each class with the names of unimplemented cards, and for each
+    unimplemented piece of description the cards which have it.
+    """
+
+    report = collections.OrderedDict()
+    classes = collections.OrderedDict((class_, collections.OrderedDict(
+        generated=0, total=0, unimplemented=[])) for class_ in CLASS_CODE.values())
+    phrases = collections.defaultdict(list)
+    for class_, class_name, code, success, unimplemented in results:
+        classes[class_]['total'] += 1
+        if success:
+            classes[class_]['generated'] += 1
+        else:
+            classes[class_]['unimplemented'].append(class_name)
+            for phrase in unimplemented:
+                phrases[phrase].append(class_name)
+    report['generated'] = sum(item['generated'] for item in classes.values())
+    report['total'] = len(results)
+    report['classes'] = classes
+    report['phrases'] = collections.OrderedDict(
+        sorted(phrases.items(), key=lambda item: (-len(item[1]), item[0])))
+    return report
+
+
+def main(args=sys.argv[1:]):
+    parser = argparse.ArgumentParser(description='Generate the card code.')
+    parser.add_argument('-i', '--incremental', action='store_true',
+                        help='only regenerate cards changed since the last run')
+    parser.add_argument('-p', '--processes', type=int, default=1,
+                        help='number of worker processes (default: 1)')
+    parser.add_argument('-r', '--report', metavar='PATH',
+                        help='write a JSON coverage report')
+    options = parser.parse_args(args)
+    with open(CARDS_JSON_PATH) as card_file:
+        card_info_list = json.load(card_file)
+    card_info_list.sort(key=lambda info: (info.get('classs', 0), info['cost'], info['name']))
+    # Cards are cached by the hash of their JSON entry and of the generator.
+    with open(os.path.abspath(__file__).replace('.pyc', '.py'), 'rb') as source_file:
+        fingerprint = hashlib.sha1(source_file.read()).hexdigest()
+    keys = [_card_key(card_info, fingerprint) for card_info in card_info_list]
+    cache = {}
+    if options.incremental and os.path.exists(CACHE_PATH):
+        with open(CACHE_PATH) as cache_file:
+            cache = json.load(cache_file)
+    changed = [card_info for key, card_info in zip(keys, card_info_list) if key not in cache]
+    if options.processes > 1 and len(changed) > 1:
+        with multiprocessing.Pool(options.processes) as pool:
+            generated = pool.map(_generate, changed, chunksize=16)
+    else:
+        generated = [_generate(card_info) for card_info in changed]
+    generated = iter(generated)
+    results = [cache[key] if key in cache else next(generated) for key in keys]
+    with open(CACHE_PATH, 'w') as cache_file:
+        json.dump(dict(zip(keys, results)), cache_file)
+    # Write the modules of card classes and the registry
+    modules = collections.OrderedDict()
+    contents = collections.OrderedDict()
+    for class_, class_name, code, success, unimplemented in results:
+        if class_ not in contents:
+            contents[class_] = [CARD_MODULE_HEADER]
+        contents[class_].append(code)
+        if success:
+            modules[class_name] = class_
+    for class_, content in contents.items():
+        path = os.path.join(CARDS_DIR, '{class_}.py'.format(**locals()))
+        _write_if_changed(path, ''.join(content))
+    content = [CARDS_INIT_HEADER]
+    for class_name, class_ in modules.items():
+        content.append("    '{class_name}': '{class_}',\n".format(**locals()))
+    content.append(CARDS_INIT_FOOTER)
+    _write_if_changed(os.path.join(CARDS_DIR, '__init__.py'), ''.join(content))
+    # Build the card database, from which the registry loads the cards
+    subprocess.check_call([sys.executable, '-m', 'simplehs.carddb'], cwd=os.path.dirname(BASE_DIR))
+    # Report the coverage
+    report = report_coverage(results)
+    percentage = lambda n, d: '{}/{} {:0.2f}%'.format(n, d, 100.0 * n / d)
+    for class_, item in report['classes'].items():
+        print('{}: {}'.format(class_, percentage(item['generated'], item['total'])))
+    print('total: {}'.format(percentage(report['generated'], report['total'])))
+    if options.incremental:
+        print('regenerated: {}/{}'.format(len(changed), len(card_info_list)))
+    if options.report:
+        with open(options.report, 'w') as report_file:
+            json.dump(report, report_file, indent=2)
 
 
 if __name__ == '__main__':
@@ -7,6 +7,8 @@ from .base import Hero
 class Innkeeper(Hero):
     """An Inn Keeper hero (dummy)"""
 
+    __slots__ = ()
+
     def __init__(self, name='Innkeeper'):
         super().__init__(name, 30)
 
@@ -14,5 +16,7 @@ class Innkeeper(Hero):
 class Mage(Hero):
     """A Mage hero"""
 
+    __slots__ = ()
+
     def __init__(self, name='Jaina Proudmoore'):
         super().__init__(name, 30)
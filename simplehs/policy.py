@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+# Batched policy evaluation across games (requires NumPy)
+
+import asyncio
+
+import numpy
+
+from .base import GameOver
+from .encoding import DTYPE
+from .encoding import FEATURES
+from .encoding import MAX_HAND_SIZE
+from .encoding import MAX_MINIONS
+from .encoding import MINION_FEATURES
+from .encoding import SIDE_FEATURES
+from .encoding import encode_batch
+
+
+def default_weights():
+    """Return the weights of a simple board evaluation.
+
+    A side is worth its hero's health and armor, half a point a card in
+    hand, and for each minion a point, its attack and health, and half a
+    point for each of its useful abilities; the opponent's side counts
+    against the player's.
+    """
+
+    side = numpy.zeros(SIDE_FEATURES, dtype=DTYPE)
+    side[0:2] = 1
+    side[7] = 0.5
+    minion = numpy.zeros(MINION_FEATURES, dtype=DTYPE)
+    minion[0:3] = 1
+    minion[6:14] = 0.5
+    start = 8 + MAX_HAND_SIZE
+    side[start:start + MAX_MINIONS * MINION_FEATURES] = numpy.tile(minion, MAX_MINIONS)
+    weights = numpy.zeros(FEATURES, dtype=DTYPE)
+    weights[2:2 + SIDE_FEATURES] = side
+    weights[2 + SIDE_FEATURES:] = -side
+    return weights
+
+
+class LinearScorer:
+    """A scorer of boards (see encoding) by a linear function.
+
+    Scorers are called with a matrix of encoded boards, one per row, and
+    return a vector of their scores.
+    """
+
+    def __init__(self, weights=None):
+        self.weights = default_weights() if weights is None else numpy.asarray(weights, dtype=DTYPE)
+
+    def __call__(self, features):
+        return features @ self.weights
+
+
+class Coordinator:
+    """A coordinator of the decisions of policy agents in many games.
+
+    The agents of games played on one event loop (see Game.run_async) ask
+    it to choose between boards.  The boards of every pending request are
+    encoded and scored in one call of the scorer, once all the games that
+    are ready to run have had their turn on the loop.
+    """
+
+    def __init__(self, scorer=None):
+        self.scorer = LinearScorer() if scorer is None else scorer
+        # Number of scorer calls and boards scored
+        self.batches = 0
+        self.boards = 0
+        self._pending = []
+        self._features = numpy.empty((0, FEATURES), dtype=DTYPE)
+
+    async def choose(self, games, player_num):
+        """Return the index of the best of games, from the view of a player."""
+        loop = asyncio.get_running_loop()
+        if not self._pending:
+            loop.call_soon(self._flush)
+        future = loop.create_future()
+        self._pending.append((games, player_num, future))
+        return await future
+
+    def run(self, games):
+        """Play games concurrently; return their winners."""
+        async def run_all():
+            return await asyncio.gather(*(game.run_async() for game in games))
+        return asyncio.run(run_all())
+
+    def _flush(self):
+        pending, self._pending = self._pending, []
+        size = sum(len(games) for games, player_num, future in pending)
+        if len(self._features) < size:
+            self._features = numpy.empty((size, FEATURES), dtype=DTYPE)
+        row = 0
+        try:
+            for games, player_num, future in pending:
+                encode_batch(games, [game.players[player_num] for game in games], self._features[row:])
+                row += len(games)
+            scores = self.scorer(self._features[:size])
+        except Exception as e:
+            for games, player_num, future in pending:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        self.batches += 1
+        self.boards += size
+        row = 0
+        for games, player_num, future in pending:
+            if not future.done():
+                future.set_result(int(numpy.argmax(scores[row:row + len(games)])))
+            row += len(games)
+
+
+def afterstate(game, action):
+    """Return a copy of a game after an action of its current player."""
+    game = game.clone()
+    game.log = False
+    action = action.copy()
+    for key, value in action.items():
+        if isinstance(value, list):
+            action[key] = [game.find(object.dob) for object in value]
+        elif hasattr(value, 'dob'):
+            action[key] = game.find(value.dob)
+    try:
+        game.who._do_action(action)
+    except GameOver:
+        pass
+    return game
@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+# Replay logs of games
+
+import io
+
+from .base import Agent
+from .base import Game
+from .base import GameOver
+from .base import Object
+from .serialize import Decoder
+from .serialize import Encoder
+from .utils import Dict
+from .utils import TracingRandom
+
+# A log starts with a record of the game (see serialize) as it was when
+# recorded, followed by entries: the actions of players and the random
+# draws, in the order they happen.
+ACTION = 0
+DRAW = 1
+
+ACTION_NAMES = ('replace', 'play', 'attack', 'end', 'concede')
+FIELDS = ('card', 'position', 'target', 'source', 'cards')
+
+# Kinds of action arguments
+NONE = 0
+OBJECT = 1
+INT = 2
+OBJECTS = 3
+
+
+class ReplayException(Exception):
+    """An exception that indicates a replay diverged from its log."""
+    pass
+
+
+class Recorder(Encoder):
+    """A recorder of a game into an append-only log file.
+
+    The game is recorded from its current state on.  Every action done by
+    its players (see Player._do_action) is written once it is done, after
+    the random draws it made; actions that fail are not written, nor their
+    draws.
+    """
+
+    def __init__(self, game, file):
+        super().__init__(file)
+        self.game = game
+        # Draws of the current action, written with it
+        self._draws = bytearray()
+        self.encode(game)
+        game.recorder = self
+        game.rng = TracingRandom(game.rng, self._draw)
+
+    def detach(self):
+        """Stop recording the game."""
+        self.game.recorder = None
+        self.game.rng = self.game.rng.rng
+
+    def record(self, player, action):
+        self._buffer = self._draws
+        self._draws = bytearray()
+        self._uint(ACTION)
+        self._uint(self.game.players.index(player))
+        self._uint(ACTION_NAMES.index(action.name))
+        fields = [field for field in FIELDS if field in action]
+        self._uint(len(fields))
+        for field in fields:
+            self._uint(FIELDS.index(field))
+            self._value(action[field])
+        self.file.write(self._buffer)
+
+    def discard(self):
+        """Forget the draws of an action which is not recorded."""
+        self._draws = bytearray()
+
+    def _value(self, value):
+        if value is None:
+            self._uint(NONE)
+        elif isinstance(value, Object):
+            self._uint(OBJECT)
+            self._uint(value.dob)
+        elif isinstance(value, int):
+            self._uint(INT)
+            self._int(value)
+        else:
+            self._uint(OBJECTS)
+            self._uint(len(value))
+            for object in value:
+                self._uint(object.dob)
+
+    def _draw(self, number):
+        self._buffer = self._draws
+        self._uint(DRAW)
+        self._uint(number)
+
+
+class Replay(Decoder):
+    """A recorded game, which can be replayed to any point.
+
+    Replaying applies the recorded actions without asking the agents and
+    with logging disabled, so it is faster than playing.
+    """
+
+    def __init__(self, file):
+        data = file.read()
+        super().__init__(io.BytesIO(data))
+        self.decode((Agent('Player0'), Agent('Player1')))
+        self._record = data[:self.file.tell()]
+        # Actions as (player index, name, fields), with objects as Dict(dob=)
+        self.actions = []
+        self.draws = []
+        self._data = self.file.read()
+        self._offset = 0
+        while self._offset < len(self._data):
+            kind = self._uint()
+            if kind == ACTION:
+                player_num = self._uint()
+                name = ACTION_NAMES[self._uint()]
+                fields = {}
+                for field_num in range(self._uint()):
+                    field = FIELDS[self._uint()]
+                    fields[field] = self._value()
+                self.actions.append((player_num, name, fields))
+            elif kind == DRAW:
+                self.draws.append(self._uint())
+            else:
+                raise ValueError('unknown log entry: {kind}'.format(kind=kind))
+
+    def game(self, agents=None):
+        """Return the game as it was when it was recorded."""
+        if agents is None:
+            agents = (Agent('Player0'), Agent('Player1'))
+        return Decoder(io.BytesIO(self._record)).decode(agents)
+
+    def fast_forward(self, turn_num=None, agents=None, verify=False):
+        """Replay the game up to the start of a turn (or to the end).
+
+        Return the game, before any action of that turn.  If verify is set,
+        the random draws are checked against the log.
+        """
+        game = self.game(agents)
+        log = game.log
+        game.log = False
+        if verify:
+            draws = iter(self.draws)
+            def check(number):
+                if next(draws, None) != number:
+                    raise ReplayException('random draw diverged')
+            game.rng = TracingRandom(game.rng, check)
+        try:
+            for player_num, name, fields in self.actions:
+                if turn_num is not None and game.turn_num is not None and game.turn_num >= turn_num:
+                    break
+                action = Dict(name=name)
+                for field, value in fields.items():
+                    action[field] = _resolve(game, value)
+                game.players[player_num]._do_action(action)
+            # A game which Game.run ended at the turn limit is a tie
+            if turn_num is None and game.state == Game.PLAYING and game.turn_num >= Game.MAX_TURNS:
+                game.finish(None)
+        except GameOver:
+            pass
+        if verify:
+            game.rng = game.rng.rng
+        game.log = log
+        return game
+
+    def _value(self):
+        kind = self._uint()
+        if kind == OBJECT:
+            return Dict(dob=self._uint())
+        elif kind == INT:
+            return self._int()
+        elif kind == OBJECTS:
+            return [Dict(dob=self._uint()) for num in range(self._uint())]
+        return None
+
+
+def _resolve(game, value):
+    if isinstance(value, Dict):
+        return _find(game, value.dob)
+    elif isinstance(value, list):
+        return [_find(game, object.dob) for object in value]
+    return value
+
+def _find(game, dob):
+    try:
+        return game.find(dob)
+    except KeyError:
+        raise ReplayException('no object of dob {dob}'.format(dob=dob))
+
@@ -0,0 +1,388 @@
+#!/usr/bin/env python3
+# Binary serialization of games
+
+import io
+import json
+
+from .base import Battlefield
+from .base import Deck
+from .base import Game
+from .base import Hand
+from .base import Minion
+from .base import MinionCard
+from .base import Player
+from .utils import DummyRandom
+from .utils import MockRandom
+from .utils import Random
+from .utils import TracingRandom
+from .utils import get_class
+from .utils import pascalize
+
+# A stream is a sequence of records, one for each game.  A record starts
+# with the magic, the version and the length of its body.  Integers are
+# variable-length (LEB128, zigzag if signed) and strings are UTF-8 prefixed
+# with their length.
+MAGIC = b'SHGS'
+VERSION = 1
+
+STATES = (Game.REPLACING, Game.PLAYING, Game.FINISHED)
+
+# Ids of the cards which are not in the JSON card source
+SPECIAL_CARD_IDS = {
+    'TheCoin': 1 << 16,
+}
+
+# Kinds of random generators
+DUMMY_RANDOM = 0
+RANDOM = 1
+MOCK_RANDOM = 2
+
+# Flags of a game and of a character
+DEBUG = 1 << 0
+LOG = 1 << 1
+HAS_DEATHRATTLE = 1 << 0
+HAS_TRIGGER = 1 << 1
+
+_card_ids = None
+_card_names = None
+_card_classes = {}
+
+def card_ids():
+    """Return the ids of cards by class name.
+
+    Ids are those of the JSON card source, so they are stable as cards are
+    implemented or renamed.  They are read from the card database, so a
+    worker without the JSON source decodes games too; the source is read
+    only if the database cannot be opened, like the card registry does.
+    """
+
+    global _card_ids, _card_names
+    if _card_ids is None:
+        from .carddb import JSON_PATH
+        from .carddb import open_database
+        try:
+            database = open_database()
+        except (OSError, ValueError):
+            with open(JSON_PATH) as card_file:
+                ids = {pascalize(info['name']): info['id'] for info in json.load(card_file)}
+        else:
+            ids = {name: database.get(name).id for name in database.names()}
+            database.close()
+        ids.update(SPECIAL_CARD_IDS)
+        _card_names = {id: class_name for class_name, id in ids.items()}
+        _card_ids = ids
+    return _card_ids
+
+def card_id(card):
+    """Return the id of a card."""
+    try:
+        return card_ids()[type(card).__name__]
+    except KeyError:
+        raise ValueError('no card id: {card}'.format(card=card))
+
+def card_class(id):
+    """Return the class of a card by its id."""
+    class_ = _card_classes.get(id)
+    if class_ is None:
+        card_ids()
+        try:
+            class_name = _card_names[id]
+        except KeyError:
+            raise ValueError('unknown card id: {id}'.format(id=id))
+        class_ = _card_classes[id] = get_class(class_name, '.cards')
+    return class_
+
+
+class Encoder:
+    """A streaming encoder of games into a binary file."""
+
+    def __init__(self, file):
+        self.file = file
+        self._buffer = bytearray()
+
+    def encode(self, game):
+        """Write a record of a game."""
+        self._buffer = bytearray()
+        self._game(game)
+        body = self._buffer
+        self._buffer = bytearray(MAGIC)
+        self._uint(VERSION)
+        self._uint(len(body))
+        self._buffer += body
+        self.file.write(self._buffer)
+
+    def _uint(self, value):
+        buffer = self._buffer
+        while value > 0x7f:
+            buffer.append(value & 0x7f | 0x80)
+            value >>= 7
+        buffer.append(value)
+
+    def _int(self, value):
+        self._uint(value << 1 if value >= 0 else (-value << 1) - 1)
+
+    def _str(self, value):
+        data = value.encode('utf-8')
+        self._uint(len(data))
+        self._buffer += data
+
+    def _game(self, game):
+        self._uint(DEBUG * game.debug | LOG * game.log)
+        self._uint(game._date)
+        self._uint(STATES.index(game.state))
+        self._uint(0 if game.turn_num is None else game.turn_num + 1)
+        self._uint(game.players.index(game.who))
+        self._uint(2 if game.winner is None else game.players.index(game.winner))
+        self._rng(game.rng)
+        for player in game.players:
+            self._player(player)
+        # Listeners in their order (see Game._subscribe), by the dob of characters
+        self._uint(len(game._listeners))
+        for timing, listeners in game._listeners.items():
+            self._str(timing)
+            self._uint(len(listeners))
+            for character in listeners:
+                self._uint(character.dob)
+
+    def _rng(self, rng):
+        # A recorded game (see replay.Recorder) is saved untraced
+        if isinstance(rng, TracingRandom):
+            rng = rng.rng
+        if isinstance(rng, Random):
+            self._uint(RANDOM)
+            state, gamma = rng.getstate()
+            self._uint(state)
+            self._uint(gamma)
+        elif isinstance(rng, MockRandom):
+            self._uint(MOCK_RANDOM)
+            self._uint(len(rng.sequence))
+            for number in rng.sequence:
+                self._int(number)
+        elif type(rng) is DummyRandom:
+            self._uint(DUMMY_RANDOM)
+        else:
+            raise ValueError('unsupported random generator: {rng}'.format(rng=rng))
+
+    def _player(self, player):
+        self._str(player.name)
+        self._uint(bool(player.go_first) | player.replaced << 1)
+        self._uint(player.mana)
+        self._uint(player.full_mana)
+        hero = player.hero
+        self._str(type(hero).__name__)
+        self._str(hero.name)
+        self._character(hero)
+        self._int(hero.armor)
+        self._uint(player.deck.fatigue)
+        for zone in (player.deck, player.hand):
+            self._uint(len(zone))
+            for card in zone:
+                self._card(card)
+        self._uint(len(player.battlefield))
+        for minion in player.battlefield:
+            if minion.card is None:
+                raise ValueError('minion without a card: {minion}'.format(minion=minion))
+            self._card(minion.card)
+            self._character(minion)
+
+    def _card(self, card):
+        self._uint(card_id(card))
+        self._uint(card.dob)
+        self._int(card._cost)
+        if isinstance(card, MinionCard):
+            self._int(card.attack)
+            self._int(card.health)
+
+    def _character(self, character):
+        self._uint(character.dob)
+        self._int(character.attack)
+        self._int(character.health)
+        self._int(character.full_health)
+        self._uint(character.attack_count)
+        self._uint(character._flags)
+        self._int(character._spell_damage)
+        self._uint(HAS_DEATHRATTLE * (character.deathrattle is not None) |
+                   HAS_TRIGGER * (character.trigger is not None))
+
+
+class Decoder:
+    """A streaming decoder of games from a binary file."""
+
+    def __init__(self, file):
+        self.file = file
+        self._data = b''
+        self._offset = 0
+
+    def decode(self, agents):
+        """Read a record of a game, to be played by the given agents.
+
+        Raise EOFError at the end of the file.
+        """
+        header = self.file.read(len(MAGIC))
+        if not header:
+            raise EOFError('no more games')
+        if header != MAGIC:
+            raise ValueError('not a game record')
+        if self._header_uint() != VERSION:
+            raise ValueError('unsupported game record version')
+        size = self._header_uint()
+        self._data = self.file.read(size)
+        self._offset = 0
+        if len(self._data) != size:
+            raise EOFError('truncated game record')
+        return self._game(agents)
+
+    def _header_uint(self):
+        value = shift = 0
+        while True:
+            byte = self.file.read(1)
+            if not byte:
+                raise EOFError('truncated game record')
+            value |= (byte[0] & 0x7f) << shift
+            if byte[0] < 0x80:
+                return value
+            shift += 7
+
+    def _uint(self):
+        data = self._data
+        offset = self._offset
+        value = shift = 0
+        while True:
+            byte = data[offset]
+            offset += 1
+            value |= (byte & 0x7f) << shift
+            if byte < 0x80:
+                self._offset = offset
+                return value
+            shift += 7
+
+    def _int(self):
+        value = self._uint()
+        return -((value + 1) >> 1) if value & 1 else value >> 1
+
+    def _str(self):
+        size = self._uint()
+        start = self._offset
+        self._offset += size
+        return self._data[start:self._offset].decode('utf-8')
+
+    def _game(self, agents):
+        game = Game.__new__(Game)
+        flags = self._uint()
+        game.debug = bool(flags & DEBUG)
+        game.log = bool(flags & LOG)
+        game._date = self._uint()
+        game.recorder = None
+        game.stats = None
+        game.undo_log = None
+        game.state = STATES[self._uint()]
+        turn_num = self._uint()
+        game.turn_num = None if turn_num == 0 else turn_num - 1
+        who = self._uint()
+        winner = self._uint()
+        game.rng = self._rng()
+        objects = {}
+        player0, player1 = (self._player(game, agent, objects) for agent in agents)
+        player0.opponent = player1
+        player1.opponent = player0
+        game.players = (player0, player1)
+        game.who = game.players[who]
+        game.winner = None if winner == 2 else game.players[winner]
+        game._listeners = {}
+        for timing_num in range(self._uint()):
+            timing = self._str()
+            game._listeners[timing] = [objects[self._uint()] for num in range(self._uint())]
+        return game
+
+    def _rng(self):
+        kind = self._uint()
+        if kind == RANDOM:
+            state = self._uint()
+            return Random(state, self._uint())
+        elif kind == MOCK_RANDOM:
+            return MockRandom([self._int() for num in range(self._uint())])
+        elif kind == DUMMY_RANDOM:
+            return DummyRandom()
+        raise ValueError('unknown random generator: {kind}'.format(kind=kind))
+
+    def _player(self, game, agent, objects):
+        player = Player.__new__(Player)
+        player.game = game
+        player.agent = agent
+        agent.player = player
+        player.name = self._str()
+        flags = self._uint()
+        player.go_first = bool(flags & 1)
+        player.replaced = bool(flags & 2)
+        player.mana = self._uint()
+        player.full_mana = self._uint()
+        hero_class = get_class(self._str(), '.heroes')
+        hero = hero_class(self._str())
+        self._character(hero, player, None, objects)
+        hero.armor = self._int()
+        player.hero = hero
+        player.deck = Deck()
+        player.deck.fatigue = self._uint()
+        player.hand = Hand()
+        player.battlefield = Battlefield()
+        for zone in (player.deck, player.hand):
+            zone.owner = player
+            zone.extend(self._card(player) for num in range(self._uint()))
+        player.battlefield.owner = player
+        for num in range(self._uint()):
+            card = self._card(player)
+            minion = Minion(card.name, card.attack, card.health)
+            minion.card = card
+            self._character(minion, player, card, objects)
+            player.battlefield.append(minion)
+        characters = player.characters
+        player._spell_damage = sum(character.spell_damage for character in characters)
+        player._taunts = sum(character.taunt for character in characters)
+        return player
+
+    def _card(self, player):
+        card = card_class(self._uint())()
+        card.game = player.game
+        card.owner = player
+        card.dob = self._uint()
+        card._cost = self._int()
+        if isinstance(card, MinionCard):
+            card.attack = self._int()
+            card.health = self._int()
+        return card
+
+    def _character(self, character, player, card, objects):
+        character.game = player.game
+        character.owner = player
+        character.dob = self._uint()
+        character.attack = self._int()
+        character.health = self._int()
+        character.full_health = self._int()
+        character.attack_count = self._uint()
+        character._flags = self._uint()
+        character._spell_damage = self._int()
+        flags = self._uint()
+        if flags & HAS_DEATHRATTLE:
+            character._deathrattle = card.abilities.deathrattle
+        if flags & HAS_TRIGGER:
+            character._trigger = card.abilities.trigger
+        objects[character.dob] = character
+
+
+def dump(game, file):
+    """Write a game into a binary file."""
+    Encoder(file).encode(game)
+
+def load(file, agents):
+    """Read a game from a binary file, to be played by the given agents."""
+    return Decoder(file).decode(agents)
+
+def dumps(game):
+    """Return a game as bytes."""
+    file = io.BytesIO()
+    dump(game, file)
+    return file.getvalue()
+
+def loads(data, agents):
+    """Return a game from bytes, to be played by the given agents."""
+    return load(io.BytesIO(data), agents)
@@ -0,0 +1,432 @@
+#!/usr/bin/env python3
+# Game server for remote agents
+
+import argparse
+import asyncio
+import itertools
+import json
+import logging
+import sys
+
+from .base import Agent
+from .base import Game
+from .base import GameException
+from .base import GameOver
+from .utils import Dict
+from .utils import Random
+from .utils import get_class
+
+# Requests and replies are JSON objects, one per line.  A request has an
+# "op" and an optional "id", which its reply echoes:
+#
+#   {"op": "new", "players": [PLAYER, PLAYER], "seed": 1, "player": 0}
+#   {"op": "watch", "game": 1, "player": null}
+#   {"op": "state", "game": 1, "player": 0}
+#   {"op": "play", "game": 1, "player": 0, "card": 12, "position": 0, "target": 3}
+#   {"op": "attack", "game": 1, "player": 0, "source": 14, "target": 3}
+#   {"op": "end" | "concede", "game": 1, "player": 0}
+#   {"op": "replace", "game": 1, "player": 0, "cards": [12, 13]}
+#   {"op": "close", "game": 1}
+#
+# A PLAYER is {"name": ..., "hero": ..., "deck": [...]}, with an "agent"
+# (e.g. "NaiveAgent") if the server plays it.  The seat of a remote player
+# is held by the first connection to watch as it (at "new", its creator)
+# until it disconnects; only that connection can act as the player or see
+# its hand.  Cards and characters are referred to by their dob: a card must
+# be in the player's hand, a source on its side and a target in play.  A reply is {"ok": true, ...} or
+# {"ok": false, "error": "PlayException", "message": ...}; a failed action
+# leaves the game as it was.  Only the connection which created a game can
+# close it; it is closed when that connection is.
+#
+# A connection watches the games it creates or acts in, as the player it
+# acts as (or as a spectator with a null player, who sees no hand).  After
+# each change, every watcher gets the difference from the state it saw last,
+# in the reply or in an {"event": "update", "game": 1, "diff": ...} message.
+# A watcher which leaves too many updates unread stops watching, until it
+# watches again.
+# A diff has the changed keys only; dicts are diffed recursively, other
+# values (lists included) are replaced.
+
+ACTIONS = ('replace', 'play', 'attack', 'end', 'concede')
+
+
+class RequestError(Exception):
+    """An exception that indicates an invalid request."""
+    pass
+
+
+def state(game, player_num=None, public=False):
+    """Return the state of a game as JSON data, as seen by a player.
+
+    A player sees the cards in its hand only, and its legal actions.  If
+    public is set, no hand is seen (e.g. by spectators).
+    """
+
+    players = []
+    for num, player in enumerate(game.players):
+        visible = player_num == num if player_num is not None else not public
+        players.append({
+            'name': player.name,
+            'mana': player.mana,
+            'full_mana': player.full_mana,
+            'hero': _character(player.hero),
+            'hand': [_card(card) if visible else {'dob': card.dob} for card in player.hand],
+            'deck': player.deck.size,
+            'battlefield': [_character(minion) for minion in player.battlefield],
+        })
+    data = {
+        'turn': game.turn_num,
+        'who': game.players.index(game.who),
+        'state': game.state.strip('<>'),
+        'winner': None if game.winner is None else game.players.index(game.winner),
+        'players': players,
+    }
+    if player_num is not None:
+        data['actions'] = [_action(action) for action in game.players[player_num].legal_actions()]
+    return data
+
+def _card(card):
+    return {'dob': card.dob, 'name': card.name, 'cost': card.cost}
+
+def _character(character):
+    return {
+        'dob': character.dob,
+        'name': character.name,
+        'attack': character.attack,
+        'health': character.health,
+        'full_health': character.full_health,
+        'status': character.status,
+    }
+
+def _action(action):
+    data = {'op': action.name}
+    for key, value in action.items():
+        if key != 'name':
+            data[key] = value if isinstance(value, int) else value.dob
+    return data
+
+
+def diff(old, new):
+    """Return the difference between two states (see above).
+
+    >>> diff({'a': 1, 'b': {'c': 2, 'd': 3}}, {'a': 1, 'b': {'c': 2, 'd': 4}})
+    {'b': {'d': 4}}
+    """
+
+    result = {}
+    for key, value in new.items():
+        old_value = old.get(key)
+        if isinstance(value, dict) and isinstance(old_value, dict):
+            value = diff(old_value, value)
+            if value:
+                result[key] = value
+        elif key not in old or value != old_value:
+            result[key] = value
+    return result
+
+
+class Server:
+    """A server of games, played by requests of connections.
+
+    Requests are handled on the event loop, one at a time for each game.
+    Each is a few engine calls, so a server hosts many games without a
+    thread for each; the agents of the server decide in the executor of
+    the loop, or on the loop if their decide is a coroutine function.
+    """
+
+    def __init__(self, seed=None):
+        self.rng = Random(seed)
+        # Games by id, each with its watchers: the view and last state
+        # of each connection
+        self.games = {}
+        self._ids = itertools.count(1)
+
+    async def request(self, connection, request):
+        """Handle a request of a connection; return the reply."""
+        reply = {}
+        if isinstance(request, dict) and 'id' in request:
+            reply['id'] = request['id']
+        try:
+            if not isinstance(request, dict):
+                raise RequestError('request is not an object')
+            op = request.get('op')
+            if op == 'new':
+                reply.update(await self._new(connection, request))
+            elif op in ('watch', 'state', 'close') or op in ACTIONS:
+                game_id = request.get('game')
+                entry = self._entry(game_id)
+                # Wait for the agents of the server to finish their turn
+                async with entry.lock:
+                    if self._entry(game_id) is not entry:
+                        raise RequestError('game {game_id} is closed'.format(game_id=game_id))
+                    if op == 'watch':
+                        reply.update(self._watch(connection, game_id, request))
+                    elif op == 'state':
+                        player_num = self._player_num(request, True)
+                        if player_num is not None:
+                            self._check_seat(entry, connection, player_num)
+                        reply['state'] = state(entry.game, player_num, public=True)
+                    elif op == 'close':
+                        if entry.owner is not connection:
+                            raise RequestError('game {game_id} is not yours'.format(game_id=game_id))
+                        del self.games[game_id]
+                    else:
+                        reply.update(await self._act(connection, game_id, op, request))
+            else:
+                raise RequestError('unknown op: {op}'.format(op=op))
+        except (GameException, RequestError) as e:
+            reply.update(ok=False, error=type(e).__name__, message=str(e))
+        except Exception as e:
+            # A bug must not take the connection down
+            logging.exception('Request failed: %r', request)
+            reply.update(ok=False, error=type(e).__name__, message=str(e))
+        else:
+            reply['ok'] = True
+        return reply
+
+    def disconnect(self, connection):
+        """Drop the games of a connection; stop it watching the others."""
+        for game_id, entry in list(self.games.items()):
+            if entry.owner is connection:
+                del self.games[game_id]
+                continue
+            entry.watchers.pop(connection, None)
+            entry.seats = [None if seat is connection else seat for seat in entry.seats]
+
+    def _entry(self, game_id):
+        try:
+            return self.games[game_id]
+        except (KeyError, TypeError):
+            raise RequestError('unknown game: {game_id}'.format(game_id=game_id))
+
+    async def _new(self, connection, request):
+        specs = request.get('players')
+        if not isinstance(specs, list) or len(specs) != 2:
+            raise RequestError('two players are needed')
+        player_num = self._player_num(request, True)
+        try:
+            agents = [self._agent(spec) for spec in specs]
+            # Players without an agent class are remote
+            remote = [type(agent) is Agent for agent in agents]
+            if player_num is not None and not remote[player_num]:
+                raise RequestError('player {num} is played by the server'.format(num=player_num))
+            seed = request.get('seed')
+            rng = Random(seed) if seed is not None else self.rng.split()
+            game = Game(agents, rng=rng, log=False)
+        except (TypeError, ValueError, KeyError) as e:
+            raise RequestError('invalid players: {error}'.format(error=e))
+        game_id = next(self._ids)
+        entry = self.games[game_id] = Dict(game=game, remote=remote, owner=connection,
+                                           seats=[None, None], watchers={}, lock=asyncio.Lock())
+        async with entry.lock:
+            await self._run_agents(entry)
+            reply = self._watch(connection, game_id, request)
+        reply['game'] = game_id
+        return reply
+
+    def _agent(self, spec):
+        if not isinstance(spec, dict):
+            raise TypeError('player is not an object')
+        agent_class = get_class(spec['agent'], '.agents') if 'agent' in spec else Agent
+        return agent_class(str(spec.get('name', 'Player')), hero=spec['hero'], deck=list(spec['deck']))
+
+    def _watch(self, connection, game_id, request):
+        entry = self.games[game_id]
+        player_num = self._player_num(request, True)
+        if player_num is not None:
+            self._take_seat(entry, connection, player_num)
+        data = state(entry.game, player_num, public=True)
+        entry.watchers[connection] = Dict(player_num=player_num, state=data)
+        return {'state': data}
+
+    async def _act(self, connection, game_id, op, request):
+        entry = self.games[game_id]
+        game = entry.game
+        player_num = self._player_num(request)
+        player = game.players[player_num]
+        self._check_seat(entry, connection, player_num)
+        action = self._action(game, player, op, request)
+        # The action is made on the game so that a failure leaves no trace
+        try:
+            game.make(action, player)
+        except (TypeError, ValueError) as e:
+            raise RequestError('invalid action: {error}'.format(error=e))
+        finally:
+            game.undo_log = None
+        await self._run_agents(entry)
+        if connection not in entry.watchers:
+            entry.watchers[connection] = Dict(player_num=player_num, state={})
+        return {'diff': self._update(game_id, entry, connection)}
+
+    def _action(self, game, player, op, request):
+        """Return the action of a request, checking its objects."""
+        action = Dict(name=op)
+        try:
+            if request.get('card') is not None:
+                action.card = self._object(game, request['card'], player.hand, 'in your hand')
+            if request.get('source') is not None:
+                action.source = self._object(game, request['source'], player.characters, 'your character')
+            if request.get('target') is not None:
+                action.target = self._object(game, request['target'], game.characters, 'a character in play')
+            if request.get('position') is not None:
+                position = request['position']
+                if not isinstance(position, int) or not 0 <= position <= player.battlefield.size:
+                    raise RequestError('invalid position: {position}'.format(position=position))
+                action.position = position
+            if request.get('cards') is not None:
+                dobs = request['cards']
+                if not isinstance(dobs, list) or len(set(dobs)) != len(dobs):
+                    raise RequestError('invalid cards: {dobs}'.format(dobs=dobs))
+                action.cards = [self._object(game, dob, player.hand, 'in your hand') for dob in dobs]
+        except TypeError as e:
+            raise RequestError('invalid arguments: {error}'.format(error=e))
+        return action
+
+    def _object(self, game, dob, objects, description):
+        try:
+            object = game.find(dob)
+        except KeyError:
+            raise RequestError('no object of dob {dob}'.format(dob=dob))
+        if not any(object is other for other in objects):
+            raise RequestError('{object} is not {description}'.format(object=object.name, description=description))
+        return object
+
+    def _take_seat(self, entry, connection, player_num):
+        if not entry.remote[player_num]:
+            raise RequestError('player {num} is played by the server'.format(num=player_num))
+        if entry.seats[player_num] not in (None, connection):
+            raise RequestError('player {num} is taken'.format(num=player_num))
+        entry.seats[player_num] = connection
+
+    def _check_seat(self, entry, connection, player_num):
+        if not entry.remote[player_num]:
+            raise RequestError('player {num} is played by the server'.format(num=player_num))
+        if entry.seats[player_num] is not connection:
+            raise RequestError('player {num} is not yours'.format(num=player_num))
+
+    async def _run_agents(self, entry):
+        # Let the agents of the server play until a remote player is to act
+        game = entry.game
+        player = None
+        try:
+            for num, player in enumerate(game.players):
+                if game.state == Game.REPLACING and not entry.remote[num] and not player.replaced:
+                    player._do_action(Dict(name='replace'))
+            while game.state == Game.PLAYING and not entry.remote[game.players.index(game.who)]:
+                if game.turn_num >= Game.MAX_TURNS:
+                    game.finish(None)
+                player = game.who
+                player._do_action(await game._decide_async(player.agent, in_executor=True))
+        except GameOver:
+            pass
+        except Exception:
+            # An agent which fails forfeits, so the game is not stuck on it
+            logging.exception('Agent of %s failed', player.name)
+            try:
+                game.finish(player.opponent)
+            except GameOver:
+                pass
+
+    def _update(self, game_id, entry, connection):
+        """Send the diffs of a game to its watchers; return the one of a connection."""
+        result = None
+        for watcher, view in list(entry.watchers.items()):
+            if watcher is not connection and watcher.congested():
+                # Updates are not queued without bound for a slow client
+                del entry.watchers[watcher]
+                continue
+            data = state(entry.game, view.player_num, public=True)
+            changes = diff(view.state, data)
+            view.state = data
+            if watcher is connection:
+                result = changes
+            elif changes:
+                watcher.send({'event': 'update', 'game': game_id, 'diff': changes})
+        return result
+
+    def _player_num(self, request, optional=False):
+        player_num = request.get('player')
+        if player_num is None and optional:
+            return None
+        if player_num not in (0, 1):
+            raise RequestError('invalid player: {num}'.format(num=player_num))
+        return player_num
+
+
+class Connection:
+    """A connection of a client, sending JSON lines."""
+
+    # Bytes a client may leave unread before it stops getting updates
+    MAX_BUFFER = 1 << 20
+
+    def __init__(self, writer):
+        self.writer = writer
+
+    def send(self, message):
+        self.writer.write(json.dumps(message).encode('utf-8') + b'\n')
+
+    def congested(self):
+        """Return whether the client is too slow to read its updates."""
+        return self.writer.transport.get_write_buffer_size() > self.MAX_BUFFER
+
+
+async def handle(server, reader, writer):
+    """Serve the requests of a client until it disconnects."""
+    connection = Connection(writer)
+    try:
+        while True:
+            line = await reader.readline()
+            if not line:
+                break
+            try:
+                request = json.loads(line)
+            except ValueError as e:
+                reply = {'ok': False, 'error': 'RequestError', 'message': 'invalid JSON: {error}'.format(error=e)}
+            else:
+                reply = await server.request(connection, request)
+            connection.send(reply)
+            await writer.drain()
+    except ConnectionError:
+        pass
+    finally:
+        server.disconnect(connection)
+        writer.close()
+
+
+async def serve(host='127.0.0.1', port=8765, path=None, seed=None):
+    """Run a server on a TCP port, or on a Unix socket if a path is given."""
+    server = Server(seed)
+    callback = lambda reader, writer: handle(server, reader, writer)
+    if path is not None:
+        listener = await asyncio.start_unix_server(callback, path)
+    else:
+        listener = await asyncio.start_server(callback, host, port)
+    for socket in listener.sockets:
+        logging.info('Serving on %s', socket.getsockname())
+    async with listener:
+        await listener.serve_forever()
+
+
+def main(args=sys.argv[1:]):
+    parser = argparse.ArgumentParser(
+        prog='python3 -m simplehs.server',
+        description='Serve games to remote agents over line-delimited JSON.',
+    )
+    parser.add_argument('--host', default='127.0.0.1',
+                        help='host to listen on (default: 127.0.0.1)')
+    parser.add_argument('--port', type=int, default=8765,
+                        help='port to listen on (default: 8765)')
+    parser.add_argument('--socket', metavar='PATH',
+                        help='listen on a Unix socket instead')
+    parser.add_argument('-s', '--seed', type=int, default=None,
+                        help='seed of the games (default: random)')
+    options = parser.parse_args(args)
+    logging.basicConfig(level=logging.INFO)
+    try:
+        asyncio.run(serve(options.host, options.port, options.socket, options.seed))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+# Headless batch self-play
+
+import argparse
+import multiprocessing
+import sys
+import time
+
+from .base import Game
+from .stats import Stats
+from .utils import Dict
+from .utils import Random
+from .utils import get_class
+
+
+def parse_spec(text):
+    """Parse an agent spec of the form AGENT:HERO:CARD[*N],CARD[*N],...
+
+    >>> spec = parse_spec('NaiveAgent:Mage:Fireball*2,Wisp')
+    >>> spec.agent, spec.hero, spec.deck
+    ('NaiveAgent', 'Mage', ['Fireball', 'Fireball', 'Wisp'])
+    """
+
+    try:
+        agent, hero, cards = text.split(':')
+    except ValueError:
+        raise ValueError('invalid agent spec: {text}'.format(text=text))
+    deck = []
+    for card in cards.split(','):
+        if not card:
+            continue
+        name, _, count = card.partition('*')
+        deck.extend([name] * int(count or 1))
+    return Dict(agent=agent, hero=hero, deck=deck)
+
+
+def make_agent(spec, name):
+    """Create an agent from a spec."""
+    agent_class = get_class(spec.agent, '.agents')
+    return agent_class(name, hero=spec.hero, deck=list(spec.deck))
+
+
+def make_rng(seed, game_num):
+    """Return the random generator of a game in a seeded batch."""
+    return Random(seed).stream(game_num)
+
+
+def play(specs, seed, game_num, stats=None):
+    """Play one game of a batch.
+
+    Return the index of the winning spec (None for a tie) and the number
+    of turns played.  If stats are given, the phases of the game are
+    counted and timed into them.
+    """
+    agents = [make_agent(spec, 'Player{num}'.format(num=num))
+              for num, spec in enumerate(specs)]
+    game = Game(agents, rng=make_rng(seed, game_num), log=False, stats=stats)
+    winner = game.run()
+    if winner is not None:
+        winner = game.players.index(winner)
+    return winner, game.turn_num + 1
+
+
+def _play_shard(args):
+    specs, seed, game_nums, stats = args
+    stats = Stats() if stats else None
+    return [play(specs, seed, game_num, stats) for game_num in game_nums], stats
+
+
+def simulate(specs, num_games, seed=0, processes=None, shard_size=100, stats=False):
+    """Play a batch of games between two agent specs.
+
+    Games are split into shards of consecutive game numbers and played on
+    a process pool.  Each game is seeded by (seed, game number), so the
+    results do not depend on the sharding or the number of processes.
+    If stats is set, the report has the stats of the phases of all games.
+    """
+    shards = [(specs, seed, range(start, min(start + shard_size, num_games)), stats)
+              for start in range(0, num_games, shard_size)]
+    started = time.perf_counter()
+    if processes == 1:
+        shards = list(map(_play_shard, shards))
+    else:
+        with multiprocessing.Pool(processes) as pool:
+            shards = list(pool.imap(_play_shard, shards))
+    elapsed = time.perf_counter() - started
+    results = [result for shard, shard_stats in shards for result in shard]
+    report = Dict()
+    report.games = num_games
+    report.wins = [sum(1 for winner, turns in results if winner == num)
+                   for num in range(len(specs))]
+    report.ties = sum(1 for winner, turns in results if winner is None)
+    report.win_rates = [wins / num_games for wins in report.wins]
+    report.mean_turns = sum(turns for winner, turns in results) / num_games
+    report.elapsed = elapsed
+    report.games_per_sec = num_games / elapsed if elapsed > 0 else float('inf')
+    if stats:
+        report.stats = Stats()
+        for shard, shard_stats in shards:
+            report.stats.merge(shard_stats)
+    return report
+
+
+def main(args=sys.argv[1:]):
+    parser = argparse.ArgumentParser(
+        prog='python3 -m simplehs.simulate',
+        description='Play a batch of games between two agents.',
+    )
+    parser.add_argument('specs', nargs=2, metavar='SPEC',
+                        help='agent spec: AGENT:HERO:CARD[*N],CARD[*N],...')
+    parser.add_argument('-n', '--games', type=int, default=1000,
+                        help='number of games (default: 1000)')
+    parser.add_argument('-s', '--seed', type=int, default=0,
+                        help='seed of the batch (default: 0)')
+    parser.add_argument('-p', '--processes', type=int, default=None,
+                        help='number of worker processes (default: all cores)')
+    parser.add_argument('--shard-size', type=int, default=100,
+                        help='games per shard (default: 100)')
+    parser.add_argument('--stats', action='store_true',
+                        help='count and time the phases of games')
+    options = parser.parse_args(args)
+    specs = [parse_spec(spec) for spec in options.specs]
+    report = simulate(specs, options.games, seed=options.seed,
+                      processes=options.processes, shard_size=options.shard_size,
+                      stats=options.stats)
+    for num, spec in enumerate(options.specs):
+        print('{spec}: {wins} wins, {rate:0.2f}%'.format(
+            spec=spec,
+            wins=report.wins[num],
+            rate=100.0 * report.win_rates[num],
+        ))
+    print('ties: {ties}'.format(**report))
+    print('mean game length: {mean_turns:0.2f} turns'.format(**report))
+    print('{games} games in {elapsed:0.2f}s, {games_per_sec:0.1f} games/sec'.format(**report))
+    if options.stats:
+        print(report.stats)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+# Instrumentation of game phases
+
+import time
+
+from .utils import Dict
+
+# The phases of a game, in the order they are reported
+PHASES = ('decide', 'next_turn', 'trigger', 'check', 'play', 'attack',
+          'battlecry', 'effect', 'deathrattle')
+
+
+class Stats:
+    """Counts and times of the phases of games (see Game(stats=...)).
+
+    The total time of a phase includes the phases nested in it (e.g. a
+    trigger in next_turn), its own time does not, so own times add up to
+    the time of the outermost phases.  Stats can be merged, e.g. to sum up
+    a batch of games played on several processes.
+    """
+
+    def __init__(self):
+        self.games = 0
+        self.turns = 0
+        # Count, total time and own time of each phase
+        self.phases = {}
+        # Time of nested phases, for each phase being timed
+        self._nested = []
+
+    def time(self, phase, func, /, *args, **kwargs):
+        """Call a function as a phase."""
+        nested = self._nested
+        nested.append(0.0)
+        started = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - started
+            own = elapsed - nested.pop()
+            if nested:
+                nested[-1] += elapsed
+            self.record(phase, elapsed, own)
+
+    def record(self, phase, total, own=None):
+        """Count a phase which took a time, of which own is not nested."""
+        record = self.phases.get(phase)
+        if record is None:
+            record = self.phases[phase] = [0, 0.0, 0.0]
+        record[0] += 1
+        record[1] += total
+        record[2] += total if own is None else own
+
+    def merge(self, other):
+        """Add the counts and times of other stats to these."""
+        self.games += other.games
+        self.turns += other.turns
+        for phase, (count, total, own) in other.phases.items():
+            record = self.phases.setdefault(phase, [0, 0.0, 0.0])
+            record[0] += count
+            record[1] += total
+            record[2] += own
+        return self
+
+    def to_dict(self):
+        """Return the stats as a Dict, with a Dict for each phase."""
+        stats = Dict(games=self.games, turns=self.turns, phases=Dict())
+        for phase in sorted(self.phases, key=_phase_order):
+            count, total, own = self.phases[phase]
+            stats.phases[phase] = Dict(count=count, total=total, own=own)
+        return stats
+
+    def __str__(self):
+        lines = ['{games} games, {turns} turns'.format(games=self.games, turns=self.turns),
+                 '{:<12} {:>10} {:>12} {:>12}'.format('phase', 'count', 'total (s)', 'own (s)')]
+        for phase, record in self.to_dict().phases.items():
+            lines.append('{phase:<12} {count:>10} {total:>12.4f} {own:>12.4f}'.format(
+                phase=phase, **record))
+        return '\n'.join(lines)
+
+
+def _phase_order(phase):
+    return (PHASES.index(phase) if phase in PHASES else len(PHASES), phase)
@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+# Tournaments of decks with adaptive matchups
+
+import argparse
+import itertools
+import math
+import multiprocessing
+import sys
+import time
+
+from .simulate import _play_shard
+from .simulate import parse_spec
+from .utils import Dict
+from .utils import Random
+
+# Quantile of the normal distribution for 95% confidence intervals
+Z = 1.96
+# Elo points per factor 10 of odds
+ELO_SCALE = 400 / math.log(10)
+
+
+def wilson_interval(score, games, z=Z):
+    """Return the Wilson confidence interval of a score (in wins) in games.
+
+    >>> low, high = wilson_interval(50, 100)
+    >>> round(low, 3), round(high, 3)
+    (0.404, 0.596)
+    """
+
+    if games == 0:
+        return (0.0, 1.0)
+    p = score / games
+    denominator = 1 + z * z / games
+    center = (p + z * z / (2 * games)) / denominator
+    half = z * math.sqrt(p * (1 - p) / games + z * z / (4 * games * games)) / denominator
+    return (max(0.0, center - half), min(1.0, center + half))
+
+
+def round_robin(num_entrants):
+    """Return the pairings of a round-robin tournament.
+
+    >>> round_robin(3)
+    [(0, 1), (0, 2), (1, 2)]
+    """
+    return list(itertools.combinations(range(num_entrants), 2))
+
+
+def swiss(ratings, played):
+    """Return the pairings of a Swiss round.
+
+    Entrants are sorted by rating and each is paired with the next one it
+    has not played yet; with an odd number, the last one gets a bye.
+    """
+
+    order = sorted(range(len(ratings)), key=lambda num: (-ratings[num], num))
+    pairings = []
+    while len(order) > 1:
+        first = order.pop(0)
+        for index, second in enumerate(order):
+            if (min(first, second), max(first, second)) not in played:
+                break
+        else:
+            index = 0
+        second = order.pop(index)
+        pairings.append((min(first, second), max(first, second)))
+    return pairings
+
+
+def rate(num_entrants, matchups, prior=1.0, iterations=1000, tolerance=1e-9):
+    """Return the Elo ratings of entrants with their confidence intervals.
+
+    Ratings are fitted to the scores of the matchups by the Bradley-Terry
+    model (with ties as half wins), each matchup having prior virtual ties
+    so that unbeaten entrants have finite ratings.  They average to 0.
+    """
+
+    gammas = [1.0] * num_entrants
+    for iteration in range(iterations):
+        new_gammas = []
+        for num in range(num_entrants):
+            score = 0.0
+            denominator = 0.0
+            for matchup in matchups:
+                if num in matchup.players:
+                    side = matchup.players.index(num)
+                    other = matchup.players[1 - side]
+                    games = matchup.games + prior
+                    score += matchup.scores[side] + prior / 2
+                    denominator += games / (gammas[num] + gammas[other])
+            new_gammas.append(score / denominator if denominator else 1.0)
+        scale = math.exp(sum(math.log(gamma) for gamma in new_gammas) / num_entrants)
+        new_gammas = [gamma / scale for gamma in new_gammas]
+        change = max(abs(new - old) for new, old in zip(new_gammas, gammas))
+        gammas = new_gammas
+        if change < tolerance:
+            break
+    ratings = []
+    for num in range(num_entrants):
+        information = 0.0
+        for matchup in matchups:
+            if num in matchup.players:
+                other = matchup.players[1 - matchup.players.index(num)]
+                p = gammas[num] / (gammas[num] + gammas[other])
+                information += matchup.games * p * (1 - p)
+        elo = ELO_SCALE * math.log(gammas[num])
+        error = ELO_SCALE / math.sqrt(information) if information else float('inf')
+        ratings.append(Dict(elo=elo, low=elo - Z * error, high=elo + Z * error))
+    return ratings
+
+
+class Tournament:
+    """A tournament between entrants (agent specs, see simulate.parse_spec).
+
+    Each matchup is played in batches of games on a process pool until the
+    confidence interval of its score is narrower than the precision, or
+    excludes an even score, or the matchup reaches max_games.  So close
+    matchups get the games and lopsided ones stop early.
+    """
+
+    def __init__(self, entrants, seed=0, precision=0.1, min_games=20,
+                 max_games=1000, batch_size=20, processes=None):
+        self.entrants = [_normalize(entrant) for entrant in entrants]
+        self.seed = seed
+        self.precision = precision
+        self.min_games = min_games
+        self.max_games = max_games
+        self.batch_size = batch_size
+        self.processes = processes
+        self.matchups = {}
+        self.elapsed = 0.0
+
+    @property
+    def games(self):
+        return sum(matchup.games for matchup in self.matchups.values())
+
+    def ratings(self):
+        return rate(len(self.entrants), list(self.matchups.values()))
+
+    def round_robin(self):
+        """Play a round-robin tournament."""
+        self.play(round_robin(len(self.entrants)))
+
+    def swiss(self, rounds):
+        """Play rounds of a Swiss tournament."""
+        for round_num in range(rounds):
+            ratings = [rating.elo for rating in self.ratings()]
+            self.play(swiss(ratings, self.matchups))
+
+    def play(self, pairings):
+        """Play the matchups of pairings until they are decided."""
+        started = time.perf_counter()
+        active = [self._matchup(pairing) for pairing in pairings]
+        active = [matchup for matchup in active if not matchup.done]
+        pool = None
+        if self.processes != 1:
+            pool = multiprocessing.Pool(self.processes)
+        try:
+            while active:
+                shards = []
+                for matchup in active:
+                    size = self.batch_size if matchup.games else max(self.min_games, self.batch_size)
+                    size = min(size, self.max_games - matchup.games)
+                    specs = [self.entrants[num] for num in matchup.players]
+                    shards.append((specs, matchup.seed, range(matchup.games, matchup.games + size), False))
+                if pool is None:
+                    results = map(_play_shard, shards)
+                else:
+                    results = pool.imap(_play_shard, shards)
+                for matchup, (shard, stats) in zip(active, results):
+                    for winner, turns in shard:
+                        matchup.games += 1
+                        if winner is None:
+                            matchup.ties += 1
+                        else:
+                            matchup.wins[winner] += 1
+                    self._update(matchup)
+                active = [matchup for matchup in active if not matchup.done]
+        finally:
+            if pool is not None:
+                pool.close()
+                pool.join()
+        self.elapsed += time.perf_counter() - started
+
+    def report(self):
+        """Return the report of the tournament."""
+        report = Dict()
+        report.entrants = self.entrants
+        report.matchups = sorted(self.matchups.values(), key=lambda matchup: matchup.players)
+        report.ratings = self.ratings()
+        report.games = self.games
+        report.elapsed = self.elapsed
+        return report
+
+    def _matchup(self, pairing):
+        matchup = self.matchups.get(pairing)
+        if matchup is None:
+            matchup = self.matchups[pairing] = Dict(
+                players=pairing,
+                # Seed of the games of the matchup, independent of the others
+                seed=Random(self.seed).stream(pairing[0] * len(self.entrants) + pairing[1]).getrandbits64(),
+                games=0,
+                wins=[0, 0],
+                ties=0,
+            )
+            self._update(matchup)
+        return matchup
+
+    def _update(self, matchup):
+        score = matchup.wins[0] + matchup.ties / 2
+        matchup.scores = (score, matchup.games - score)
+        matchup.interval = low, high = wilson_interval(score, matchup.games)
+        decided = matchup.games >= self.min_games and (
+            high - low <= self.precision or low > 0.5 or high < 0.5)
+        matchup.done = decided or matchup.games >= self.max_games
+
+
+def _normalize(entrant):
+    # Entrants go to worker processes, so classes are passed by name.
+    name = lambda value: value if isinstance(value, str) else value.__name__
+    return Dict(agent=name(entrant.agent), hero=name(entrant.hero),
+                deck=[name(card) for card in entrant.deck])
+
+
+def main(args=sys.argv[1:]):
+    parser = argparse.ArgumentParser(
+        prog='python3 -m simplehs.tournament',
+        description='Rate agents and decks in a tournament.',
+    )
+    parser.add_argument('specs', nargs='+', metavar='SPEC',
+                        help='agent spec: AGENT:HERO:CARD[*N],CARD[*N],...')
+    parser.add_argument('--swiss', type=int, metavar='ROUNDS',
+                        help='play Swiss rounds (default: round robin)')
+    parser.add_argument('--precision', type=float, default=0.1,
+                        help='width of score intervals to stop at (default: 0.1)')
+    parser.add_argument('--min-games', type=int, default=20,
+                        help='minimum games per matchup (default: 20)')
+    parser.add_argument('--max-games', type=int, default=1000,
+                        help='maximum games per matchup (default: 1000)')
+    parser.add_argument('--batch-size', type=int, default=20,
+                        help='games per batch (default: 20)')
+    parser.add_argument('-s', '--seed', type=int, default=0,
+                        help='seed of the tournament (default: 0)')
+    parser.add_argument('-p', '--processes', type=int, default=None,
+                        help='number of worker processes (default: all cores)')
+    options = parser.parse_args(args)
+    if len(options.specs) < 2:
+        parser.error('at least two specs are needed')
+    entrants = [parse_spec(spec) for spec in options.specs]
+    tournament = Tournament(entrants, seed=options.seed, precision=options.precision,
+                            min_games=options.min_games, max_games=options.max_games,
+                            batch_size=options.batch_size, processes=options.processes)
+    if options.swiss:
+        tournament.swiss(options.swiss)
+    else:
+        tournament.round_robin()
+    report = tournament.report()
+    for matchup in report.matchups:
+        first, second = matchup.players
+        low, high = matchup.interval
+        print('{first} vs {second}: {score:0.1f}/{games} [{low:0.2f}, {high:0.2f}]'.format(
+            first=first, second=second, score=matchup.scores[0],
+            games=matchup.games, low=low, high=high))
+    ranking = sorted(range(len(entrants)), key=lambda num: -report.ratings[num].elo)
+    for num in ranking:
+        rating = report.ratings[num]
+        print('{num}: {elo:+0.0f} [{low:+0.0f}, {high:+0.0f}] {spec}'.format(
+            num=num, spec=options.specs[num], **rating))
+    print('{games} games in {elapsed:0.2f}s'.format(**report))
+
+
+if __name__ == '__main__':
+    sys.exit(main())
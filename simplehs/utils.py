@@ -1,6 +1,8 @@
 #!/usr/bin/env python3
 
+import collections
 import importlib
+import os
 
 
 class Dict(dict):
@@ -39,7 +41,22 @@ class List(list):
         return len(self)
 
 
-class Random:
+class Deque(collections.deque):
+    """A deque which has a recursive __str__.
+
+    >>> d = Deque([1, 'x'])
+    >>> d.popleft()
+    1
+    >>> str(d)
+    '[x]'
+    """
+
+    __str__ = List.__str__
+
+    size = List.size
+
+
+class DummyRandom:
     """A dummy pseudo-random generator like random.Random."""
 
     def randrange(self, stop):
@@ -52,36 +69,150 @@ class Random:
     def shuffle(self, iterable):
         return iterable
 
+    def copy(self):
+        return self
+
 
-class MockRandom(Random):
+class MockRandom(DummyRandom):
     """A mock pseudo-random generator like random.Random."""
 
     def __init__(self, sequence):
-        self.sequence = sequence
+        self.sequence = collections.deque(sequence)
 
     def randrange(self, stop):
-        number = self.sequence.pop(0)
+        number = self.sequence.popleft()
         return number % stop
 
+    def copy(self):
+        return MockRandom(self.sequence)
+
+
+class TracingRandom:
+    """A pseudo-random generator which reports each draw of another.
+
+    choice and shuffle are those of the other generator, applied on this
+    one, so their draws are reported too.  Copies are traced too, so a
+    snapshot restored by Game.unmake keeps reporting.
+    """
+
+    def __init__(self, rng, on_draw):
+        self.rng = rng
+        self._on_draw = on_draw
+
+    def randrange(self, stop):
+        number = self.rng.randrange(stop)
+        self._on_draw(number)
+        return number
+
+    def choice(self, iterable):
+        return type(self.rng).choice(self, iterable)
+
+    def shuffle(self, iterable):
+        return type(self.rng).shuffle(self, iterable)
+
+    def copy(self):
+        return TracingRandom(self.rng.copy(), self._on_draw)
+
+
+_MASK64 = (1 << 64) - 1
+_GOLDEN_GAMMA = 0x9e3779b97f4a7c15
+
+def _mix64(z):
+    z = ((z ^ (z >> 30)) * 0xbf58476d1ce4e5b9) & _MASK64
+    z = ((z ^ (z >> 27)) * 0x94d049bb133111eb) & _MASK64
+    return z ^ (z >> 31)
+
+def _mix_gamma(z):
+    z = ((z ^ (z >> 33)) * 0xff51afd7ed558ccd) & _MASK64
+    z = ((z ^ (z >> 33)) * 0xc4ceb9fe1a85ec53) & _MASK64
+    z = (z ^ (z >> 33)) | 1
+    if bin(z ^ (z >> 1)).count('1') < 24:
+        z ^= 0xaaaaaaaaaaaaaaaa
+    return z
+
+
+class Random:
+    """A seedable and splittable pseudo-random generator (SplitMix64).
+
+    Its whole state is two integers, so it is cheap to copy, snapshot and
+    restore.  split() and stream() derive independent generators, e.g. for
+    parallel workers or for the games of a seeded batch.
+
+    >>> rng = Random(42)
+    >>> state = rng.getstate()
+    >>> numbers = [rng.randrange(100) for i in range(5)]
+    >>> rng.setstate(state)
+    >>> numbers == [rng.randrange(100) for i in range(5)]
+    True
+    >>> Random(42).stream(7).randrange(100) == Random(42).stream(7).randrange(100)
+    True
+    """
+
+    def __init__(self, seed=None, gamma=_GOLDEN_GAMMA):
+        if seed is None:
+            seed = int.from_bytes(os.urandom(8), 'little')
+        self._state = seed & _MASK64
+        self._gamma = gamma
+
+    def getrandbits64(self):
+        """Return a random 64-bit integer."""
+        self._state = state = (self._state + self._gamma) & _MASK64
+        return _mix64(state)
+
+    def randrange(self, stop):
+        # The modulo bias is below stop / 2 ** 64.
+        return self.getrandbits64() % stop
+
     def choice(self, iterable):
         index = self.randrange(len(iterable))
         return iterable[index]
 
     def shuffle(self, iterable):
+        for index in range(len(iterable) - 1, 0, -1):
+            other = self.randrange(index + 1)
+            iterable[index], iterable[other] = iterable[other], iterable[index]
         return iterable
 
+    def copy(self):
+        return Random(self._state, self._gamma)
+
+    def getstate(self):
+        return (self._state, self._gamma)
+
+    def setstate(self, state):
+        self._state, self._gamma = state
+
+    def split(self):
+        """Return a new generator independent of this one (which advances)."""
+        seed = self.getrandbits64()
+        self._state = state = (self._state + self._gamma) & _MASK64
+        return Random(seed, _mix_gamma(state))
 
-def get_class(class_):
-    """Return the class from a class or its name."""
+    def stream(self, index):
+        """Return the index-th independent generator derived from this one.
+
+        This one does not advance, so stream(index) depends only on the
+        current state and the index.
+        """
+        base = self._state + 2 * index * self._gamma
+        seed = _mix64((base + self._gamma) & _MASK64)
+        gamma = _mix_gamma((base + 2 * self._gamma) & _MASK64)
+        return Random(seed, gamma)
+
+
+def get_class(class_, module_name='.base'):
+    """Return the class from a class or its name.
+
+    A name is looked up in the given module of the simplehs package.
+    """
     if isinstance(class_, type):
         return class_
     if isinstance(class_, str):
-        # TODO: Resolve the class name
-        module = importlib.import_module('.base', 'simplehs')
-        namespace = module.__dict__
-        if class_ in namespace:
-            return namespace[class_]
-    raise ValueError('unknown class')
+        module = importlib.import_module(module_name, 'simplehs')
+        result = getattr(module, class_, None)
+        if isinstance(result, type):
+            return result
+    raise ValueError('unknown class: {class_}'.format(class_=class_))
 
 
 def join_args(args):
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+
+import multiprocessing
+import unittest
+from unittest import mock
+
+from simplehs import *
+from simplehs.agents import *
+from simplehs.heroes import *
+from simplehs.cards import *
+
+
+class TestMCTSAgent(unittest.TestCase):
+
+    def setUp(self):
+        alice_agent = MCTSAgent(
+            'Alice',
+            hero=Mage,
+            deck=[],
+            iterations=200,
+            seed=0,
+        )
+        bob_agent = NaiveAgent(
+            'Bob',
+            hero=Innkeeper,
+            deck=[],
+        )
+        agents = (alice_agent, bob_agent)
+        self.game = Game(agents, debug=True, log=False)
+
+    #def tearDown(self):
+    #    print(self.game)
+
+    def test_lethal(self):
+        game = self.game
+        alice = game.players[0]
+        bob = game.players[1]
+        alice.end()
+        for num in range(2):
+            bob.acquire(ChillwindYeti)
+            bob.play(bob.hand[-1])
+        bob.end()
+        alice.hero.health = 4
+        bob.hero.health = 6
+        alice.acquire(Wisp)
+        alice.acquire(Fireball)
+        action = alice.agent.decide()
+        self.assertEqual(action.name, 'play')
+        self.assertEqual(action.card.name, 'Fireball')
+        self.assertIs(action.target, bob.hero)
+
+    def test_end(self):
+        game = self.game
+        alice = game.players[0]
+        action = alice.agent.decide()
+        self.assertEqual(action.name, 'end')
+
+    def test_processes(self):
+        self.game.players[0].agent.processes = 2
+        self.check_lethal()
+
+    def test_spawn(self):
+        # Workers get the game serialized, so they need not be forked
+        context = multiprocessing.get_context('spawn')
+        self.game.players[0].agent.processes = 2
+        with mock.patch.object(multiprocessing, 'Pool', context.Pool):
+            self.check_lethal()
+
+    def test_no_pool(self):
+        self.game.players[0].agent.processes = 2
+        with mock.patch.object(multiprocessing, 'Pool', side_effect=OSError('no processes')):
+            self.check_lethal()
+
+    def check_lethal(self):
+        game = self.game
+        alice = game.players[0]
+        bob = game.players[1]
+        alice.end()
+        for num in range(2):
+            bob.acquire(ChillwindYeti)
+            bob.play(bob.hand[-1])
+        bob.end()
+        alice.hero.health = 4
+        bob.hero.health = 6
+        alice.acquire(Fireball)
+        alice.acquire(ArcaneMissiles)
+        action = alice.agent.decide()
+        self.assertEqual(action.card.name, 'Fireball')
+        self.assertIs(action.target, bob.hero)
+
+    def test_run(self):
+        alice_agent = MCTSAgent('Alice', hero=Mage, deck=[BloodfenRaptor] * 10,
+                                iterations=10, seed=1)
+        bob_agent = NaiveAgent('Bob', hero=Innkeeper, deck=[RiverCrocolisk] * 10)
+        game = Game((alice_agent, bob_agent), log=False)
+        game.run()
+        self.assertEqual(game.state, Game.FINISHED)
+
+    def test_no_iteration(self):
+        game = self.game
+        alice = game.players[0]
+        alice.acquire(Wisp)
+        alice.agent.time_limit = 0
+        action = alice.agent.decide()
+        self.assertEqual(action.name, 'end')
+        with self.assertRaises(ValueError):
+            MCTSAgent('Alice', iterations=None)
@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+
+import asyncio
+import unittest
+
+from simplehs import *
+from simplehs.agents import NaiveAgent
+from simplehs.stats import Stats
+from simplehs.utils import Random
+
+
+class AsyncNaiveAgent(NaiveAgent):
+
+    async def decide(self):
+        # Let the other games go on meanwhile
+        await asyncio.sleep(0)
+        return super().decide()
+
+
+class TestAsync(unittest.TestCase):
+
+    def make_game(self, agent_class, seed, stats=None):
+        agents = (
+            agent_class('Alice', hero='Mage', deck=['LeperGnome', 'Fireball'] * 15),
+            NaiveAgent('Bob', hero='Innkeeper', deck=['NoviceEngineer', 'ManaTideTotem'] * 15),
+        )
+        return Game(agents, rng=Random(seed), log=False, stats=stats)
+
+    def test_run_async(self):
+        games = [self.make_game(AsyncNaiveAgent, seed) for seed in range(8)]
+        async def run_all():
+            return await asyncio.gather(*(game.run_async() for game in games))
+        winners = asyncio.run(run_all())
+        for seed, (game, winner) in enumerate(zip(games, winners)):
+            expected = self.make_game(NaiveAgent, seed)
+            expected.run()
+            self.assertEqual(game.state, Game.FINISHED)
+            self.assertEqual(game.turn_num, expected.turn_num)
+            self.assertEqual(getattr(winner, 'name', None), getattr(expected.winner, 'name', None))
+
+    def test_stats(self):
+        stats = Stats()
+        game = self.make_game(AsyncNaiveAgent, 0, stats)
+        asyncio.run(game.run_async())
+        self.assertEqual(stats.games, 1)
+        self.assertEqual(stats.turns, game.turn_num + 1)
+        self.assertGreater(stats.phases['decide'][0], game.turn_num)
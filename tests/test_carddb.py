@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+
+import os
+import pickle
+import shutil
+import tempfile
+import unittest
+
+from simplehs import *
+from simplehs import carddb
+from simplehs.heroes import *
+from simplehs.utils import get_class
+
+
+class TestCardDatabase(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.json_path = os.path.join(self.directory, 'cards.json')
+        self.path = os.path.join(self.directory, 'cards.db')
+        shutil.copy(carddb.JSON_PATH, self.json_path)
+        self.database = carddb.open_database(self.path, self.json_path)
+
+    def tearDown(self):
+        self.database.close()
+        shutil.rmtree(self.directory)
+
+    def test_get(self):
+        database = self.database
+        self.assertEqual(len(database), len(database.names()))
+        self.assertIn('Fireball', database)
+        self.assertNotIn('Fireballs', database)
+        card = database.get('KoboldGeomancer')
+        self.assertEqual((card.name, card.cost, card.attack, card.health),
+                         ('Kobold Geomancer', 2, 2, 2))
+        self.assertEqual(card.spell_damage, 1)
+        self.assertTrue(card.implemented)
+        self.assertTrue(database.get('GoldshireFootman').taunt)
+        self.assertEqual(database.get('Fireball').effect, 'deal_damage(6)')
+        self.assertEqual(database.get('Fireball').id, 273)
+        self.assertFalse(database.get('IceLance').implemented)
+        with self.assertRaises(KeyError):
+            database.get('Fireballs')
+
+    def test_card_class(self):
+        database = self.database
+        Fireball = database.card_class('Fireball')
+        LeperGnome = database.card_class('LeperGnome')
+        self.assertIs(database.card_class('Fireball'), Fireball)
+        with self.assertRaises(NotImplementedError):
+            database.card_class('IceLance')
+        alice_agent = Dict(name='Alice', hero=Mage, deck=[])
+        bob_agent = Dict(name='Bob', hero=Innkeeper, deck=[])
+        game = Game((alice_agent, bob_agent), debug=True)
+        alice = game.players[0]
+        bob = game.players[1]
+        alice.acquire(LeperGnome)
+        alice.play(alice.hand[-1])
+        alice.acquire(Fireball)
+        alice.play(alice.hand[-1], target=alice.battlefield[-1])
+        self.assertEqual(bob.hero.health, 28)
+
+    def test_invalidation(self):
+        checksum = self.database.checksum
+        database = carddb.open_database(self.path, self.json_path)
+        self.assertEqual(database.checksum, checksum)
+        database.close()
+        with open(self.json_path, 'a') as json_file:
+            json_file.write('\n')
+        database = carddb.open_database(self.path, self.json_path)
+        self.assertNotEqual(database.checksum, checksum)
+        self.assertEqual(database.checksum, carddb.checksum(self.json_path))
+        database.close()
+
+    def test_open(self):
+        # Without a source, a database is neither built nor checked
+        path = os.path.join(self.directory, 'missing.db')
+        with self.assertRaises(OSError):
+            carddb.open_database(path)
+        self.assertFalse(os.path.exists(path))
+        checksum = self.database.checksum
+        with open(self.json_path, 'a') as json_file:
+            json_file.write('\n')
+        database = carddb.open_database(self.path)
+        self.assertEqual(database.checksum, checksum)
+        database.close()
+
+    def test_registry(self):
+        import simplehs.cards as cards
+        Fireball = get_class('Fireball', '.cards')
+        self.assertIs(Fireball, cards.Fireball)
+        self.assertIs(Fireball, cards._open_database().card_class('Fireball'))
+        self.assertEqual(Fireball.__module__, 'simplehs.cards')
+        self.assertIs(pickle.loads(pickle.dumps(Fireball)), Fireball)
+
+    def test_registry_fallback(self):
+        import simplehs.cards as cards
+        # A card missing from the database comes from its module alone
+        cards.FieryWarAxe
+        database = cards._open_database()
+        for name in ('KorkronElite', 'Consecration', 'HammerOfWrath', 'AvengingWrath', 'Sprint'):
+            class_ = getattr(cards, name)
+            self.assertIs(class_, database.card_class(name))
+            self.assertEqual(class_.__qualname__, name)
+            self.assertIs(pickle.loads(pickle.dumps(class_)), class_)
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+
+import unittest
+
+from simplehs import *
+from simplehs.utils import MockRandom
+from simplehs.heroes import *
+from simplehs.cards import *
+
+
+class TestClone(unittest.TestCase):
+
+    def setUp(self):
+        alice_agent = Dict(
+            name='Alice',
+            hero=Mage,
+            deck=[BloodfenRaptor] * 10,
+        )
+        bob_agent = Dict(
+            name='Bob',
+            hero=Innkeeper,
+            deck=[RiverCrocolisk] * 10,
+        )
+        agents = (alice_agent, bob_agent)
+        self.game = Game(agents, debug=True)
+
+    #def tearDown(self):
+    #    print(self.game)
+
+    def test_clone(self):
+        game = self.game
+        alice = game.players[0]
+        alice.acquire(ManaTideTotem)
+        alice.play(alice.hand[-1])
+        clone = game.clone()
+        self.assertEqual(str(clone), str(game))
+        alice2, bob2 = clone.players
+        self.assertIsNot(alice2, alice)
+        self.assertIs(clone.who, alice2)
+        self.assertIs(alice2.opponent, bob2)
+        self.assertIs(bob2.opponent, alice2)
+        self.assertIs(alice2.agent.player, alice2)
+        self.assertIs(alice.agent.player, alice)
+        totem = alice2.battlefield[-1]
+        self.assertIs(totem.game, clone)
+        self.assertIs(totem.owner, alice2)
+        self.assertIs(totem.card.owner, alice2)
+        self.assertEqual(totem.dob, alice.battlefield[-1].dob)
+        self.assertIs(alice2.deck.owner, alice2)
+        self.assertIs(alice2.deck[0].owner, alice2)
+
+    def test_independence(self):
+        game = self.game
+        alice = game.players[0]
+        bob = game.players[1]
+        clone = game.clone()
+        alice2, bob2 = clone.players
+        alice2.acquire(Fireball)
+        alice2.play(alice2.hand[-1], target=bob2.hero)
+        self.assertEqual(bob2.hero.health, 24)
+        self.assertEqual(bob.hero.health, 30)
+        self.assertEqual(alice.hand.size, 0)
+        alice2.end()
+        self.assertIs(clone.who, bob2)
+        self.assertIs(game.who, alice)
+        bob2.draw()
+        self.assertEqual(bob2.deck.size, 9)
+        self.assertEqual(bob.deck.size, 10)
+
+    def test_date_and_rng(self):
+        game = self.game
+        game.rng = MockRandom([0, 1, 2])
+        alice = game.players[0]
+        clone = game.clone()
+        alice2 = clone.players[0]
+        alice.acquire(Wisp)
+        alice2.acquire(Wisp)
+        self.assertEqual(alice.hand[-1].dob, alice2.hand[-1].dob)
+        self.assertEqual(game.rng.randrange(3), clone.rng.randrange(3))
+        self.assertEqual(game.rng.randrange(3), clone.rng.randrange(3))
+
+    def test_fork(self):
+        game = self.game
+        agents = (Dict(name='Carol'), Dict(name='Dave'))
+        fork = game.fork(agents)
+        self.assertIs(fork.players[0].agent, agents[0])
+        self.assertIs(agents[1].player, fork.players[1])
+        self.assertIsNot(game.players[0].agent, agents[0])
+        self.assertEqual([player.name for player in fork.players], ['Carol', 'Dave'])
+        self.assertEqual(game.players[0].name, 'Alice')
+
+    def test_abilities(self):
+        game = self.game
+        alice = game.players[0]
+        alice.acquire(ArgentSquire)
+        alice.play(alice.hand[-1])
+        alice.acquire(WorgenInfiltrator)
+        alice.play(alice.hand[-1])
+        squire, infiltrator = alice.battlefield
+        self.assertFalse(hasattr(squire, '__dict__'))
+        clone = game.clone()
+        squire2, infiltrator2 = clone.players[0].battlefield
+        self.assertEqual(squire2.status, 'zD')
+        self.assertEqual(infiltrator2.status, 'zS')
+        squire2._divine_shield = False
+        self.assertTrue(squire.divine_shield)
+        self.assertFalse(squire2.divine_shield)
@@ -39,3 +39,33 @@ class TestDeathrattle(unittest.TestCase):
         boar = bob.battlefield[-1]
         bob.attack(boar, hoarder)
         self.assertEqual(alice.hand.size, 1)
+
+    def test_enemy_hero(self):
+        game = self.game
+        alice = game.players[0]
+        bob = game.players[1]
+        alice.acquire(LeperGnome)
+        alice.play(alice.hand[-1])
+        gnome = alice.battlefield[-1]
+        alice.end()
+        bob.acquire(StonetuskBoar)
+        bob.play(bob.hand[-1])
+        bob.attack(bob.battlefield[-1], gnome)
+        self.assertEqual(bob.hero.health, 28)
+        self.assertEqual(alice.hero.health, 30)
+
+    def test_all_characters(self):
+        game = self.game
+        alice = game.players[0]
+        bob = game.players[1]
+        alice.acquire(Abomination)
+        alice.play(alice.hand[-1])
+        abomination = alice.battlefield[-1]
+        alice.acquire(BloodfenRaptor)
+        alice.play(alice.hand[-1])
+        alice.end()
+        bob.acquire(Fireball)
+        bob.play(bob.hand[-1], target=abomination)
+        self.assertEqual(alice.battlefield.size, 0)
+        self.assertEqual(alice.hero.health, 28)
+        self.assertEqual(bob.hero.health, 28)
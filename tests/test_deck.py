@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+
+import unittest
+
+from simplehs import *
+from simplehs.utils import MockRandom
+from simplehs.heroes import *
+from simplehs.cards import *
+
+
+class TestDeck(unittest.TestCase):
+
+    def setUp(self):
+        alice_agent = Dict(
+            name='Alice',
+            hero=Innkeeper,
+            deck=[Wisp, MurlocRaider, BloodfenRaptor, RiverCrocolisk, ChillwindYeti],
+        )
+        bob_agent = Dict(
+            name='Bob',
+            hero=Innkeeper,
+            deck=[RiverCrocolisk] * 5,
+        )
+        agents = (alice_agent, bob_agent)
+        self.game = Game(agents)
+
+    #def tearDown(self):
+    #    print(self.game)
+
+    def test_draw(self):
+        game = self.game
+        alice = game.players[0]
+        self.assertEqual(alice.deck.size, 2)
+        self.assertEqual(str(alice.deck), '[(River Crocolisk, 2), (Chillwind Yeti, 4)]')
+        self.assertEqual(alice.deck[0].name, 'River Crocolisk')
+        alice.draw(2)
+        self.assertEqual(alice.hand[-1].name, 'Chillwind Yeti')
+        self.assertEqual(alice.deck.size, 0)
+        alice.draw(2)
+        self.assertEqual(alice.deck.fatigue, 2)
+        self.assertEqual(alice.hero.health, 27)
+
+    def test_replace(self):
+        game = self.game
+        game.rng = MockRandom([2, 0])
+        alice = game.players[0]
+        wisp, raider, raptor = alice.hand
+        alice.replace([wisp, raptor])
+        self.assertEqual([card.name for card in alice.hand],
+                         ['Bloodfen Raptor', 'Murloc Raider', 'River Crocolisk'])
+        self.assertEqual([card.name for card in alice.deck],
+                         ['Chillwind Yeti', 'Wisp'])
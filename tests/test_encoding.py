@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+
+import unittest
+
+from simplehs import *
+from simplehs.heroes import *
+from simplehs.cards import *
+
+try:
+    import numpy
+    from simplehs.encoding import *
+except ImportError:
+    numpy = None
+
+
+@unittest.skipIf(numpy is None, 'NumPy is not installed')
+class TestEncoding(unittest.TestCase):
+
+    def setUp(self):
+        alice_agent = Dict(
+            name='Alice',
+            hero=Mage,
+            deck=[BloodfenRaptor] * 5,
+        )
+        bob_agent = Dict(
+            name='Bob',
+            hero=Innkeeper,
+            deck=[],
+        )
+        agents = (alice_agent, bob_agent)
+        self.game = Game(agents, debug=True)
+
+    #def tearDown(self):
+    #    print(self.game)
+
+    def test_encode(self):
+        game = self.game
+        alice = game.players[0]
+        bob = game.players[1]
+        alice.acquire(ArgentSquire)
+        alice.play(alice.hand[-1])
+        alice.acquire(Fireball)
+        features = game.encode(alice)
+        self.assertEqual(features.shape, (FEATURES,))
+        self.assertEqual(features.dtype, DTYPE)
+        self.assertEqual(list(features[:2]), [0, 1])
+        side = features[2:2 + SIDE_FEATURES]
+        self.assertEqual(list(side[:8]), [30, 0, 0, 1, 1, 5, 0, 1])
+        self.assertEqual(list(side[8:10]), [0, -1])
+        minion = side[8 + MAX_HAND_SIZE:8 + MAX_HAND_SIZE + MINION_FEATURES]
+        self.assertEqual(list(minion), [1, 1, 1, 1, 1, 0, 0, 1, 0, 0, 0, 0, 0, 0])
+        self.assertFalse(side[8 + MAX_HAND_SIZE + MINION_FEATURES:].any())
+        features = game.encode(bob)
+        self.assertEqual(features[1], 0)
+        opponent = features[2 + SIDE_FEATURES:]
+        self.assertEqual(opponent[7], 1)
+        self.assertEqual(list(opponent[8:10]), [-1, -1])
+
+    def test_encode_batch(self):
+        game = self.game
+        alice = game.players[0]
+        clone = game.clone()
+        clone.players[0].acquire(Wisp)
+        out = numpy.zeros((3, FEATURES), dtype=DTYPE)
+        result = encode_batch([game, clone], [alice, clone.players[0]], out)
+        self.assertIs(result, out)
+        self.assertTrue((out[0] == game.encode(alice)).all())
+        self.assertFalse((out[0] == out[1]).all())
+        self.assertFalse(out[2].any())
+
+    def test_overfull_hand(self):
+        game = self.game
+        alice = game.players[0]
+        for num in range(MAX_HAND_SIZE + 2):
+            alice.acquire(Fireball)
+        alice.acquire(ArgentSquire)
+        alice.play(alice.hand[-1])
+        features = game.encode(alice)
+        side = features[2:2 + SIDE_FEATURES]
+        self.assertEqual(side[7], MAX_HAND_SIZE + 2)
+        self.assertEqual(list(side[8:8 + MAX_HAND_SIZE]), [0] * MAX_HAND_SIZE)
+        self.assertEqual(side[8 + MAX_HAND_SIZE], 1)
+        self.assertEqual(game.encode(game.players[1])[2 + SIDE_FEATURES + 7], MAX_HAND_SIZE + 2)
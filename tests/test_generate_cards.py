@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+
+import unittest
+
+from simplehs import generate_cards
+
+
+class TestGenerateCards(unittest.TestCase):
+
+    def test_generate(self):
+        card_info = {'name': 'Wisp', 'type': 4, 'quality': 1, 'cost': 0,
+                     'attack': 1, 'health': 1, 'description': ''}
+        class_, class_name, code, success, unimplemented = generate_cards._generate(card_info)
+        self.assertEqual(class_, 'neutral')
+        self.assertEqual(class_name, 'Wisp')
+        self.assertTrue(success)
+        self.assertEqual(unimplemented, [])
+
+    def test_report_coverage(self):
+        results = [
+            ['neutral', 'Wisp', '', True, []],
+            ['neutral', 'Foo', '', False, ['bar', 'baz']],
+            ['mage', 'Qux', '', False, ['bar']],
+        ]
+        report = generate_cards.report_coverage(results)
+        self.assertEqual(report['generated'], 1)
+        self.assertEqual(report['total'], 3)
+        self.assertEqual(report['classes']['neutral']['generated'], 1)
+        self.assertEqual(report['classes']['neutral']['total'], 2)
+        self.assertEqual(report['classes']['neutral']['unimplemented'], ['Foo'])
+        self.assertEqual(list(report['phrases']), ['bar', 'baz'])
+        self.assertEqual(report['phrases']['bar'], ['Foo', 'Qux'])
+
+    def test_parse_piece(self):
+        node = generate_cards.parse_piece('battlecry: deal 1 damage')
+        self.assertEqual(node.kind, 'ability')
+        self.assertEqual(node.name, 'battlecry')
+        self.assertEqual(node.value.kind, 'action')
+        self.assertEqual(node.value.name, 'deal_damage')
+        self.assertEqual(node.value.args, (1,))
+        self.assertEqual(generate_cards.to_code(node.value), 'deal_damage(1)')
+        node = generate_cards.parse_piece('deal 4 damage to a minion and 1 damage to all other minions')
+        self.assertEqual(generate_cards.to_code(node),
+                         '[deal_damage(4, target="a minion"), deal_damage(1, target="all other minions")]')
+        self.assertEqual(generate_cards.process('spell damage +1'), ('spell_damage', 1))
+        self.assertIsNone(generate_cards.parse_piece('draw a dream card'))
+        self.assertIsNone(generate_cards.parse_piece('battlecry: taunt'))
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+
+import unittest
+
+from simplehs import *
+from simplehs.heroes import *
+from simplehs.cards import *
+
+
+class TestLegalActions(unittest.TestCase):
+
+    def setUp(self):
+        alice_agent = Dict(
+            name='Alice',
+            hero=Mage,
+            deck=[],
+        )
+        bob_agent = Dict(
+            name='Bob',
+            hero=Innkeeper,
+            deck=[],
+        )
+        agents = (alice_agent, bob_agent)
+        self.game = Game(agents, debug=True)
+
+    #def tearDown(self):
+    #    print(self.game)
+
+    def assertAllLegal(self, game):
+        player = game.who
+        actions = player.legal_actions()
+        for num in range(len(actions)):
+            clone = game.clone()
+            action = clone.who.legal_actions()[num]
+            try:
+                clone.who._do_action(action)
+            except GameOver:
+                pass
+
+    def test_replace(self):
+        alice_agent = Dict(name='Alice', hero=Innkeeper, deck=[Wisp] * 10)
+        bob_agent = Dict(name='Bob', hero=Innkeeper, deck=[Wisp] * 10)
+        game = Game((alice_agent, bob_agent))
+        alice = game.players[0]
+        bob = game.players[1]
+        self.assertEqual([action.name for action in alice.legal_actions()], ['replace'])
+        alice.replace()
+        self.assertEqual(alice.legal_actions(), [])
+        self.assertEqual([action.name for action in bob.legal_actions()], ['replace'])
+
+    def test_play(self):
+        game = self.game
+        alice = game.players[0]
+        bob = game.players[1]
+        self.assertEqual(bob.legal_actions(), [])
+        alice.acquire(Wisp)
+        alice.acquire(Fireball)
+        actions = alice.legal_actions()
+        self.assertEqual(len(actions), 1 + 2 + 1)
+        self.assertEqual(actions[0].position, 0)
+        self.assertEqual([action.target for action in actions[1:3]], [bob.hero, alice.hero])
+        self.assertEqual(actions[-1].name, 'end')
+        self.assertAllLegal(game)
+
+    def test_attack(self):
+        game = self.game
+        alice = game.players[0]
+        bob = game.players[1]
+        alice.acquire(StonetuskBoar)
+        alice.play(alice.hand[-1])
+        self.assertEqual(len(alice.legal_actions()), 1 + 1)
+        alice.end()
+        bob.acquire(WorgenInfiltrator)
+        bob.play(bob.hand[-1])
+        bob.acquire(GoldshireFootman)
+        bob.play(bob.hand[-1])
+        bob.acquire(Wisp)
+        bob.play(bob.hand[-1])
+        bob.end()
+        actions = alice.legal_actions()
+        self.assertEqual(len(actions), 1 + 1)
+        self.assertEqual(actions[0].target.name, 'Goldshire Footman')
+        self.assertAllLegal(game)
+        alice._do_action(actions[0])
+        self.assertEqual([action.name for action in alice.legal_actions()], ['end'])
@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+
+import logging
+import unittest
+
+from simplehs import *
+from simplehs.heroes import *
+from simplehs.cards import *
+
+
+class TestLog(unittest.TestCase):
+
+    def make_game(self, log):
+        alice_agent = Dict(
+            name='Alice',
+            hero=Innkeeper,
+            deck=[],
+        )
+        bob_agent = Dict(
+            name='Bob',
+            hero=Innkeeper,
+            deck=[],
+        )
+        agents = (alice_agent, bob_agent)
+        return Game(agents, debug=True, log=log)
+
+    def test_log(self):
+        game = self.make_game(True)
+        alice = game.players[0]
+        with self.assertLogs(level=logging.INFO) as logs:
+            alice.acquire(Wisp)
+            alice.play(alice.hand[-1])
+        self.assertEqual(logs.output, ['INFO:root:Alice: Summoned (Wisp:z, 1, 1/1) at 0'])
+
+    def test_no_log(self):
+        game = self.make_game(False)
+        alice = game.players[0]
+        with self.assertRaises(AssertionError):
+            with self.assertLogs(level=logging.DEBUG):
+                alice.acquire(Wisp)
+                alice.play(alice.hand[-1])
+                alice.end()
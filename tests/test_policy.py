@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+
+import unittest
+
+from simplehs import *
+from simplehs.agents import BatchedPolicyAgent
+from simplehs.agents import NaiveAgent
+from simplehs.utils import Random
+from simplehs.utils import get_class
+
+try:
+    import numpy
+    from simplehs.encoding import FEATURES
+    from simplehs.policy import *
+except ImportError:
+    numpy = None
+
+
+@unittest.skipIf(numpy is None, 'NumPy is not installed')
+class TestPolicy(unittest.TestCase):
+
+    def make_game(self, coordinator, seed):
+        agents = (
+            BatchedPolicyAgent('Alice', hero='Mage', deck=['BloodfenRaptor', 'Fireball'] * 15,
+                               coordinator=coordinator),
+            NaiveAgent('Bob', hero='Innkeeper', deck=['RiverCrocolisk'] * 30),
+        )
+        return Game(agents, rng=Random(seed), log=False)
+
+    def test_run(self):
+        coordinator = Coordinator()
+        games = [self.make_game(coordinator, seed) for seed in range(10)]
+        winners = coordinator.run(games)
+        for game in games:
+            self.assertEqual(game.state, Game.FINISHED)
+        self.assertGreater(sum(winner is game.players[0] for game, winner in zip(games, winners)), 5)
+        # Decisions of the games are scored together
+        decisions = sum(game.turn_num for game in games) // 2
+        self.assertLess(coordinator.batches, decisions)
+
+    def test_scorer(self):
+        batches = []
+        def scorer(features):
+            batches.append(features.shape)
+            return -LinearScorer()(features)
+        coordinator = Coordinator(scorer)
+        games = [self.make_game(coordinator, seed) for seed in range(3)]
+        coordinator.run(games)
+        self.assertEqual(len(batches), coordinator.batches)
+        self.assertEqual(sum(rows for rows, columns in batches), coordinator.boards)
+        self.assertTrue(all(columns == FEATURES for rows, columns in batches))
+
+    def test_afterstate(self):
+        agents = (Dict(name='Alice', hero='Mage', deck=[]),
+                  Dict(name='Bob', hero='Innkeeper', deck=[]))
+        game = Game(agents, debug=True, log=False)
+        alice = game.players[0]
+        alice.acquire(get_class('BloodfenRaptor', '.cards'))
+        action = Dict(name='play', card=alice.hand[-1], position=0)
+        after = afterstate(game, action)
+        self.assertEqual(alice.hand.size, 1)
+        self.assertEqual(alice.battlefield.size, 0)
+        self.assertEqual(after.players[0].hand.size, 0)
+        self.assertEqual(after.players[0].battlefield[0].name, action.card.name)
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+
+import random
+import unittest
+
+from simplehs import *
+from simplehs.utils import Random
+from simplehs.heroes import *
+from simplehs.cards import *
+
+
+class TestRandom(unittest.TestCase):
+
+    def test_seed(self):
+        rng = Random(1)
+        rng2 = Random(1)
+        numbers = [rng.randrange(1000) for num in range(100)]
+        self.assertEqual(numbers, [rng2.randrange(1000) for num in range(100)])
+        self.assertTrue(all(0 <= number < 1000 for number in numbers))
+        self.assertGreater(len(set(numbers)), 50)
+
+    def test_shuffle(self):
+        items = list(range(30))
+        Random(2).shuffle(items)
+        self.assertEqual(sorted(items), list(range(30)))
+        self.assertNotEqual(items, list(range(30)))
+
+    def test_snapshot(self):
+        rng = Random(3)
+        state = rng.getstate()
+        copy = rng.copy()
+        numbers = [rng.randrange(1000) for num in range(10)]
+        self.assertEqual(numbers, [copy.randrange(1000) for num in range(10)])
+        rng.setstate(state)
+        self.assertEqual(numbers, [rng.randrange(1000) for num in range(10)])
+
+    def test_split(self):
+        rng = Random(4)
+        child = rng.split()
+        child2 = rng.split()
+        numbers = [child.randrange(1000) for num in range(10)]
+        self.assertNotEqual(numbers, [child2.randrange(1000) for num in range(10)])
+        self.assertNotEqual(numbers, [rng.randrange(1000) for num in range(10)])
+        child = Random(4).split()
+        self.assertEqual(numbers, [child.randrange(1000) for num in range(10)])
+
+    def test_stream(self):
+        rng = Random(5)
+        state = rng.getstate()
+        stream = rng.stream(7)
+        self.assertEqual(rng.getstate(), state)
+        self.assertEqual(stream.getstate(), Random(5).stream(7).getstate())
+        self.assertNotEqual(stream.getstate(), rng.stream(8).getstate())
+
+    def test_game(self):
+        alice_agent = Dict(
+            name='Alice',
+            hero=Innkeeper,
+            deck=[Wisp, MurlocRaider, BloodfenRaptor, RiverCrocolisk, ChillwindYeti] * 6,
+        )
+        bob_agent = Dict(
+            name='Bob',
+            hero=Innkeeper,
+            deck=[RiverCrocolisk] * 30,
+        )
+        agents = (alice_agent, bob_agent)
+        game = Game(agents, rng=Random(6).stream(0))
+        game2 = Game(agents, rng=Random(6).stream(0))
+        self.assertEqual(str(game), str(game2))
+        clone = game.clone()
+        clone.players[0].replace()
+        clone.players[1].replace()
+        game.players[0].replace()
+        game.players[1].replace()
+        self.assertEqual(str(game), str(clone))
+
+    def test_standard_random(self):
+        agents = (Dict(name='Alice', hero=Innkeeper, deck=[Wisp, MurlocRaider] * 15),
+                  Dict(name='Bob', hero=Innkeeper, deck=[RiverCrocolisk] * 30))
+        game = Game(agents, rng=random.Random(7))
+        clone = game.clone()
+        self.assertIsNot(clone.rng, game.rng)
+        self.assertEqual(clone.rng.randrange(1000), game.rng.randrange(1000))
+        mark = game.make(Dict(name='replace'))
+        game.unmake(mark)
+        self.assertEqual(str(game), str(clone))
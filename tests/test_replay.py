@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+
+import io
+import unittest
+from unittest import mock
+
+from simplehs import *
+from simplehs import serialize
+from simplehs.agents import NaiveAgent
+from simplehs.replay import *
+from simplehs.utils import Random
+
+
+class TestReplay(unittest.TestCase):
+
+    def setUp(self):
+        agents = (
+            NaiveAgent('Alice', hero='Mage', deck=['BloodfenRaptor', 'LeperGnome', 'ArcaneMissiles'] * 10),
+            NaiveAgent('Bob', hero='Innkeeper', deck=['RiverCrocolisk', 'ManaTideTotem'] * 15),
+        )
+        self.game = Game(agents, rng=Random(3), log=False)
+        self.file = io.BytesIO()
+        self.recorder = Recorder(self.game, self.file)
+
+    def test_replay(self):
+        game = self.game
+        winner = game.run()
+        self.file.seek(0)
+        replay = Replay(self.file)
+        self.assertGreater(len(replay.actions), game.turn_num)
+        self.assertTrue(replay.draws)
+        game2 = replay.fast_forward(verify=True)
+        self.assertEqual(str(game2), str(game))
+        self.assertEqual(game2.state, Game.FINISHED)
+        self.assertEqual(game2.players.index(game2.winner), game.players.index(winner))
+        self.assertFalse(game2.log)
+
+    def test_fast_forward(self):
+        self.game.run()
+        self.file.seek(0)
+        replay = Replay(self.file)
+        game = replay.fast_forward(4)
+        self.assertEqual(game.turn_num, 4)
+        self.assertEqual(game.who.mana, game.who.full_mana)
+        self.assertEqual(str(replay.fast_forward(4)), str(game))
+        self.assertIsNone(replay.game().turn_num)
+        self.assertEqual(replay.fast_forward(0).turn_num, 0)
+
+    def test_detach(self):
+        game = self.game
+        game.players[0]._do_action(Dict(name='replace'))
+        self.recorder.detach()
+        self.assertIsNone(game.recorder)
+        self.assertIsInstance(game.rng, Random)
+        game.players[1]._do_action(Dict(name='replace'))
+        self.file.seek(0)
+        replay = Replay(self.file)
+        self.assertEqual(len(replay.actions), 1)
+
+    def test_invalid_action(self):
+        game = self.game
+        for player in (game.who, game.who.opponent):
+            player._do_action(Dict(name='replace'))
+        with self.assertRaises(AttackException):
+            game.who._do_action(Dict(name='attack', source=game.who.hero, target=game.who.opponent.hero))
+        game.run()
+        self.file.seek(0)
+        game2 = Replay(self.file).fast_forward(verify=True)
+        self.assertEqual(str(game2), str(game))
+        self.assertEqual(game2.state, Game.FINISHED)
+
+    def test_turn_limit(self):
+        agents = (Agent('Alice', hero='Mage', deck=['BloodfenRaptor'] * 30),
+                  Agent('Bob', hero='Innkeeper', deck=['RiverCrocolisk'] * 30))
+        game = Game(agents, rng=Random(4), log=False)
+        file = io.BytesIO()
+        Recorder(game, file)
+        with mock.patch.object(Game, 'MAX_TURNS', 6):
+            self.assertIsNone(game.run())
+            file.seek(0)
+            game2 = Replay(file).fast_forward(verify=True)
+        self.assertEqual(game.state, Game.FINISHED)
+        self.assertEqual(game2.state, Game.FINISHED)
+        self.assertIsNone(game2.winner)
+        self.assertEqual(str(game2), str(game))
+
+    def test_dumps(self):
+        game = self.game
+        for player in (game.who, game.who.opponent):
+            player._do_action(Dict(name='replace'))
+        data = serialize.dumps(game)
+        game2 = serialize.loads(data, (Agent('Alice'), Agent('Bob')))
+        self.assertEqual(str(game2), str(game))
+        self.assertIsInstance(game2.rng, Random)
+        self.assertEqual(game2.rng.getstate(), game.rng.rng.getstate())
+
+    def test_make(self):
+        game = self.game
+        for player in (game.who, game.who.opponent):
+            player._do_action(Dict(name='replace'))
+        # A probe of the search draws cards, then is unmade
+        game.unmake(game.make(Dict(name='end')))
+        self.assertIsInstance(game.clone().rng, Random)
+        game.run()
+        self.file.seek(0)
+        game2 = Replay(self.file).fast_forward(verify=True)
+        self.assertEqual(str(game2), str(game))
+        self.assertEqual(game2.state, Game.FINISHED)
+
+    def test_failed_draws(self):
+        game = self.game
+        for player in (game.who, game.who.opponent):
+            player._do_action(Dict(name='replace'))
+        def attack(player, **kwargs):
+            player.game.rng.randrange(10)
+            raise AttackException('attack failed after a draw')
+        with mock.patch.object(Player, 'attack', attack):
+            with self.assertRaises(AttackException):
+                game.who._do_action(Dict(name='attack'))
+        game.run()
+        self.file.seek(0)
+        game2 = Replay(self.file).fast_forward(verify=True)
+        self.assertEqual(str(game2), str(game))
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+
+import io
+import unittest
+from unittest import mock
+
+from simplehs import *
+from simplehs import serialize
+from simplehs.utils import Random
+from simplehs.heroes import *
+from simplehs.cards import *
+
+
+class TestSerialize(unittest.TestCase):
+
+    def setUp(self):
+        alice_agent = Dict(
+            name='Alice',
+            hero=Mage,
+            deck=[BloodfenRaptor, LeperGnome, ManaTideTotem] * 5,
+        )
+        bob_agent = Dict(
+            name='Bob',
+            hero=Innkeeper,
+            deck=[RiverCrocolisk, ArgentSquire, BloodmageThalnos] * 5,
+        )
+        self.agents = (alice_agent, bob_agent)
+        self.game = Game(self.agents, rng=Random(7))
+
+    def make_agents(self):
+        return (Dict(name='Alice'), Dict(name='Bob'))
+
+    def test_round_trip(self):
+        game = self.game
+        for player in game.players:
+            player.replace()
+        for turn in range(5):
+            for action in game.who.legal_actions():
+                if action.name == 'play':
+                    game.who._do_action(action)
+                    break
+            game.who.end()
+        game.who.acquire(ManaTideTotem)
+        game.who.mana = 3
+        game.who.play(game.who.hand[-1])
+        self.assertTrue(game._listeners)
+        data = serialize.dumps(game)
+        game2 = serialize.loads(data, self.make_agents())
+        self.assertEqual(str(game2), str(game))
+        self.assertEqual(serialize.dumps(game2), data)
+        self.assertEqual(game2._date, game._date)
+        self.assertEqual(game2.rng.getstate(), game.rng.getstate())
+        alice, bob = game.players
+        alice2, bob2 = game2.players
+        self.assertEqual(game2.players.index(game2.who), game.players.index(game.who))
+        self.assertIs(alice2.opponent, bob2)
+        self.assertIs(alice2.agent.player, alice2)
+        self.assertEqual([card.dob for card in alice2.deck], [card.dob for card in alice.deck])
+        self.assertEqual(alice2.spell_damage, alice.spell_damage)
+        self.assertEqual(bob2.spell_damage, bob.spell_damage)
+        self.assertEqual({timing: [character.dob for character in listeners]
+                          for timing, listeners in game2._listeners.items()},
+                         {timing: [character.dob for character in listeners]
+                          for timing, listeners in game._listeners.items()})
+        for minion2, minion in zip(alice2.battlefield, alice.battlefield):
+            self.assertIs(minion2.owner, alice2)
+            self.assertIs(minion2.card.owner, alice2)
+            self.assertIs(minion2.deathrattle, minion.deathrattle)
+            self.assertIs(minion2.trigger, minion.trigger)
+        # Both games go on alike
+        for turn in range(3):
+            for current in (game, game2):
+                current.who.end()
+        self.assertEqual(str(game2), str(game))
+
+    def test_stream(self):
+        game = self.game
+        file = io.BytesIO()
+        encoder = serialize.Encoder(file)
+        encoder.encode(game)
+        game.players[0].replace()
+        encoder.encode(game)
+        file.seek(0)
+        decoder = serialize.Decoder(file)
+        game1 = decoder.decode(self.make_agents())
+        game2 = decoder.decode(self.make_agents())
+        self.assertFalse(game1.players[0].replaced)
+        self.assertTrue(game2.players[0].replaced)
+        self.assertEqual(str(game2), str(game))
+        with self.assertRaises(EOFError):
+            decoder.decode(self.make_agents())
+
+    def test_card_ids(self):
+        self.assertEqual(serialize.card_id(Wisp()), 5)
+        self.assertIs(serialize.card_class(5), Wisp)
+        self.assertIs(serialize.card_class(serialize.card_id(TheCoin())), TheCoin)
+        with self.assertRaises(ValueError):
+            serialize.card_class(0)
+
+    def test_card_ids(self):
+        ids = serialize.card_ids()
+        self.assertEqual(ids['Fireball'], 273)
+        # A worker may have the card database only
+        with mock.patch.object(serialize, '_card_ids', None), \
+                mock.patch('simplehs.carddb.JSON_PATH', '/nonexistent/cards.json'):
+            self.assertEqual(serialize.card_ids(), ids)
@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+
+import asyncio
+import json
+import threading
+import unittest
+from unittest import mock
+
+from simplehs import *
+from simplehs.agents import NaiveAgent
+from simplehs.serialize import dumps
+from simplehs.server import *
+
+
+class MockConnection:
+
+    def __init__(self):
+        self.messages = []
+        self.slow = False
+
+    def send(self, message):
+        self.messages.append(message)
+
+    def congested(self):
+        return self.slow
+
+
+class TestServer(unittest.TestCase):
+
+    def setUp(self):
+        self.server = Server(seed=1)
+        self.alice = MockConnection()
+        self.bob = MockConnection()
+        reply = self.call(self.alice, {
+            'id': 1,
+            'op': 'new',
+            'seed': 2,
+            'player': 0,
+            'players': [
+                {'name': 'Alice', 'hero': 'Mage', 'deck': ['BloodfenRaptor'] * 30},
+                {'name': 'Bob', 'hero': 'Innkeeper', 'deck': ['RiverCrocolisk'] * 30},
+            ],
+        })
+        self.assertTrue(reply['ok'])
+        self.assertEqual(reply['id'], 1)
+        self.game_id = reply['game']
+        self.state = reply['state']
+        self.assertTrue(self.request(self.bob, 'watch', player=1)['ok'])
+        self.connections = (self.alice, self.bob)
+
+    def call(self, connection, request):
+        return asyncio.run(self.server.request(connection, request))
+
+    def request(self, connection, op, **kwargs):
+        return self.call(connection, dict(op=op, game=self.game_id, **kwargs))
+
+    def test_play(self):
+        self.assertEqual(self.state['state'], 'replacing')
+        self.assertEqual(self.state['actions'], [{'op': 'replace'}])
+        self.assertNotIn('name', self.state['players'][1]['hand'][0])
+        watch = self.request(self.bob, 'watch', player=1)
+        self.assertEqual(watch['state']['players'][1]['hand'][0]['name'], 'River Crocolisk')
+        reply = self.request(self.alice, 'replace', player=0)
+        self.assertTrue(reply['ok'])
+        reply = self.request(self.bob, 'replace', player=1)
+        self.assertEqual(reply['diff']['state'], 'playing')
+        self.assertEqual(reply['diff']['turn'], 0)
+        update = self.alice.messages[-1]
+        self.assertEqual(update['event'], 'update')
+        self.assertEqual(update['diff']['state'], 'playing')
+        game = self.server.games[self.game_id].game
+        who = game.players.index(game.who)
+        reply = self.request(self.connections[who], 'end', player=who)
+        self.assertEqual(reply['diff']['who'], 1 - who)
+
+    def test_errors(self):
+        reply = self.request(self.alice, 'end', player=0)
+        self.assertEqual(reply['error'], 'StateException')
+        self.request(self.alice, 'replace', player=0)
+        self.request(self.bob, 'replace', player=1)
+        game = self.server.games[self.game_id].game
+        who = game.players.index(game.who)
+        card = game.who.hand[0]
+        reply = self.request(self.connections[who], 'play', player=who, card=card.dob)
+        self.assertEqual(reply['error'], 'PlayException')
+        hero = game.players[1 - who].hero.dob
+        reply = self.request(self.connections[who], 'attack', player=who, source=game.who.hero.dob, target=hero)
+        self.assertEqual(reply['error'], 'AttackException')
+        reply = self.request(self.connections[who], 'play', player=who, card=-1)
+        self.assertEqual(reply['error'], 'RequestError')
+        reply = self.call(self.alice, {'op': 'end', 'game': 42, 'player': 0})
+        self.assertEqual(reply['error'], 'RequestError')
+        reply = self.call(self.alice, {'op': 'fly'})
+        self.assertEqual(reply['error'], 'RequestError')
+        reply = self.call(self.alice, {'op': 'new', 'players': [{'hero': 'Nobody', 'deck': []}] * 2})
+        self.assertEqual(reply['error'], 'RequestError')
+
+    def test_invalid_objects(self):
+        game = self.server.games[self.game_id].game
+        alice, bob = game.players
+        before = dumps(game)
+        reply = self.request(self.alice, 'replace', player=0, cards=[alice.hand[0].dob, bob.hand[0].dob])
+        self.assertEqual(reply['error'], 'RequestError')
+        reply = self.request(self.alice, 'replace', player=0, cards=[alice.hand[0].dob] * 2)
+        self.assertEqual(reply['error'], 'RequestError')
+        self.assertEqual(dumps(game), before)
+        self.request(self.alice, 'replace', player=0)
+        self.request(self.bob, 'replace', player=1)
+        who = game.players.index(game.who)
+        player = game.who
+        player.mana = 10
+        before = dumps(game)
+        card = player.hand[0].dob
+        for kwargs in (dict(card=card, target=player.deck[0].dob),
+                       dict(card=card, target=player.opponent.hand[0].dob),
+                       dict(card=player.opponent.hand[0].dob),
+                       dict(card=card, position=1),
+                       dict(card=card, position='0')):
+            reply = self.request(self.connections[who], 'play', player=who, **kwargs)
+            self.assertEqual(reply['error'], 'RequestError', kwargs)
+        reply = self.request(self.connections[who], 'attack', player=who, source=player.opponent.hero.dob,
+                             target=player.hero.dob)
+        self.assertEqual(reply['error'], 'RequestError')
+        self.assertEqual(dumps(game), before)
+
+    def test_failure_leaves_no_trace(self):
+        self.request(self.alice, 'replace', player=0)
+        self.request(self.bob, 'replace', player=1)
+        game = self.server.games[self.game_id].game
+        who = game.players.index(game.who)
+        before = dumps(game)
+        # Checked at the end of the turn change, after all its changes
+        with mock.patch.object(Game, 'check', side_effect=RuntimeError('bug')), self.assertLogs(level='ERROR'):
+            reply = self.request(self.connections[who], 'end', player=who)
+        self.assertEqual(reply['error'], 'RuntimeError')
+        self.assertEqual(dumps(game), before)
+        self.assertIsNone(game.undo_log)
+        reply = self.request(self.connections[who], 'end', player=who)
+        self.assertEqual(reply['diff']['who'], 1 - who)
+
+    def test_seats(self):
+        carol = MockConnection()
+        reply = self.request(self.bob, 'replace', player=0)
+        self.assertEqual(reply['error'], 'RequestError')
+        reply = self.request(self.bob, 'state', player=0)
+        self.assertEqual(reply['error'], 'RequestError')
+        reply = self.request(carol, 'watch', player=1)
+        self.assertEqual(reply['error'], 'RequestError')
+        # Spectators see no hand
+        reply = self.request(carol, 'watch')
+        for player in reply['state']['players']:
+            self.assertNotIn('name', player['hand'][0])
+        reply = self.request(self.bob, 'state', player=1)
+        self.assertEqual(reply['state']['players'][1]['hand'][0]['name'], 'River Crocolisk')
+        # A seat is free once its holder disconnects
+        self.server.disconnect(self.bob)
+        self.assertTrue(self.request(carol, 'watch', player=1)['ok'])
+        self.assertTrue(self.request(carol, 'replace', player=1)['ok'])
+
+    def test_close(self):
+        reply = self.request(self.bob, 'close')
+        self.assertEqual(reply['error'], 'RequestError')
+        reply = self.request(self.alice, 'close')
+        self.assertTrue(reply['ok'])
+        self.assertNotIn(self.game_id, self.server.games)
+
+    def test_disconnect(self):
+        self.server.disconnect(self.bob)
+        self.assertIn(self.game_id, self.server.games)
+        self.server.disconnect(self.alice)
+        self.assertNotIn(self.game_id, self.server.games)
+
+    def test_slow_watcher(self):
+        self.bob.slow = True
+        self.request(self.alice, 'replace', player=0)
+        self.assertEqual(self.bob.messages, [])
+        self.assertNotIn(self.bob, self.server.games[self.game_id].watchers)
+        # Watching again catches up
+        self.bob.slow = False
+        reply = self.request(self.bob, 'watch', player=1)
+        self.assertTrue(reply['state']['players'][0]['hand'])
+        self.assertTrue(self.request(self.bob, 'replace', player=1)['ok'])
+
+    def new_server_agent(self):
+        reply = self.call(self.alice, {
+            'op': 'new',
+            'player': 0,
+            'players': [
+                {'name': 'Alice', 'hero': 'Mage', 'deck': ['BloodfenRaptor'] * 30},
+                {'name': 'Bot', 'agent': 'NaiveAgent', 'hero': 'Innkeeper', 'deck': ['RiverCrocolisk'] * 30},
+            ],
+        })
+        return reply['game']
+
+    def test_server_agent(self):
+        game_id = self.new_server_agent()
+        reply = self.call(self.alice, {'op': 'replace', 'game': game_id, 'player': 0})
+        self.assertEqual(reply['diff']['state'], 'playing')
+        game = self.server.games[game_id].game
+        self.assertIs(game.who, game.players[0])
+        reply = self.call(self.alice, {'op': 'end', 'game': game_id, 'player': 1})
+        self.assertEqual(reply['error'], 'RequestError')
+        reply = self.call(self.alice, {'op': 'concede', 'game': game_id, 'player': 0})
+        self.assertEqual(reply['diff']['state'], 'finished')
+        self.assertEqual(reply['diff']['winner'], 1)
+
+    def test_blocking_agent(self):
+        game_id = self.new_server_agent()
+        self.call(self.alice, {'op': 'replace', 'game': game_id, 'player': 0})
+        game = self.server.games[game_id].game
+        decide = NaiveAgent.decide
+        deciding = threading.Event()
+        go = threading.Event()
+        def blocking_decide(agent):
+            deciding.set()
+            go.wait(10)
+            return decide(agent)
+        async def run():
+            turn = asyncio.ensure_future(self.server.request(self.alice, {'op': 'end', 'game': game_id, 'player': 0}))
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, deciding.wait, 10)
+            # Other games are served while the agent decides
+            reply = await self.server.request(self.bob, {'op': 'state', 'game': self.game_id, 'player': 1})
+            go.set()
+            return reply, await turn
+        with mock.patch.object(NaiveAgent, 'decide', blocking_decide):
+            state_reply, reply = asyncio.run(run())
+        self.assertTrue(state_reply['ok'])
+        self.assertEqual(reply['diff']['turn'], 3)
+        self.assertIs(game.who, game.players[0])
+
+    def test_async_agent(self):
+        game_id = self.new_server_agent()
+        decide = NaiveAgent.decide
+        async def async_decide(agent):
+            await asyncio.sleep(0)
+            return decide(agent)
+        with mock.patch.object(NaiveAgent, 'decide', async_decide):
+            self.call(self.alice, {'op': 'replace', 'game': game_id, 'player': 0})
+            reply = self.call(self.alice, {'op': 'end', 'game': game_id, 'player': 0})
+        self.assertEqual(reply['diff']['turn'], 3)
+
+    def test_failed_agent(self):
+        game_id = self.new_server_agent()
+        # The agent plays first, once Alice has replaced
+        with mock.patch.object(NaiveAgent, 'decide', side_effect=RuntimeError('bug')), self.assertLogs(level='ERROR'):
+            reply = self.call(self.alice, {'op': 'replace', 'game': game_id, 'player': 0})
+        self.assertTrue(reply['ok'])
+        self.assertEqual(reply['diff']['state'], 'finished')
+        self.assertEqual(reply['diff']['winner'], 0)
+
+    def test_socket(self):
+        async def run():
+            server = Server(seed=1)
+            listener = await asyncio.start_server(
+                lambda reader, writer: handle(server, reader, writer), '127.0.0.1', 0)
+            port = listener.sockets[0].getsockname()[1]
+            reader, writer = await asyncio.open_connection('127.0.0.1', port)
+            writer.write(b'not json\n')
+            writer.write(json.dumps({'id': 7, 'op': 'new', 'players': [
+                {'name': 'Alice', 'hero': 'Mage', 'deck': ['Wisp'] * 5},
+                {'name': 'Bob', 'hero': 'Mage', 'deck': ['Wisp'] * 5},
+            ]}).encode() + b'\n')
+            await writer.drain()
+            replies = [json.loads(await reader.readline()) for num in range(2)]
+            writer.close()
+            listener.close()
+            await listener.wait_closed()
+            return replies
+        error, reply = asyncio.run(run())
+        self.assertEqual(error['error'], 'RequestError')
+        self.assertEqual(reply['id'], 7)
+        self.assertEqual(len(reply['state']['players'][0]['hand']), 3)
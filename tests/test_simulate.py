@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+
+import unittest
+
+from simplehs import *
+from simplehs.simulate import *
+
+
+class TestSimulate(unittest.TestCase):
+
+    def setUp(self):
+        self.specs = [
+            parse_spec('NaiveAgent:Mage:BloodfenRaptor*15,Fireball*10,ArcaneMissiles*5'),
+            parse_spec('NaiveAgent:Innkeeper:RiverCrocolisk*15,GoldshireFootman*15'),
+        ]
+
+    def test_parse_spec(self):
+        spec = self.specs[0]
+        self.assertEqual(spec.agent, 'NaiveAgent')
+        self.assertEqual(spec.hero, 'Mage')
+        self.assertEqual(len(spec.deck), 30)
+        self.assertEqual(spec.deck.count('Fireball'), 10)
+        with self.assertRaises(ValueError):
+            parse_spec('NaiveAgent:Mage')
+
+    def test_simulate(self):
+        report = simulate(self.specs, 20, seed=1, processes=1)
+        self.assertEqual(report.games, 20)
+        self.assertEqual(sum(report.wins) + report.ties, 20)
+        self.assertGreater(report.mean_turns, 0)
+
+    def test_reproducible(self):
+        report = simulate(self.specs, 20, seed=2, processes=1, shard_size=20)
+        report2 = simulate(self.specs, 20, seed=2, processes=1, shard_size=3)
+        self.assertEqual(report.wins, report2.wins)
+        self.assertEqual(report.mean_turns, report2.mean_turns)
@@ -35,3 +35,17 @@ class TestSpellDamage(unittest.TestCase):
         alice.acquire(Fireball)
         alice.play(alice.hand[-1], target=bob.hero)
         self.assertEqual(bob.hero.health, 23)
+
+    def test_spell_damage_destroyed(self):
+        game = self.game
+        alice = game.players[0]
+        bob = game.players[1]
+        alice.acquire(KoboldGeomancer)
+        alice.play(alice.hand[-1])
+        self.assertEqual(alice.spell_damage, 1)
+        alice.acquire(Fireball)
+        alice.play(alice.hand[-1], target=alice.battlefield[-1])
+        self.assertEqual(alice.spell_damage, 0)
+        alice.acquire(Fireball)
+        alice.play(alice.hand[-1], target=bob.hero)
+        self.assertEqual(bob.hero.health, 24)
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+
+import unittest
+
+from simplehs import *
+from simplehs.agents import NaiveAgent
+from simplehs.simulate import parse_spec
+from simplehs.simulate import simulate
+from simplehs.stats import Stats
+from simplehs.utils import Random
+
+
+class TestStats(unittest.TestCase):
+
+    def make_game(self, stats):
+        agents = (
+            NaiveAgent('Alice', hero='Mage', deck=['LeperGnome', 'Fireball'] * 15),
+            NaiveAgent('Bob', hero='Innkeeper', deck=['NoviceEngineer', 'ManaTideTotem'] * 15),
+        )
+        return Game(agents, rng=Random(5), log=False, stats=stats)
+
+    def test_game(self):
+        stats = Stats()
+        game = self.make_game(stats)
+        game.run()
+        self.assertEqual(stats.games, 1)
+        self.assertEqual(stats.turns, game.turn_num + 1)
+        phases = stats.to_dict().phases
+        for phase in ('decide', 'next_turn', 'trigger', 'check', 'play', 'attack',
+                      'battlecry', 'effect', 'deathrattle'):
+            self.assertIn(phase, phases)
+            self.assertGreater(phases[phase].count, 0)
+            self.assertLessEqual(phases[phase].own, phases[phase].total)
+        self.assertEqual(phases.next_turn.count, game.turn_num + 1)
+        self.assertLess(phases.next_turn.own, phases.next_turn.total)
+        self.assertIsNone(game.clone().stats)
+
+    def test_merge(self):
+        stats = Stats()
+        self.make_game(stats).run()
+        total = Stats().merge(stats).merge(stats)
+        self.assertEqual(total.games, 2)
+        self.assertEqual(total.phases['play'][0], 2 * stats.phases['play'][0])
+        self.assertIn('decide', str(total))
+
+    def test_simulate(self):
+        specs = [
+            parse_spec('NaiveAgent:Mage:BloodfenRaptor*15,Fireball*15'),
+            parse_spec('NaiveAgent:Innkeeper:RiverCrocolisk*30'),
+        ]
+        report = simulate(specs, 10, processes=1, shard_size=4, stats=True)
+        self.assertEqual(report.stats.games, 10)
+        self.assertNotIn('stats', simulate(specs, 2, processes=1))
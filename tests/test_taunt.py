@@ -41,3 +41,26 @@ class TestTaunt(unittest.TestCase):
         with self.assertRaises(AttackException):
             bob.attack(boar, alice.hero)
         bob.attack(boar, senjin)
+
+    def test_taunt_destroyed(self):
+        game = self.game
+        alice = game.players[0]
+        bob = game.players[1]
+        alice.acquire(GoldshireFootman)
+        alice.play(alice.hand[-1])
+        footman = alice.battlefield[-1]
+        self.assertTrue(alice.has_taunt)
+        alice.end()
+        bob.acquire(StonetuskBoar)
+        bob.play(bob.hand[-1])
+        bob.acquire(StonetuskBoar)
+        bob.play(bob.hand[-1])
+        boar, boar2 = bob.battlefield
+        bob.attack(boar, footman)
+        bob.attack(boar2, footman)
+        self.assertFalse(alice.has_taunt)
+        bob.end()
+        alice.end()
+        bob.acquire(StonetuskBoar)
+        bob.play(bob.hand[-1])
+        bob.attack(bob.battlefield[-1], alice.hero)
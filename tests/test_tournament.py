@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+
+import unittest
+
+from simplehs import *
+from simplehs.simulate import parse_spec
+from simplehs.tournament import *
+
+
+class TestTournament(unittest.TestCase):
+
+    def setUp(self):
+        self.entrants = [
+            parse_spec('NaiveAgent:Mage:BloodfenRaptor*15,Fireball*15'),
+            parse_spec('NaiveAgent:Innkeeper:RiverCrocolisk*30'),
+            parse_spec('NaiveAgent:Innkeeper:Wisp*30'),
+        ]
+
+    def test_wilson_interval(self):
+        low, high = wilson_interval(10, 10)
+        self.assertGreater(low, 0.5)
+        self.assertEqual(high, 1.0)
+        self.assertEqual(wilson_interval(0, 0), (0.0, 1.0))
+        low, high = wilson_interval(500, 1000)
+        self.assertLess(high - low, 0.07)
+
+    def test_pairings(self):
+        self.assertEqual(len(round_robin(4)), 6)
+        self.assertEqual(swiss([0, 30, 20, 10], set()), [(1, 2), (0, 3)])
+        self.assertEqual(swiss([0, 30, 20, 10], {(1, 2)}), [(1, 3), (0, 2)])
+
+    def test_rate(self):
+        matchups = [
+            Dict(players=(0, 1), games=100, scores=(75, 25)),
+            Dict(players=(1, 2), games=100, scores=(75, 25)),
+        ]
+        ratings = rate(3, matchups)
+        self.assertAlmostEqual(sum(rating.elo for rating in ratings), 0, places=6)
+        self.assertGreater(ratings[0].elo, ratings[1].elo)
+        self.assertGreater(ratings[1].elo, ratings[2].elo)
+        self.assertLess(ratings[0].low, ratings[0].elo)
+        self.assertGreater(ratings[0].high, ratings[0].elo)
+
+    def test_round_robin(self):
+        tournament = Tournament(self.entrants, seed=1, precision=0.2, min_games=10,
+                                max_games=60, batch_size=10, processes=1)
+        tournament.round_robin()
+        report = tournament.report()
+        self.assertEqual(len(report.matchups), 3)
+        for matchup in report.matchups:
+            self.assertTrue(matchup.done)
+            self.assertGreaterEqual(matchup.games, 10)
+            self.assertLessEqual(matchup.games, 60)
+        self.assertEqual(report.games, sum(matchup.games for matchup in report.matchups))
+        self.assertLess(report.games, 3 * 60)
+        self.assertGreater(report.ratings[1].elo, report.ratings[2].elo)
+        # The results depend on the seed only
+        tournament2 = Tournament(self.entrants, seed=1, precision=0.2, min_games=10,
+                                 max_games=60, batch_size=10, processes=2)
+        tournament2.round_robin()
+        self.assertEqual([matchup.wins for matchup in tournament2.report().matchups],
+                         [matchup.wins for matchup in report.matchups])
+
+    def test_swiss(self):
+        tournament = Tournament(self.entrants, seed=1, min_games=10, max_games=20,
+                                batch_size=10, processes=1)
+        tournament.swiss(2)
+        self.assertEqual(len(tournament.matchups), 2)
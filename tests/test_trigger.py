@@ -41,3 +41,39 @@ class TestTrigger(unittest.TestCase):
         totem.destroy()
         alice.end()
         self.assertEqual(alice.hand.size, 1)
+
+    def test_listeners(self):
+        game = self.game
+        alice = game.players[0]
+        alice.acquire(ManaTideTotem)
+        alice.play(alice.hand[-1])
+        totem = alice.battlefield[-1]
+        self.assertEqual(game._listeners['at turn_end'], [totem])
+        self.assertNotIn('at turn_start', game._listeners)
+        clone = game.clone()
+        self.assertEqual(clone._listeners['at turn_end'], [clone.players[0].battlefield[-1]])
+        totem.destroy()
+        self.assertEqual(game._listeners['at turn_end'], [])
+        self.assertEqual(len(clone._listeners['at turn_end']), 1)
+
+    def test_order(self):
+        game = self.game
+        alice = game.players[0]
+        bob = game.players[1]
+        # Triggers resolve in the order of characters, not of summoning
+        for player, position in ((bob, 0), (alice, 0), (alice, 0), (bob, 1), (alice, 1)):
+            if game.who is not player:
+                game.who.end()
+            player.acquire(ManaTideTotem)
+            player.mana = 10
+            player.play(player.hand[-1], position=position)
+        if game.who is not alice:
+            game.who.end()
+        listeners = game.characters[1:4] + game.characters[5:]
+        self.assertEqual(game._listeners['at turn_end'], listeners)
+        alice.acquire(ManaTideTotem)
+        alice.mana = 10
+        mark = game.make(Dict(name='play', card=alice.hand[-1], position=1), alice)
+        self.assertIs(game._listeners['at turn_end'][1], alice.battlefield[1])
+        game.unmake(mark)
+        self.assertEqual(game._listeners['at turn_end'], listeners)
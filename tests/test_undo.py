@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+
+import unittest
+
+from simplehs import *
+from simplehs.agents import NaiveAgent
+from simplehs.heroes import *
+from simplehs.cards import *
+from simplehs.serialize import dumps
+from simplehs.utils import Random
+
+
+class TestUndo(unittest.TestCase):
+
+    def setUp(self):
+        alice_agent = Dict(
+            name='Alice',
+            hero=Mage,
+            deck=[LootHoarder] * 5,
+        )
+        bob_agent = Dict(
+            name='Bob',
+            hero=Innkeeper,
+            deck=[],
+        )
+        agents = (alice_agent, bob_agent)
+        self.game = Game(agents, debug=True, log=False)
+
+    def test_make_unmake(self):
+        game = self.game
+        alice = game.players[0]
+        bob = game.players[1]
+        alice.acquire(LootHoarder)
+        bob.acquire(ManaTideTotem)
+        game.next_turn()
+        bob.play(bob.hand[-1])
+        game.next_turn()
+        alice.acquire(Fireball)
+        before = dumps(game)
+        mark = game.make(Dict(name='play', card=alice.hand[-1], target=bob.battlefield[0]))
+        self.assertEqual(bob.battlefield.size, 0)
+        game.make(Dict(name='play', card=alice.hand[-1], position=0))
+        game.make(Dict(name='end'))
+        self.assertEqual(game.who, bob)
+        game.unmake(mark)
+        self.assertEqual(dumps(game), before)
+        self.assertEqual(bob.battlefield[0].name, 'Mana Tide Totem')
+        self.assertEqual(game._listeners['at turn_end'], [bob.battlefield[0]])
+
+    def test_invalid_action(self):
+        game = self.game
+        alice = game.players[0]
+        alice.acquire(LootHoarder)
+        before = dumps(game)
+        with self.assertRaises(AttackException):
+            game.make(Dict(name='attack', source=alice.hero, target=game.players[1].hero))
+        self.assertEqual(dumps(game), before)
+
+    def test_search(self):
+        # Every action and a few random ones after it are unmade exactly.
+        rng = Random(1)
+        for seed in range(3):
+            agents = (
+                NaiveAgent('Alice', hero='Mage', deck=['LeperGnome', 'ArcaneMissiles', 'ManaTideTotem'] * 10),
+                NaiveAgent('Bob', hero='Innkeeper', deck=['ArgentSquire', 'LootHoarder', 'WorgenInfiltrator'] * 10),
+            )
+            game = Game(agents, rng=Random(seed), log=False)
+            start = dumps(game)
+            for player in (game.who, game.who.opponent):
+                game.make(Dict(name='replace'), player)
+            while game.state == Game.PLAYING:
+                actions = game.who.legal_actions()
+                before = dumps(game)
+                for action in actions:
+                    mark = game.make(action)
+                    for depth in range(3):
+                        if game.state != Game.PLAYING:
+                            break
+                        game.make(rng.choice(game.who.legal_actions()))
+                    game.unmake(mark)
+                    self.assertEqual(dumps(game), before)
+                game.make(rng.choice(actions))
+            game.unmake()
+            self.assertEqual(dumps(game), start)
+        self.assertIsNone(game.clone().undo_log)